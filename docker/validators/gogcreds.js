@@ -0,0 +1,46 @@
+#!/usr/bin/env node
+// Inspect gog's credentials.json and print a single-line JSON report.
+//
+// Usage: node gogcreds.js [--json] [path]
+//
+// Used by `clawctl gog test`. gog stores credentials in the flattened
+// format (client_id/client_secret at top level) even though the entrypoint
+// writes the "installed" wrapper format, so both are accepted.
+'use strict';
+
+const fs = require('fs');
+
+const CLIENT_ID_PATTERN = /^[0-9-]+\.apps\.googleusercontent\.com$/;
+
+const args = process.argv.slice(2).filter((arg) => !arg.startsWith('--'));
+const path = args[0] || `${process.env.HOME || '/home/node'}/.config/gogcli/credentials.json`;
+
+const report = { path, exists: fs.existsSync(path), error: null };
+
+if (report.exists) {
+  try {
+    const creds = JSON.parse(fs.readFileSync(path, 'utf8'));
+    const installed = creds.installed || null;
+    const clientId = creds.client_id || (installed && installed.client_id) || '';
+    const clientSecret = creds.client_secret || (installed && installed.client_secret) || '';
+    Object.assign(report, {
+      format: creds.client_id ? 'flattened' : 'installed wrapper',
+      keys: Object.keys(creds),
+      flat_client_id: !!creds.client_id,
+      installed_client_id: !!(installed && installed.client_id),
+      flat_client_secret: !!creds.client_secret,
+      installed_client_secret: !!(installed && installed.client_secret),
+      client_id_prefix: clientId.substring(0, 30),
+      client_id_length: clientId.length,
+      client_id_format_valid: CLIENT_ID_PATTERN.test(clientId),
+      client_secret_length: clientSecret.length,
+      // auth_uri and token_uri are only in the installed wrapper format
+      has_auth_uri: installed ? !!installed.auth_uri : null,
+      has_token_uri: installed ? !!installed.token_uri : null,
+    });
+  } catch (e) {
+    report.error = e.message;
+  }
+}
+
+process.stdout.write(`${JSON.stringify(report)}\n`);
@@ -0,0 +1,25 @@
+"""clawctl entry point.
+
+``clawctl --version`` is answered here, before Typer and the command
+tables in :mod:`clawctl.cli` are imported.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from clawctl import __version__
+
+
+def main() -> None:
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        print(f"clawctl {__version__}")
+        return
+
+    from clawctl.cli import app
+
+    app(prog_name="clawctl")
+
+
+if __name__ == "__main__":
+    main()
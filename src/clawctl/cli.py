@@ -2,14 +2,73 @@
 
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional
 
+import click
 import typer
+from typer.core import TyperGroup
+from typer.main import get_command_from_info
+from typer.models import CommandInfo
 
 from clawctl import __version__
 
-app = typer.Typer(
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup whose commands are imported only when they are looked up.
+
+    Command modules pull in the Docker SDK, GitPython, Rich and the config
+    models, so importing all of them up front makes ``clawctl --help`` pay
+    for every command.  Commands are registered as ``"module:function"``
+    references and resolved the first time Click asks for them.  Group help
+    lists them from their registered short help, so ``--help`` resolves
+    nothing.
+    """
+
+    lazy_commands: dict[str, str] = {}
+    lazy_help: dict[str, str] = {}
+    _listing_help: bool = False
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        eager = [n for n in super().list_commands(ctx) if n not in self.lazy_commands]
+        return [*self.lazy_commands, *eager]
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        self._listing_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            if self._listing_help:
+                # The commands panel only needs a name and short help.
+                return click.Command(cmd_name, short_help=self.lazy_help[cmd_name])
+            module_name, _, attr = self.lazy_commands[cmd_name].partition(":")
+            callback = getattr(importlib.import_module(module_name), attr)
+            self.commands[cmd_name] = get_command_from_info(
+                CommandInfo(name=cmd_name, callback=callback),
+                pretty_exceptions_short=True,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+        return super().get_command(ctx, cmd_name)
+
+
+def lazy_typer(**kwargs: Any) -> typer.Typer:
+    """Create a Typer app that accepts lazily-imported commands."""
+    cls = type("LazyTyperGroup", (LazyTyperGroup,), {"lazy_commands": {}, "lazy_help": {}})
+    return typer.Typer(cls=cls, **kwargs)
+
+
+def lazy_command(target: typer.Typer, name: str, ref: str, short_help: str) -> None:
+    """Register ``ref`` (``"package.module:function"``) as command ``name``."""
+    target.info.cls.lazy_commands[name] = ref
+    target.info.cls.lazy_help[name] = short_help
+
+
+app = lazy_typer(
     name="clawctl",
     help=(
         "OpenClaw deployment manager — provision and manage isolated OpenClaw instances.\n\n"
@@ -25,18 +84,18 @@ app = typer.Typer(
 )
 
 # Sub-command groups
-user_app = typer.Typer(help="Add, remove, and list users and their Discord/Slack integrations.", no_args_is_help=True)
-backup_app = typer.Typer(help="Run on-demand backups and manage the periodic backup daemon.", no_args_is_help=True)
-backup_schedule_app = typer.Typer(help="Start, stop, and check the periodic backup daemon.", no_args_is_help=True)
-maintenance_app = typer.Typer(help="Run or schedule nightly maintenance (backup all users, then restart containers).", no_args_is_help=True)
-maintenance_schedule_app = typer.Typer(help="Start, stop, and check the nightly maintenance daemon.", no_args_is_help=True)
-shared_collections_app = typer.Typer(help="Sync and list shared document collections (S3 or local).", no_args_is_help=True)
-shared_collections_schedule_app = typer.Typer(help="Start, stop, and check the periodic sync daemon.", no_args_is_help=True)
-files_app = typer.Typer(help="Push, list, and manage per-user files exposed at /mnt/files inside containers.", no_args_is_help=True)
-config_app = typer.Typer(help="Validate clawctl.toml and regenerate per-user openclaw.json configs.", no_args_is_help=True)
-gog_app = typer.Typer(help="Set up and test Google Workspace (gog) OAuth integration for users.", no_args_is_help=True)
-web_app = typer.Typer(help="Start the web management UI and manage its admin password.", no_args_is_help=True)
-server_app = typer.Typer(
+user_app = lazy_typer(help="Add, remove, and list users and their Discord/Slack integrations.", no_args_is_help=True)
+backup_app = lazy_typer(help="Run on-demand backups and manage the periodic backup daemon.", no_args_is_help=True)
+backup_schedule_app = lazy_typer(help="Start, stop, and check the periodic backup daemon.", no_args_is_help=True)
+maintenance_app = lazy_typer(help="Run or schedule nightly maintenance (backup all users, then restart containers).", no_args_is_help=True)
+maintenance_schedule_app = lazy_typer(help="Start, stop, and check the nightly maintenance daemon.", no_args_is_help=True)
+shared_collections_app = lazy_typer(help="Sync and list shared document collections (S3 or local).", no_args_is_help=True)
+shared_collections_schedule_app = lazy_typer(help="Start, stop, and check the periodic sync daemon.", no_args_is_help=True)
+files_app = lazy_typer(help="Push, list, and manage per-user files exposed at /mnt/files inside containers.", no_args_is_help=True)
+config_app = lazy_typer(help="Validate clawctl.toml and regenerate per-user openclaw.json configs.", no_args_is_help=True)
+gog_app = lazy_typer(help="Set up and test Google Workspace (gog) OAuth integration for users.", no_args_is_help=True)
+web_app = lazy_typer(help="Start the web management UI and manage its admin password.", no_args_is_help=True)
+server_app = lazy_typer(
     help=(
         "Full lifecycle management of the remote deployment server.\n\n"
         "Workflow: requirements → provision → deploy --initial → setup --initial\n\n"
@@ -44,7 +103,7 @@ server_app = typer.Typer(
     ),
     no_args_is_help=True,
 )
-instance_app = typer.Typer(
+instance_app = lazy_typer(
     help=(
         "Manage Docker container instances (server-side).\n\n"
         "These commands run on the server where Docker is installed.\n"
@@ -90,99 +149,132 @@ def main(
     """OpenClaw deployment manager."""
 
 
-# Import and register commands
-from clawctl.commands.init import init  # noqa: E402
-from clawctl.commands.user import user_add, user_list, user_remove, user_set_slack, user_set_discord  # noqa: E402
-from clawctl.commands.lifecycle import start, stop, restart, start_all, stop_all  # noqa: E402
-from clawctl.commands.status import status  # noqa: E402
-from clawctl.commands.logs import logs  # noqa: E402
-from clawctl.commands.backup import backup_run, schedule_start, schedule_stop, schedule_status  # noqa: E402
-from clawctl.commands.shared_collections import (  # noqa: E402
-    list_collections,
-    schedule_start as sc_schedule_start,
-    schedule_status as sc_schedule_status,
-    schedule_stop as sc_schedule_stop,
-    sync,
+# Command table: (parent app, command name, "module:function", short help)
+_COMMANDS: tuple[tuple[typer.Typer, str, str, str], ...] = (
+    # Top-level commands
+    (app, "init", "clawctl.commands.init:init",
+     "Initialize a new clawctl deployment in the current directory."),
+    (app, "status", "clawctl.commands.host:host_status",
+     "Show the current state of the remote host."),
+    (app, "clean", "clawctl.commands.clean:clean",
+     "Remove containers, networks, and build artifacts."),
+    (app, "webhelp", "clawctl.commands.webhelp:webhelp",
+     "Browse project documentation in your browser."),
+
+    # Instance commands (container lifecycle — runs on the server)
+    (instance_app, "start", "clawctl.commands.lifecycle:start",
+     "Start a user's OpenClaw container."),
+    (instance_app, "stop", "clawctl.commands.lifecycle:stop",
+     "Stop a user's OpenClaw container (graceful 30s timeout)."),
+    (instance_app, "restart", "clawctl.commands.lifecycle:restart",
+     "Restart a user's container (regenerates openclaw.json and runs doctor --fix)."),
+    (instance_app, "start-all", "clawctl.commands.lifecycle:start_all",
+     "Start all user containers."),
+    (instance_app, "stop-all", "clawctl.commands.lifecycle:stop_all",
+     "Stop all user containers."),
+    (instance_app, "status", "clawctl.commands.status:status",
+     "Show the status of all user containers."),
+    (instance_app, "logs", "clawctl.commands.logs:logs",
+     "View logs from a user's container."),
+    (instance_app, "update", "clawctl.commands.update:update",
+     "Rebuild the Docker image and recreate all containers."),
+
+    # Web commands
+    (web_app, "start", "clawctl.commands.web:web_start",
+     "Start the web management interface (dashboard for instances, models, Discord pairing)."),
+    (web_app, "set-password", "clawctl.commands.web:web_set_password",
+     "Set or change the web admin password (stored as bcrypt hash in data/secrets/)."),
+
+    # User commands
+    (user_app, "add", "clawctl.commands.user:user_add",
+     "Provision a new user: create directories, write secrets, start container."),
+    (user_app, "remove", "clawctl.commands.user:user_remove",
+     "Remove a user's container and network."),
+    (user_app, "list", "clawctl.commands.user:user_list",
+     "List all configured users and their container status."),
+    (user_app, "set-slack", "clawctl.commands.user:user_set_slack",
+     "Set Slack tokens for a user."),
+    (user_app, "set-discord", "clawctl.commands.user:user_set_discord",
+     "Set Discord token for a user."),
+
+    # Backup commands
+    (backup_app, "run", "clawctl.commands.backup:backup_run",
+     "Run an immediate backup of all users."),
+    (backup_schedule_app, "start", "clawctl.commands.backup:schedule_start",
+     "Start the periodic backup daemon."),
+    (backup_schedule_app, "stop", "clawctl.commands.backup:schedule_stop",
+     "Stop the periodic backup daemon."),
+    (backup_schedule_app, "status", "clawctl.commands.backup:schedule_status",
+     "Check if the backup daemon is running."),
+
+    # Maintenance commands
+    (maintenance_app, "run", "clawctl.commands.maintenance:maintenance_run",
+     "Run an immediate maintenance cycle (backup all users, then restart all containers)."),
+    (maintenance_schedule_app, "start", "clawctl.commands.maintenance:schedule_start",
+     "Start the nightly maintenance daemon."),
+    (maintenance_schedule_app, "stop", "clawctl.commands.maintenance:schedule_stop",
+     "Stop the nightly maintenance daemon."),
+    (maintenance_schedule_app, "status", "clawctl.commands.maintenance:schedule_status",
+     "Check maintenance daemon status and show next/last run times."),
+
+    # Shared collections commands
+    (shared_collections_app, "sync", "clawctl.commands.shared_collections:sync",
+     "Sync shared document collections from S3 or local source to all user containers."),
+    (shared_collections_app, "list", "clawctl.commands.shared_collections:list_collections",
+     "List configured shared collections and their status."),
+    (shared_collections_schedule_app, "start", "clawctl.commands.shared_collections:schedule_start",
+     "Start the periodic sync daemon."),
+    (shared_collections_schedule_app, "stop", "clawctl.commands.shared_collections:schedule_stop",
+     "Stop the periodic sync daemon."),
+    (shared_collections_schedule_app, "status", "clawctl.commands.shared_collections:schedule_status",
+     "Check if the sync daemon is running."),
+
+    # Files commands
+    (files_app, "push", "clawctl.commands.files:files_push",
+     "Push a file or directory to a user's instance."),
+    (files_app, "list", "clawctl.commands.files:files_list",
+     "List files pushed to a user's instance."),
+    (files_app, "remove", "clawctl.commands.files:files_remove",
+     "Remove a single pushed file from a user's instance."),
+    (files_app, "remove-all", "clawctl.commands.files:files_remove_all",
+     "Remove all pushed files for a user."),
+    (files_app, "verify", "clawctl.commands.files:files_verify",
+     "Verify integrity of pushed files against their manifest checksums."),
+    (files_app, "guide", "clawctl.commands.files:files_guide",
+     "Show a quick-reference guide for managing server files."),
+
+    # Config commands
+    (config_app, "validate", "clawctl.commands.config_cmd:validate",
+     "Validate clawctl.toml and list configured users."),
+    (config_app, "regenerate", "clawctl.commands.config_cmd:regenerate",
+     "Regenerate openclaw.json for a user from current clawctl.toml configuration."),
+
+    # Gog commands
+    (gog_app, "setup", "clawctl.commands.gog:gog_setup",
+     "Complete gog OAuth authorization for a user's Google account."),
+    (gog_app, "test", "clawctl.commands.gog:gog_test",
+     "Test gog credentials configuration for a user."),
+
+    # Server commands (remote deployment lifecycle)
+    (server_app, "status", "clawctl.commands.host:host_status",
+     "Show the current state of the remote host."),
+    (server_app, "setup", "clawctl.commands.host:host_setup",
+     "Run setup on the remote host (idempotent). Installs deps, builds Docker, provisions users, starts web."),
+    (server_app, "deploy", "clawctl.commands.host:host_deploy",
+     "Rsync code and secrets to the remote host, then reinstall clawctl."),
+    (server_app, "teardown", "clawctl.commands.host:host_teardown",
+     "Stop and remove all containers on the remote host."),
+    (server_app, "requirements", "clawctl.commands.host:host_requirements",
+     "Verify all secrets and config needed for deployment exist locally."),
+    (server_app, "provision", "clawctl.commands.host:host_provision",
+     "Provision a Lightsail instance (idempotent). Creates instance, static IP, firewall rules."),
+    (server_app, "destroy", "clawctl.commands.host:host_destroy",
+     "Destroy the Lightsail instance and release the static IP."),
+    (server_app, "url", "clawctl.commands.host:host_url",
+     "Print the web management interface URL and credentials."),
+    (server_app, "bootstrap", "clawctl.commands.host:host_bootstrap",
+     "Full one-shot setup: provision → deploy → setup → deploy → ready."),
 )
-from clawctl.commands.maintenance import maintenance_run, schedule_start as maintenance_schedule_start, schedule_stop as maintenance_schedule_stop, schedule_status as maintenance_schedule_status  # noqa: E402
-from clawctl.commands.files import files_push, files_list, files_remove, files_remove_all, files_verify, files_guide  # noqa: E402
-from clawctl.commands.config_cmd import validate, regenerate  # noqa: E402
-from clawctl.commands.update import update  # noqa: E402
-from clawctl.commands.clean import clean  # noqa: E402
-from clawctl.commands.gog import gog_setup, gog_test  # noqa: E402
-from clawctl.commands.web import web_start, web_set_password  # noqa: E402
-from clawctl.commands.host import host_status, host_setup, host_deploy, host_teardown, host_requirements, host_provision, host_destroy, host_url, host_bootstrap  # noqa: E402
-from clawctl.commands.webhelp import webhelp  # noqa: E402
-
-# Top-level commands
-app.command()(init)
-app.command(name="status")(host_status)
-app.command()(clean)
-app.command()(webhelp)
-
-# Instance commands (container lifecycle — runs on the server)
-instance_app.command(name="start")(start)
-instance_app.command(name="stop")(stop)
-instance_app.command(name="restart")(restart)
-instance_app.command(name="start-all")(start_all)
-instance_app.command(name="stop-all")(stop_all)
-instance_app.command(name="status")(status)
-instance_app.command(name="logs")(logs)
-instance_app.command(name="update")(update)
-
-# Web commands
-web_app.command(name="start")(web_start)
-web_app.command(name="set-password")(web_set_password)
-
-# User commands
-user_app.command(name="add")(user_add)
-user_app.command(name="remove")(user_remove)
-user_app.command(name="list")(user_list)
-user_app.command(name="set-slack")(user_set_slack)
-user_app.command(name="set-discord")(user_set_discord)
-
-# Backup commands
-backup_app.command(name="run")(backup_run)
-backup_schedule_app.command(name="start")(schedule_start)
-backup_schedule_app.command(name="stop")(schedule_stop)
-backup_schedule_app.command(name="status")(schedule_status)
-
-# Maintenance commands
-maintenance_app.command(name="run")(maintenance_run)
-maintenance_schedule_app.command(name="start")(maintenance_schedule_start)
-maintenance_schedule_app.command(name="stop")(maintenance_schedule_stop)
-maintenance_schedule_app.command(name="status")(maintenance_schedule_status)
-
-# Shared collections commands
-shared_collections_app.command(name="sync")(sync)
-shared_collections_app.command(name="list")(list_collections)
-shared_collections_schedule_app.command(name="start")(sc_schedule_start)
-shared_collections_schedule_app.command(name="stop")(sc_schedule_stop)
-shared_collections_schedule_app.command(name="status")(sc_schedule_status)
-
-# Files commands
-files_app.command(name="push")(files_push)
-files_app.command(name="list")(files_list)
-files_app.command(name="remove")(files_remove)
-files_app.command(name="remove-all")(files_remove_all)
-files_app.command(name="verify")(files_verify)
-files_app.command(name="guide")(files_guide)
-
-# Config commands
-config_app.command(name="validate")(validate)
-config_app.command(name="regenerate")(regenerate)
-
-# Gog commands
-gog_app.command(name="setup")(gog_setup)
-gog_app.command(name="test")(gog_test)
-
-# Server commands (remote deployment lifecycle)
-server_app.command(name="status")(host_status)
-server_app.command(name="setup")(host_setup)
-server_app.command(name="deploy")(host_deploy)
-server_app.command(name="teardown")(host_teardown)
-server_app.command(name="requirements")(host_requirements)
-server_app.command(name="provision")(host_provision)
-server_app.command(name="destroy")(host_destroy)
-server_app.command(name="url")(host_url)
-server_app.command(name="bootstrap")(host_bootstrap)
+
+for _target, _name, _ref, _help in _COMMANDS:
+    lazy_command(_target, _name, _ref, _help)
@@ -6,12 +6,8 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from clawlib.core.backup_manager import BackupManager
-from clawlib.core.config import find_config_path, load_config_or_exit
-
-console = Console()
+from clawctl.utils.console import get_console, get_err_console, spinner
 
 
 def backup_run(
@@ -21,10 +17,14 @@ def backup_run(
     ] = None,
 ) -> None:
     """Run an immediate backup of all users."""
+    from clawlib.core.backup_manager import BackupManager
+    from clawlib.core.config import load_config_or_exit
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     manager = BackupManager(cfg)
 
-    with console.status("Running backup..."):
+    with spinner(console, "Running backup..."):
         results = manager.backup_all()
 
     for username, committed in results.items():
@@ -41,8 +41,11 @@ def schedule_start(
     ] = None,
 ) -> None:
     """Start the periodic backup daemon."""
-    config_path = find_config_path(config)
-    cfg = load_config_or_exit(config)
+    from clawlib.core.backup_manager import BackupManager
+    from clawlib.core.config import load_config_or_exit_with_path
+
+    console = get_console()
+    config_path, cfg = load_config_or_exit_with_path(config)
     manager = BackupManager(cfg)
 
     if manager.is_daemon_running():
@@ -63,6 +66,10 @@ def schedule_stop(
     ] = None,
 ) -> None:
     """Stop the periodic backup daemon."""
+    from clawlib.core.backup_manager import BackupManager
+    from clawlib.core.config import load_config_or_exit
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     manager = BackupManager(cfg)
 
@@ -79,11 +86,23 @@ def schedule_status(
     ] = None,
 ) -> None:
     """Check if the backup daemon is running."""
-    cfg = load_config_or_exit(config)
-    manager = BackupManager(cfg)
+    from clawlib.core.config import find_config_path, load_config_or_exit, load_paths
+    from clawlib.core.daemon import running_pid
 
-    if manager.is_daemon_running():
-        pid = int(manager.paths.backup_pid_file.read_text().strip())
+    console = get_console()
+
+    # Only the PID file location is needed, so skip full config validation.
+    config_path = find_config_path(config)
+    if config_path is None:
+        load_config_or_exit(config)  # reports the missing file and exits
+    try:
+        paths = load_paths(config_path)
+    except ValueError as e:
+        get_err_console().print(f"[red]Config error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    pid = running_pid(paths.backup_pid_file)
+    if pid is not None:
         console.print(f"[green]Backup daemon is running[/green] (PID {pid})")
     else:
         console.print("[dim]Backup daemon is not running.[/dim]")
@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from clawlib.core.config import find_config_path, load_config_or_exit
-from clawlib.core.docker_manager import DockerManager
+from clawctl.utils.console import get_console
 
-console = Console()
+# Upper bound on concurrent Docker API calls during teardown
+_MAX_WORKERS = 8
+
+
+def _remove_dir(path: Path) -> bool:
+    """Delete a directory tree, returning False if there was nothing to delete.
+
+    ``shutil.rmtree`` already walks with ``os.scandir`` and fd-relative
+    unlinks on Linux, so no up-front ``is_dir()`` stat is done here.
+    """
+    try:
+        shutil.rmtree(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
 
 
 def clean(
@@ -35,16 +48,18 @@ def clean(
     networks, clawctl.toml).  Pass --all to also delete the persistent data/
     directory (user secrets, workspaces, backups).
     """
-    cfg = load_config_or_exit(config)
-    resolved_config = find_config_path(config)
-    config_name = resolved_config.name if resolved_config else "clawctl.toml"
+    from clawlib.core.config import load_config_or_exit_with_path
+    from clawlib.core.docker_manager import DockerManager
+
+    console = get_console()
+    config_file, cfg = load_config_or_exit_with_path(config)
 
     if not yes:
         console.print("[bold red]This will:[/bold red]")
         console.print("  • Stop and remove all OpenClaw containers")
         console.print("  • Remove all Docker networks")
         console.print(f"  • Delete build directory ({cfg.clawctl.build_root})")
-        console.print(f"  • Delete {config_name}")
+        console.print(f"  • Delete {config_file.name}")
         if all_data:
             console.print(
                 f"  • [bold red]Delete ALL user data[/bold red] ({cfg.clawctl.data_root}) "
@@ -56,35 +71,42 @@ def clean(
 
     docker = DockerManager(cfg)
 
-    # 1. Remove all user containers and networks
-    removed = []
-    for user in cfg.users:
-        if docker.container_exists(user.name):
-            docker.remove_container(user.name)
-        docker.remove_network(user.name)
-        removed.append(user.name)
+    # Look up what exists with one call each instead of probing per user
+    containers = docker.existing_containers()
+    networks = docker.existing_networks()
+
+    def teardown(username: str) -> None:
+        if username in containers:
+            docker.remove_container(username)
+        if username in networks:
+            docker.remove_network(username)
 
+    # 1. Remove all user containers and networks. Each user is independent
+    # and the calls mostly wait on Docker, so run them concurrently.
+    existing = containers | networks
+    removed = [user.name for user in cfg.users if user.name in existing]
     if removed:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(removed))) as pool:
+            # list() drains the iterator so worker exceptions propagate here
+            list(pool.map(teardown, removed))
         console.print(
             f"[yellow]Removed containers/networks:[/yellow] {', '.join(removed)}"
         )
 
-    # 2. Remove build directory (disposable infrastructure)
+    # 2. Remove build directory (disposable infrastructure, not mounted into
+    # containers) only once teardown has succeeded
     build_root = cfg.clawctl.build_root
-    if build_root.is_dir():
-        shutil.rmtree(build_root)
+    if _remove_dir(build_root):
         console.print(f"[yellow]Removed[/yellow] {build_root}")
 
     # 3. Optionally remove data directory (persistent user state)
     if all_data:
         data_root = cfg.clawctl.data_root
-        if data_root.is_dir():
-            shutil.rmtree(data_root)
+        if _remove_dir(data_root):
             console.print(f"[red]Removed[/red] {data_root}")
 
     # 4. Remove config file
-    config_file = find_config_path(config)
-    if config_file and config_file.is_file():
+    if config_file.is_file():
         config_file.unlink()
         console.print(f"[yellow]Removed[/yellow] {config_file.name}")
 
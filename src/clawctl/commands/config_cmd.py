@@ -6,15 +6,8 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from clawlib.core.config import find_config_path, load_config
-from clawlib.core.openclaw_config import write_openclaw_config
-from clawlib.core.paths import Paths
-from clawlib.core.secrets import SecretsManager
-from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME
-
-console = Console()
+from clawctl.utils.console import get_console
 
 
 def validate(
@@ -24,6 +17,9 @@ def validate(
     ] = None,
 ) -> None:
     """Validate clawctl.toml and list configured users."""
+    from clawlib.core.config import find_config_path, load_config_cached
+
+    console = get_console()
     path = find_config_path(config)
 
     if path is None:
@@ -33,7 +29,8 @@ def validate(
     console.print(f"Validating [bold]{path}[/bold]...")
 
     try:
-        cfg = load_config(path)
+        # A cache hit means this exact file already passed validation
+        cfg = load_config_cached(path)
     except (ValueError, FileNotFoundError) as e:
         console.print(f"[red]Validation failed:[/red] {e}")
         raise typer.Exit(1) from None
@@ -42,13 +39,12 @@ def validate(
     console.print(f"  Data root: {cfg.clawctl.data_root}")
     console.print(f"  OpenClaw version: {cfg.clawctl.openclaw_version}")
     console.print(f"  Users: {len(cfg.users)}")
+    lines = []
     for user in cfg.users:
-        channels = []
-        if user.channels.slack.enabled:
-            channels.append("slack")
-        if user.channels.discord.enabled:
-            channels.append("discord")
-        console.print(f"    - {user.name} ({', '.join(channels) or 'no channels'})")
+        enabled = ", ".join(user.channels.enabled_names())
+        lines.append(f"    - {user.name} ({enabled or 'no channels'})")
+    if lines:
+        console.print("\n".join(lines))
 
 
 def regenerate(
@@ -64,7 +60,12 @@ def regenerate(
     The container will need to be restarted to pick up the new configuration.
     """
     from clawlib.core.config import load_config_or_exit
-    
+    from clawlib.core.openclaw_config import write_openclaw_config
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+    from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     user = cfg.get_user(name)
     
@@ -75,7 +76,7 @@ def regenerate(
         )
         raise typer.Exit(1)
     
-    paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
+    paths = get_paths(cfg)
     secrets_mgr = SecretsManager(paths)
     
     # Read gateway token (must exist)
@@ -11,14 +11,14 @@ from rich.table import Table
 
 from clawlib.core.config import load_config_or_exit
 from clawlib.core.file_manager import FileManager
-from clawlib.core.paths import Paths
+from clawlib.core.paths import get_paths
 
 console = Console()
 
 
 def _get_file_manager(config_path: Path | None) -> FileManager:
     cfg = load_config_or_exit(config_path)
-    paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
+    paths = get_paths(cfg)
     return FileManager(paths)
 
 
@@ -2,42 +2,108 @@
 
 from __future__ import annotations
 
+import json
+import re
+import shlex
+import time
+from contextlib import closing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Iterator, Optional
 
-import docker
-import docker.errors
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
-from clawlib.core.config import load_config_or_exit
-from clawlib.core.docker_manager import CONTAINER_PREFIX
+from clawctl.utils.console import get_console
 
-console = Console()
+if TYPE_CHECKING:
+    import docker
+    from docker.models.containers import Container
 
 CONTAINER_EXEC_TIMEOUT = 30  # seconds for non-interactive exec calls
 
+# How long to wait for a stopped container to come up in gog test
+CONTAINER_START_TIMEOUT = 5.0  # seconds
+
+# Container state younger than this is trusted without another inspect call
+CONTAINER_RELOAD_INTERVAL = 1.0  # seconds
+
+
+@dataclass
+class _ContainerHandle:
+    container: Container
+    last_reload: float
+
+
+# Resolved containers for the current command, keyed by (id(client), name)
+_CONTAINER_CACHE: dict[tuple[int, str], _ContainerHandle] = {}
+
+
+# One section of _exec_batch output
+_BATCH_SECTION = re.compile(
+    r"^===(?P<name>\w+)===\n(?P<output>.*?)\n===rc=(?P<rc>\d+)===$",
+    re.M | re.S,
+)
+
+_GOG_CREDENTIALS_PATH = "/home/node/.config/gogcli/credentials.json"
+
+# Installed into the image from docker/validators/gogcreds.js
+_GOGCREDS_SCRIPT = "/usr/local/lib/openclaw/gogcreds.js"
+
 
 def _get_docker_client(cfg) -> docker.DockerClient:
-    """Return a Docker client using the same discovery logic as DockerManager."""
-    import os
-    from pathlib import Path as _Path
-
-    docker_host = os.environ.get("DOCKER_HOST")
-    if not docker_host:
-        candidates = [
-            _Path.home() / ".colima" / "default" / "docker.sock",
-            _Path.home() / ".docker" / "run" / "docker.sock",
-        ]
-        for candidate in candidates:
-            if candidate.exists() and not _Path("/var/run/docker.sock").exists():
-                docker_host = f"unix://{candidate}"
-                break
+    """Return the process-wide Docker client shared with DockerManager."""
+    from clawlib.core.docker_manager import _discover_docker_host, _shared_client
+
+    return _shared_client(_discover_docker_host())
+
+
+def _get_container(client: docker.DockerClient, container_name: str) -> Container:
+    """Return the container, re-inspecting only if its state is stale.
+
+    Raises ``docker.errors.NotFound`` if the container does not exist.
+    """
+    import docker.errors
+
+    key = (id(client), container_name)
+    handle = _CONTAINER_CACHE.get(key)
+    now = time.monotonic()
+    try:
+        if handle is None:
+            # containers.get() inspects, so the state is fresh
+            handle = _ContainerHandle(client.containers.get(container_name), now)
+            _CONTAINER_CACHE[key] = handle
+        elif now - handle.last_reload > CONTAINER_RELOAD_INTERVAL:
+            handle.container.reload()
+            handle.last_reload = now
+    except docker.errors.NotFound:
+        _forget_container(client, container_name)
+        raise
+    return handle.container
+
 
-    if docker_host:
-        return docker.DockerClient(base_url=docker_host)
-    return docker.from_env()
+def _forget_container(client: docker.DockerClient, container_name: str) -> None:
+    _CONTAINER_CACHE.pop((id(client), container_name), None)
+
+
+def _restarting_message(container_name: str) -> str:
+    return f"Container '{container_name}' is restarting. Wait for it to be running, or check logs: docker logs {container_name}"
+
+
+def _running_container(client: docker.DockerClient, container_name: str) -> tuple[Container | None, str]:
+    """Return (container, "") if commands can be run in it, else (None, reason)."""
+    import docker.errors
+
+    try:
+        container = _get_container(client, container_name)
+    except docker.errors.NotFound:
+        return None, f"Container '{container_name}' not found."
+
+    # Check container status - can't exec into restarting containers
+    if container.status == "restarting":
+        return None, _restarting_message(container_name)
+    if container.status != "running":
+        return None, f"Container '{container_name}' is not running (status: {container.status}). Start it first: docker start {container_name}"
+    return container, ""
 
 
 def _exec_in_container(
@@ -48,17 +114,11 @@ def _exec_in_container(
     env: dict[str, str] | None = None,
 ) -> tuple[int, str]:
     """Run a command inside a container and return (exit_code, output)."""
-    try:
-        container = client.containers.get(container_name)
-    except docker.errors.NotFound:
-        return 1, f"Container '{container_name}' not found."
+    import docker.errors
 
-    # Check container status - can't exec into restarting containers
-    container.reload()
-    if container.status == "restarting":
-        return 1, f"Container '{container_name}' is restarting. Wait for it to be running, or check logs: docker logs {container_name}"
-    if container.status != "running":
-        return 1, f"Container '{container_name}' is not running (status: {container.status}). Start it first: docker start {container_name}"
+    container, reason = _running_container(client, container_name)
+    if container is None:
+        return 1, reason
 
     try:
         result = container.exec_run(
@@ -69,11 +129,201 @@ def _exec_in_container(
         output = result.output.decode("utf-8", errors="replace") if result.output else ""
         return result.exit_code, output
     except docker.errors.APIError as e:
+        # The cached state is evidently wrong; inspect again next time
+        _forget_container(client, container_name)
         if "409" in str(e) and "restarting" in str(e).lower():
-            return 1, f"Container '{container_name}' is restarting. Wait for it to be running, or check logs: docker logs {container_name}"
+            return 1, _restarting_message(container_name)
         raise
 
 
+def _exec_lines(
+    client: docker.DockerClient,
+    container_name: str,
+    cmd: list[str],
+    *,
+    env: dict[str, str] | None = None,
+) -> Iterator[str]:
+    """Yield a command's output lines (stdout and stderr) as they arrive.
+
+    The caller can stop iterating as soon as it has what it needs instead
+    of waiting for the whole output to be buffered. If the command cannot
+    be started, the reason is yielded as the only line.
+    """
+    import docker.errors
+
+    container, reason = _running_container(client, container_name)
+    if container is None:
+        yield reason
+        return
+
+    try:
+        result = container.exec_run(cmd, environment=env or {}, stream=True, demux=True)
+    except docker.errors.APIError as e:
+        _forget_container(client, container_name)
+        if "409" in str(e) and "restarting" in str(e).lower():
+            yield _restarting_message(container_name)
+            return
+        raise
+
+    # Chunks are not line-aligned; keep a partial-line buffer per stream
+    pending = [b"", b""]
+    try:
+        for chunks in result.output:
+            for index, chunk in enumerate(chunks):
+                if not chunk:
+                    continue
+                *lines, pending[index] = (pending[index] + chunk).split(b"\n")
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace")
+        for rest in pending:
+            if rest:
+                yield rest.decode("utf-8", errors="replace")
+    finally:
+        result.output.close()
+
+
+def _start_and_wait(
+    client: docker.DockerClient,
+    container: Container,
+    timeout: float = CONTAINER_START_TIMEOUT,
+) -> None:
+    """Start *container* and wait for its start (or die) event, then reload it.
+
+    Subscribes to the daemon's event stream instead of polling, so this
+    returns as soon as the container is up. ``until`` ends the stream
+    after *timeout* seconds if no event arrives.
+    """
+    since = int(time.time())
+    events = client.events(
+        since=since,
+        until=since + int(timeout) + 1,
+        filters={"container": container.id, "event": ["start", "die", "restart"]},
+        decode=True,
+    )
+    try:
+        container.start()
+        for event in events:
+            if event.get("Action", event.get("status")) in ("start", "die", "restart"):
+                break
+    finally:
+        events.close()
+    container.reload()
+
+
+def _exec_batch(
+    client: docker.DockerClient,
+    container_name: str,
+    probes: dict[str, str],
+    *,
+    env: dict[str, str] | None = None,
+) -> dict[str, tuple[int, str]]:
+    """Run several shell probes in one exec and return {name: (exit_code, output)}.
+
+    Each probe's combined output is framed by ``===name===`` and
+    ``===rc=N===`` marker lines, so a single create/start-exec round-trip
+    replaces one per probe. If the exec itself fails (container not
+    running, ...), every probe reports that exit code and output.
+    """
+    script = "\n".join(
+        f"echo '==={name}==='\n(\n{cmd}\n) 2>&1\nprintf '\\n===rc=%d===\\n' $?"
+        for name, cmd in probes.items()
+    )
+    exit_code, output = _exec_in_container(client, container_name, ["sh", "-c", script], env=env)
+    results = {
+        match["name"]: (int(match["rc"]), match["output"])
+        for match in _BATCH_SECTION.finditer(output)
+    }
+    for name in probes:
+        results.setdefault(name, (exit_code or 1, output))
+    return results
+
+
+def _parse_creds_report(exit_code: int, output: str) -> dict | None:
+    """Return the gogcreds.js report, or None if the validator did not run."""
+    if exit_code != 0:
+        return None
+    try:
+        report = json.loads(output)
+    except ValueError:
+        return None
+    return report if isinstance(report, dict) else None
+
+
+def _creds_problem(report: dict | None, output: str) -> str | None:
+    """Describe what is wrong with credentials.json, or None if it is usable."""
+    if report is None:
+        return (
+            f"validator failed ({output.strip() or 'no output'}). "
+            "Rebuild the image if it predates docker/validators/gogcreds.js."
+        )
+    if not report["exists"]:
+        return "file not found"
+    if report["error"]:
+        return f"invalid: {report['error']}"
+    if not report["client_id_length"]:
+        return "missing client_id"
+    if not report["client_secret_length"]:
+        return "missing client_secret"
+    return None
+
+
+def _yes_no(value: bool) -> str:
+    return "yes" if value else "no"
+
+
+def _creds_details(report: dict) -> list[str]:
+    """Human-readable lines describing a parsed credentials.json."""
+    if report["error"] or not report["exists"]:
+        return []
+    lines = [
+        f"Format: {report['format']}",
+        f"Keys: {', '.join(report['keys'])}",
+        f"Client ID: {report['client_id_prefix']}... (length: {report['client_id_length']})",
+        f"Client ID format: {'valid' if report['client_id_format_valid'] else 'invalid'}",
+        f"Has creds.client_id: {_yes_no(report['flat_client_id'])}, "
+        f"creds.installed.client_id: {_yes_no(report['installed_client_id'])}",
+        f"Has creds.client_secret: {_yes_no(report['flat_client_secret'])}, "
+        f"creds.installed.client_secret: {_yes_no(report['installed_client_secret'])}",
+        f"Client secret length: {report['client_secret_length']}",
+    ]
+    if report["has_auth_uri"] is not None:
+        lines.append(f"Has auth_uri: {_yes_no(report['has_auth_uri'])}")
+        lines.append(f"Has token_uri: {_yes_no(report['has_token_uri'])}")
+    return lines
+
+
+def _lists_account(output: str, email: str) -> bool:
+    """Whether ``gog auth list`` *output* mentions *email* (case-insensitive)."""
+    return re.search(re.escape(email), output, re.IGNORECASE) is not None
+
+
+# The scope query parameter of an OAuth authorization URL
+_SCOPE_PARAM = re.compile(r"[?&]scope=([^&#]+)")
+
+
+def _describe_scopes(auth_url: str) -> str:
+    """Debug listing of the scopes requested by *auth_url*, as one string."""
+    from urllib.parse import unquote_plus
+
+    match = _SCOPE_PARAM.search(auth_url)
+    if not match:
+        return "   [dim]Debug: No scope parameter in auth URL[/dim]"
+    scopes = unquote_plus(match.group(1)).split()
+    lines = [f"   [dim]Debug: Requested scopes ({len(scopes)}):[/dim]"]
+    for scope in scopes:
+        suffix = "" if scope.startswith("https://") else " (identity scope)"
+        lines.append(f"   [dim]    {scope}{suffix}[/dim]")
+    return "\n".join(lines)
+
+
+def _auth_add_cmd(email: str, services: str, step: int, *extra: str, readonly: bool) -> list[str]:
+    """Build one step of ``gog auth add --remote`` (step 1 prints the URL, step 2 exchanges it)."""
+    cmd = ["gog", "auth", "add", email, "--services", services, "--remote", f"--step={step}", *extra]
+    if readonly:
+        cmd.append("--readonly")
+    return cmd
+
+
 def run_gog_auth(
     username: str,
     email: str,
@@ -82,6 +332,7 @@ def run_gog_auth(
     services: str = "gmail",
     readonly: bool = False,
     secrets_mgr=None,
+    debug: bool = False,
 ) -> bool:
     """Run the gog OAuth flow for a user. Returns True on success.
 
@@ -89,6 +340,11 @@ def run_gog_auth(
       Step 1: print auth URL
       Step 2: exchange redirect URL for token
     """
+    from rich.panel import Panel
+
+    from clawlib.core.docker_manager import CONTAINER_PREFIX
+
+    console = get_console()
     container_name = f"{CONTAINER_PREFIX}-{username}"
     
     # Read secrets to pass as environment variables for exec commands
@@ -98,60 +354,38 @@ def run_gog_auth(
         if keyring_password:
             exec_env["GOG_KEYRING_PASSWORD"] = keyring_password.strip()
 
+    # gog expects --services as a single comma-separated string argument
+    # Clean up the services string to ensure no extra whitespace or issues
+    services_clean = ",".join(part for part in map(str.strip, services.split(",")) if part)
+
     # Step 1: get the authorization URL
     console.print()
     console.print(f"[bold]Starting gog OAuth authorization for {email}...[/bold]")
     console.print()
 
-    # gog expects --services as a single comma-separated string argument
-    # Clean up the services string to ensure no extra whitespace or issues
-    services_clean = ",".join([s.strip() for s in services.split(",") if s.strip()])
-    cmd = ["gog", "auth", "add", email, "--services", services_clean, "--remote", "--step=1"]
-    
-    if readonly:
-        cmd.append("--readonly")
-    
-    console.print(f"   [dim]Debug: Services: {services_clean}, Readonly: {readonly}[/dim]")
-    
-    exit_code, output = _exec_in_container(
-        client,
-        container_name,
-        cmd,
-        env=exec_env,
-    )
+    cmd = _auth_add_cmd(email, services_clean, 1, readonly=readonly)
 
-    if exit_code != 0:
-        console.print(f"[red]gog auth step 1 failed:[/red]\n{output.strip()}")
-        return False
+    if debug:
+        console.print(f"   [dim]Debug: Services: {services_clean}, Readonly: {readonly}[/dim]")
 
-    # Parse the auth_url from tab-separated output: "auth_url\t<url>"
+    # Stream the output and stop reading once the URL line ("auth_url\t<url>") arrives
     auth_url = None
-    for line in output.splitlines():
-        parts = line.split("\t", 1)
-        if len(parts) == 2 and parts[0].strip() == "auth_url":
-            auth_url = parts[1].strip()
-            break
+    output_lines = []
+    with closing(_exec_lines(client, container_name, cmd, env=exec_env)) as lines:
+        for line in lines:
+            parts = line.split("\t", 1)
+            if len(parts) == 2 and parts[0].strip() == "auth_url":
+                auth_url = parts[1].strip()
+                break
+            output_lines.append(line)
 
     if not auth_url:
-        console.print(f"[red]Could not parse auth URL from gog output:[/red]\n{output.strip()}")
+        output = "\n".join(output_lines)
+        console.print(f"[red]gog auth step 1 failed:[/red]\n{output.strip()}")
         return False
 
-    # Debug: Parse and validate the scope parameter
-    try:
-        from urllib.parse import urlparse, parse_qs, unquote
-        parsed = urlparse(auth_url)
-        params = parse_qs(parsed.query)
-        if "scope" in params:
-            scope_param = params["scope"][0]
-            scopes = unquote(scope_param).split()
-            console.print(f"   [dim]Debug: Requested scopes ({len(scopes)}):[/dim]")
-            for scope in scopes:
-                if scope.startswith("https://"):
-                    console.print(f"   [dim]    {scope}[/dim]")
-                else:
-                    console.print(f"   [dim]    {scope} (identity scope)[/dim]")
-    except Exception as e:
-        console.print(f"   [dim]Debug: Could not parse scopes: {e}[/dim]")
+    if debug:
+        console.print(_describe_scopes(auth_url))
 
     # Display the URL for the user to open
     # CRITICAL: Must display URL without wrapping to prevent breaking scope parameter
@@ -184,37 +418,26 @@ def run_gog_auth(
         console.print("[yellow]Aborted — no redirect URL provided.[/yellow]")
         return False
 
-    # Clean up services string for step 2
-    services_clean = ",".join([s.strip() for s in services.split(",") if s.strip()])
-    cmd = [
-        "gog", "auth", "add", email,
-        "--services", services_clean,
-        "--remote", "--step=2",
-        f"--auth-url={redirect_url.strip()}",
-    ]
-    
-    if readonly:
-        cmd.append("--readonly")
-    
-    exit_code, output = _exec_in_container(
+    cmd = _auth_add_cmd(
+        email, services_clean, 2, f"--auth-url={redirect_url.strip()}", readonly=readonly
+    )
+
+    # Exchange and verify in one exec; the listing is ignored if step 2 fails
+    probes = _exec_batch(
         client,
         container_name,
-        cmd,
+        {"step2": shlex.join(cmd), "auth_list": "gog auth list"},
         env=exec_env,
     )
 
+    exit_code, output = probes["step2"]
     if exit_code != 0:
         console.print(f"[red]gog auth step 2 failed:[/red]\n{output.strip()}")
         return False
 
     # Verify
-    exit_code, output = _exec_in_container(
-        client,
-        container_name,
-        ["gog", "auth", "list"],
-        env=exec_env,
-    )
-    authorized = email.lower() in output.lower()
+    exit_code, output = probes["auth_list"]
+    authorized = _lists_account(output, email)
 
     if authorized:
         console.print(f"[green]✓ gog authorized for {email}[/green]")
@@ -243,6 +466,13 @@ def gog_setup(
             help="Use read-only scopes where available",
         ),
     ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option(
+            "--debug",
+            help="Show the requested services and OAuth scopes",
+        ),
+    ] = False,
     config: Annotated[
         Optional[Path],
         typer.Option("--config", "-c", help="Path to clawctl.toml"),
@@ -258,6 +488,14 @@ def gog_setup(
     GOG_CLIENT_ID / GOG_CLIENT_SECRET on first start. This command only
     handles the per-user OAuth token exchange.
     """
+    import docker.errors
+
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import CONTAINER_PREFIX
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     user = cfg.get_user(name)
 
@@ -287,7 +525,7 @@ def gog_setup(
 
     # Verify container is running
     try:
-        container = client.containers.get(container_name)
+        container = _get_container(client, container_name)
         if container.status != "running":
             console.print(
                 f"[red]Container '{container_name}' is not running (status: {container.status}).[/red] "
@@ -302,11 +540,12 @@ def gog_setup(
         raise typer.Exit(1)
 
     # Check if gog credentials are seeded (entrypoint should have done this)
-    exit_code, output = _exec_in_container(
+    probes = _exec_batch(
         client,
         container_name,
-        ["gog", "auth", "status"],
+        {"auth_status": "gog auth status", "auth_list": "gog auth list"},
     )
+    exit_code, output = probes["auth_status"]
     if "credentials.json" in output and "config_exists: false" in output:
         console.print(
             "[yellow]Warning: gog credentials not yet seeded.[/yellow]\n"
@@ -314,8 +553,8 @@ def gog_setup(
         )
 
     # Check if already authorized
-    exit_code, output = _exec_in_container(client, container_name, ["gog", "auth", "list"])
-    if exit_code == 0 and user.skills.gog.email.lower() in output.lower():
+    exit_code, output = probes["auth_list"]
+    if exit_code == 0 and _lists_account(output, user.skills.gog.email):
         console.print(
             f"[green]gog is already authorized for {user.skills.gog.email}.[/green]"
         )
@@ -323,11 +562,9 @@ def gog_setup(
             raise typer.Exit(0)
 
     # Get secrets manager to pass keyring password to exec commands
-    from clawlib.core.secrets import SecretsManager
-    from clawlib.core.paths import Paths
-    secrets_mgr = SecretsManager(Paths(cfg.clawctl.data_root, cfg.clawctl.build_root))
+    secrets_mgr = SecretsManager(get_paths(cfg))
     
-    success = run_gog_auth(name, user.skills.gog.email, client, services=services, readonly=readonly, secrets_mgr=secrets_mgr)
+    success = run_gog_auth(name, user.skills.gog.email, client, services=services, readonly=readonly, secrets_mgr=secrets_mgr, debug=debug)
     if not success:
         raise typer.Exit(1)
 
@@ -344,7 +581,16 @@ def gog_test(
     Checks if OAuth client credentials are properly configured and valid.
     This helps diagnose credential setup issues before attempting OAuth authorization.
     """
+    import docker.errors
+
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import CONTAINER_PREFIX
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
+    paths = get_paths(cfg)
     user = cfg.get_user(name)
 
     if user is None:
@@ -366,7 +612,7 @@ def gog_test(
 
     # Verify container exists
     try:
-        container = client.containers.get(container_name)
+        container = _get_container(client, container_name)
     except docker.errors.NotFound:
         console.print(
             f"[red]Container '{container_name}' not found.[/red] "
@@ -383,12 +629,9 @@ def gog_test(
         console.print(f"  Config file (clawctl.toml): [cyan]{config_email}[/cyan]")
         
         # Check what's in openclaw.json
-        from clawlib.core.paths import Paths
-        paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
         openclaw_config_path = paths.user_openclaw_config(name)
         if openclaw_config_path.exists():
             try:
-                import json
                 with open(openclaw_config_path) as f:
                     openclaw_config = json.load(f)
                 openclaw_email = openclaw_config.get("hooks", {}).get("gmail", {}).get("account")
@@ -410,7 +653,7 @@ def gog_test(
     console.print()
 
     # Check container status
-    container.reload()
+    container = _get_container(client, container_name)
     if container.status == "restarting":
         console.print(
             f"[red]Container is restarting (likely crashing).[/red]"
@@ -420,13 +663,10 @@ def gog_test(
         console.print("\n  Attempting to inspect credentials file...")
         try:
             # Try to read credentials.json from the host mount
-            from clawlib.core.paths import Paths
-            paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
             config_dir = paths.user_config_dir(name)
             creds_file = config_dir / "gogcli" / "credentials.json"
             
             if creds_file.exists():
-                import json
                 try:
                     with open(creds_file) as f:
                         creds_data = json.load(f)
@@ -458,8 +698,9 @@ def gog_test(
         # Show recent logs
         console.print(f"\n  Recent container logs:")
         try:
-            logs = container.logs(tail=10).decode('utf-8', errors='replace')
-            for line in logs.strip().split('\n')[-5:]:
+            # Only the last 5 lines are shown, so only fetch those
+            logs = container.logs(tail=5).decode("utf-8", errors="replace")
+            for line in logs.splitlines():
                 console.print(f"  [dim]  {line}[/dim]")
         except Exception as e:
             console.print(f"  [yellow]  Could not read logs: {e}[/yellow]")
@@ -479,18 +720,11 @@ def gog_test(
             f"Starting container to test credentials..."
         )
         try:
-            container.start()
-            # Wait a moment for container to start
-            import time
-            for _ in range(10):  # Wait up to 5 seconds
-                time.sleep(0.5)
-                container.reload()
-                if container.status == "running":
-                    break
-                if container.status == "restarting":
-                    console.print(f"[red]Container started but is now restarting (crashing).[/red]")
-                    console.print(f"  Check logs: [bold]docker logs {container_name}[/bold]")
-                    raise typer.Exit(1)
+            _start_and_wait(client, container)
+            if container.status == "restarting":
+                console.print(f"[red]Container started but is now restarting (crashing).[/red]")
+                console.print(f"  Check logs: [bold]docker logs {container_name}[/bold]")
+                raise typer.Exit(1)
         except typer.Exit:
             raise
         except Exception as e:
@@ -499,20 +733,17 @@ def gog_test(
 
     # Test 1: Check if secrets are mounted
     console.print("1. Checking secrets...")
-    from clawlib.core.secrets import SecretsManager
-    from clawlib.core.paths import Paths
-    secrets_mgr = SecretsManager(Paths(cfg.clawctl.data_root, cfg.clawctl.build_root))
+    secrets_mgr = SecretsManager(paths)
     
     required_secrets = ["gog_client_id", "gog_client_secret", "gog_keyring_password"]
     secrets_ok = True
+    secret_values = secrets_mgr.read_secrets(name, required_secrets)
     for secret_name in required_secrets:
-        if secrets_mgr.secret_exists(name, secret_name):
-            secret_value = secrets_mgr.read_secret(name, secret_name)
-            if secret_value and secret_value.strip():
-                console.print(f"   [green]✓[/green] {secret_name}: present")
-            else:
-                console.print(f"   [red]✗[/red] {secret_name}: empty")
-                secrets_ok = False
+        if secret_name in secret_values:
+            console.print(f"   [green]✓[/green] {secret_name}: present")
+        elif secrets_mgr.secret_exists(name, secret_name):
+            console.print(f"   [red]✗[/red] {secret_name}: empty")
+            secrets_ok = False
         else:
             console.print(f"   [red]✗[/red] {secret_name}: missing")
             secrets_ok = False
@@ -525,11 +756,19 @@ def gog_test(
 
     # Test 2: Check gog auth status (credentials.json)
     console.print("2. Checking gog credentials configuration...")
-    exit_code, output = _exec_in_container(
-        client,
-        container_name,
-        ["gog", "auth", "status"],
-    )
+    # Run every in-container probe for sections 2-4 in a single exec
+    batch = {
+        "auth_status": "gog auth status",
+        "creds_file": f"test -f {_GOG_CREDENTIALS_PATH}",
+        "creds_report": f"node {_GOGCREDS_SCRIPT} --json",
+    }
+    if user.skills.gog.email:
+        batch["auth_list"] = "gog auth list"
+    probes = _exec_batch(client, container_name, batch)
+    creds_report = _parse_creds_report(*probes["creds_report"])
+    creds_problem = _creds_problem(creds_report, probes["creds_report"][1])
+
+    exit_code, output = probes["auth_status"]
 
     # Show full debug output
     console.print("   [dim]Debug: gog auth status output:[/dim]")
@@ -547,11 +786,7 @@ def gog_test(
     keyring_ok = False
     
     # Check if credentials.json file actually exists
-    exit_code_file, output_file = _exec_in_container(
-        client,
-        container_name,
-        ["test", "-f", "/home/node/.config/gogcli/credentials.json"],
-    )
+    exit_code_file, output_file = probes["creds_file"]
     file_exists = exit_code_file == 0
     
     for line in status_lines:
@@ -597,33 +832,11 @@ def gog_test(
     if not credentials_ok and file_exists:
         console.print("\n   [yellow]⚠[/yellow] credentials.json exists but gog status unclear")
         # Try to validate it
-        exit_code_val, output_val = _exec_in_container(
-            client,
-            container_name,
-            ["node", "-e", """
-                try {
-                    const creds = require('/home/node/.config/gogcli/credentials.json');
-                    // Check both flattened and installed wrapper formats
-                    const clientId = creds.client_id || (creds.installed && creds.installed.client_id);
-                    const clientSecret = creds.client_secret || (creds.installed && creds.installed.client_secret);
-                    if (clientId && clientSecret) {
-                        console.log('File exists and has required fields');
-                        process.exit(0);
-                    } else {
-                        console.log('File exists but missing required fields');
-                        process.exit(1);
-                    }
-                } catch (e) {
-                    console.log('File exists but invalid:', e.message);
-                    process.exit(1);
-                }
-            """],
-        )
-        if exit_code_val == 0:
+        if creds_problem is None:
             console.print("   [green]✓[/green] credentials.json: file is valid")
             credentials_ok = True
         else:
-            console.print(f"   [red]✗[/red] credentials.json: {output_val.strip()}")
+            console.print(f"   [red]✗[/red] credentials.json: {creds_problem}")
 
     if not credentials_ok:
         console.print("\n[yellow]gog credentials not properly configured.[/yellow]")
@@ -637,103 +850,16 @@ def gog_test(
 
     # Test 3: Try to read credentials.json directly
     console.print("\n3. Validating credentials.json format...")
-    exit_code, output = _exec_in_container(
-        client,
-        container_name,
-        ["node", "-e", """
-            try {
-                const creds = require('/home/node/.config/gogcli/credentials.json');
-                // gog stores credentials in flattened format (client_id/client_secret at top level)
-                // even though we send it in 'installed' wrapper format
-                const clientId = creds.client_id || (creds.installed && creds.installed.client_id);
-                const clientSecret = creds.client_secret || (creds.installed && creds.installed.client_secret);
-                
-                if (!clientId) {
-                    console.log('ERROR: Missing client_id');
-                    console.log('  Has creds.client_id:', !!creds.client_id);
-                    console.log('  Has creds.installed.client_id:', !!(creds.installed && creds.installed.client_id));
-                    process.exit(1);
-                }
-                if (!clientSecret) {
-                    console.log('ERROR: Missing client_secret');
-                    console.log('  Has creds.client_secret:', !!creds.client_secret);
-                    console.log('  Has creds.installed.client_secret:', !!(creds.installed && creds.installed.client_secret));
-                    process.exit(1);
-                }
-                console.log('OK: credentials.json is valid');
-                console.log('Format:', creds.client_id ? 'flattened' : 'installed wrapper');
-                console.log('Client ID:', clientId.substring(0, 30) + '...');
-                console.log('Client ID length:', clientId.length);
-                console.log('Has client_secret:', !!clientSecret);
-                console.log('Client secret length:', clientSecret.length);
-            } catch (e) {
-                console.log('ERROR:', e.message);
-                process.exit(1);
-            }
-        """],
-    )
-
-    console.print("   [dim]Debug: credentials.json validation output:[/dim]")
-    for line in output.strip().split("\n"):
-        console.print(f"   [dim]  {line}[/dim]")
-
-    if exit_code != 0:
-        console.print(f"\n   [red]✗[/red] credentials.json validation failed:")
-        console.print(f"   {output.strip()}")
+    if creds_problem is not None:
+        console.print(f"\n   [red]✗[/red] credentials.json validation failed: {creds_problem}")
         raise typer.Exit(1)
-    else:
-        # Extract just the OK message for clean display
-        ok_line = [l for l in output.strip().split("\n") if l.startswith("OK:")]
-        if ok_line:
-            console.print(f"\n   [green]✓[/green] {ok_line[0]}")
-        else:
-            console.print(f"\n   [green]✓[/green] credentials.json is valid")
+    console.print("   [green]✓[/green] credentials.json is valid")
 
     console.print()
 
-    # Test 3.5: Try to validate credentials with Google (if possible)
-    console.print("\n3.5. Testing credentials with Google API...")
-    # Try to get a token or validate the credentials format
-    exit_code, output = _exec_in_container(
-        client,
-        container_name,
-        ["sh", "-c", """
-            # Try to read and validate the credentials format
-            if [ -f /home/node/.config/gogcli/credentials.json ]; then
-                echo "Credentials file exists"
-                # Check if we can parse it (gog stores in flattened format)
-                node -e "
-                    const creds = require('/home/node/.config/gogcli/credentials.json');
-                    // Check both flattened and installed wrapper formats
-                    const clientId = creds.client_id || (creds.installed && creds.installed.client_id);
-                    const clientSecret = creds.client_secret || (creds.installed && creds.installed.client_secret);
-                    const clientIdPattern = /^[0-9-]+\\.apps\\.googleusercontent\\.com$/;
-                    
-                    if (!clientId || !clientSecret) {
-                        console.log('ERROR: Missing client_id or client_secret');
-                        process.exit(1);
-                    }
-                    
-                    console.log('Client ID format:', clientIdPattern.test(clientId) ? 'valid' : 'invalid');
-                    console.log('Client ID length:', clientId.length);
-                    console.log('Client secret length:', clientSecret.length);
-                    console.log('Format:', creds.client_id ? 'flattened' : 'installed wrapper');
-                    // auth_uri and token_uri are only in installed wrapper format
-                    if (creds.installed) {
-                        console.log('Has auth_uri:', !!creds.installed.auth_uri);
-                        console.log('Has token_uri:', !!creds.installed.token_uri);
-                    }
-                " 2>&1 || echo "Failed to parse credentials"
-            else
-                echo "Credentials file not found"
-            fi
-        """],
-    )
-    
-    console.print("   [dim]Debug: Credential validation output:[/dim]")
-    for line in output.strip().split("\n"):
-        if line.strip():
-            console.print(f"   [dim]  {line}[/dim]")
+    # Test 3.5: Show what the credentials look like to Google's OAuth client
+    console.print("\n3.5. Credential details...")
+    console.print("\n".join(f"   [dim]  {line}[/dim]" for line in _creds_details(creds_report)))
 
     console.print()
 
@@ -741,18 +867,14 @@ def gog_test(
     console.print("\n4. Authorization status:")
     if user.skills.gog.email:
         # Check if already authorized
-        exit_code, output = _exec_in_container(
-            client,
-            container_name,
-            ["gog", "auth", "list"],
-        )
+        exit_code, output = probes["auth_list"]
         
         console.print("   [dim]Debug: gog auth list output:[/dim]")
         for line in output.strip().split("\n"):
             console.print(f"   [dim]  {line}[/dim]")
         
         if exit_code == 0:
-            if user.skills.gog.email.lower() in output.lower():
+            if _lists_account(output, user.skills.gog.email):
                 console.print(f"\n   [green]✓[/green] Account '{user.skills.gog.email}' is already authorized")
             else:
                 console.print(f"\n   [yellow]⚠[/yellow] Account '{user.skills.gog.email}' not yet authorized")
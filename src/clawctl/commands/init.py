@@ -3,31 +3,37 @@
 from __future__ import annotations
 
 import shutil
+from functools import cache
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from clawlib.core.paths import Paths
-
-console = Console()
+from clawctl.utils.console import get_console
 
 # Resolve the project-level config/ directory from this source file
 _PACKAGE_ROOT = Path(__file__).resolve().parents[2]  # src/clawctl/commands -> src/clawctl -> src
 _PROJECT_ROOT = _PACKAGE_ROOT.parent  # src -> project root
+_EXAMPLE_CONFIG_CANDIDATES = (
+    _PROJECT_ROOT / "config" / "clawctl.example.toml",
+    _PACKAGE_ROOT / "config" / "clawctl.example.toml",
+)
 
 
+@cache
 def _find_example_config() -> Path | None:
-    """Find the example config template relative to the project."""
-    candidates = [
-        _PROJECT_ROOT / "config" / "clawctl.example.toml",
-        _PACKAGE_ROOT / "config" / "clawctl.example.toml",
-    ]
-    for path in candidates:
-        if path.is_file():
-            return path
-    return None
+    """Find the example config template relative to the project (once per process)."""
+    return next((path for path in _EXAMPLE_CONFIG_CANDIDATES if path.is_file()), None)
+
+
+def _prime_config_cache(config_file: Path) -> None:
+    """Validate and pickle a freshly created config so the next command starts warm."""
+    from clawlib.core.config import load_config_cached
+
+    try:
+        load_config_cached(config_file)
+    except (ValueError, FileNotFoundError):
+        pass
 
 
 def init(
@@ -43,6 +49,9 @@ def init(
 
     Use --name to create a named config (e.g. --name sales creates sales.toml).
     """
+    from clawlib.core.paths import Paths
+
+    console = get_console()
     build_dir = Path("build").resolve()
     data_dir = Path("data").resolve()
     paths = Paths(data_dir, build_dir)
@@ -54,6 +63,7 @@ def init(
         if example is not None:
             shutil.copy2(example, config_dest)
             console.print(f"Created [bold]{config_dest.name}[/bold]")
+            _prime_config_cache(config_dest)
         else:
             console.print(
                 f"[yellow]Warning:[/yellow] Could not find example config template. "
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, NoReturn, Optional
 
 import typer
-from rich.console import Console
 
-from clawlib.core.config import load_config_or_exit
-from clawlib.core.docker_manager import DockerManager
-from clawlib.core.user_manager import UserManager
+from clawctl.utils.console import get_console, get_err_console
 
-console = Console()
+
+def _exit_with_failures(group: ExceptionGroup) -> NoReturn:
+    """Print one line per user that failed in a parallel run, then exit 1."""
+    err_console = get_err_console()
+    for error in group.exceptions:
+        # DockerManager notes which user each error belongs to
+        where = " ".join(getattr(error, "__notes__", ()))
+        err_console.print(f"[red]Error {where}:[/red] {error}")
+    raise typer.Exit(1) from None
 
 
 def start(
@@ -23,6 +28,10 @@ def start(
     ] = None,
 ) -> None:
     """Start a user's OpenClaw container."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     docker = DockerManager(cfg)
     docker.start_container(name)
@@ -37,6 +46,10 @@ def stop(
     ] = None,
 ) -> None:
     """Stop a user's OpenClaw container (graceful 30s timeout)."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     docker = DockerManager(cfg)
     docker.stop_container(name)
@@ -51,6 +64,10 @@ def restart(
     ] = None,
 ) -> None:
     """Restart a user's container (regenerates openclaw.json and runs doctor --fix)."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.user_manager import UserManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     user_mgr = UserManager(cfg)
     user_mgr.restart_user(name)
@@ -62,11 +79,22 @@ def start_all(
         Optional[Path],
         typer.Option("--config", "-c", help="Path to clawctl.toml"),
     ] = None,
+    parallel: Annotated[
+        bool,
+        typer.Option("--parallel/--serial", help="Handle users concurrently or one at a time"),
+    ] = True,
 ) -> None:
     """Start all user containers."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     docker = DockerManager(cfg)
-    started = docker.start_all()
+    try:
+        started = docker.start_all(parallel=parallel)
+    except ExceptionGroup as e:
+        _exit_with_failures(e)
     if started:
         console.print(f"[green]Started {len(started)} containers:[/green] {', '.join(started)}")
     else:
@@ -78,11 +106,22 @@ def stop_all(
         Optional[Path],
         typer.Option("--config", "-c", help="Path to clawctl.toml"),
     ] = None,
+    parallel: Annotated[
+        bool,
+        typer.Option("--parallel/--serial", help="Handle users concurrently or one at a time"),
+    ] = True,
 ) -> None:
     """Stop all user containers."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     docker = DockerManager(cfg)
-    stopped = docker.stop_all()
+    try:
+        stopped = docker.stop_all(parallel=parallel)
+    except ExceptionGroup as e:
+        _exit_with_failures(e)
     if stopped:
         console.print(f"[yellow]Stopped {len(stopped)} containers:[/yellow] {', '.join(stopped)}")
     else:
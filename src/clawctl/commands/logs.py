@@ -2,16 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
-
-from clawlib.core.config import load_config_or_exit
-from clawlib.core.docker_manager import DockerManager
-
-console = Console()
 
 
 def logs(
@@ -24,11 +19,18 @@ def logs(
     ] = None,
 ) -> None:
     """View logs from a user's container."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+
     cfg = load_config_or_exit(config)
     docker = DockerManager(cfg)
 
+    # Pass the daemon's bytes straight through; decoding and re-encoding
+    # every line only costs time on chatty containers.
+    out = sys.stdout.buffer
     try:
-        for line in docker.stream_logs(name, follow=follow, tail=tail):
-            typer.echo(line, nl=False)
+        for chunk in docker.stream_logs_raw(name, follow=follow, tail=tail):
+            out.write(chunk)
+            out.flush()
     except KeyboardInterrupt:
         pass
@@ -8,8 +8,9 @@ from typing import Annotated, Optional
 import typer
 from rich.console import Console
 
-from clawlib.core.config import find_config_path, load_config_or_exit
+from clawlib.core.config import load_config_or_exit, load_config_or_exit_with_path
 from clawlib.core.maintenance_manager import MaintenanceManager
+from clawctl.utils.console import spinner
 
 console = Console()
 
@@ -24,7 +25,7 @@ def maintenance_run(
     cfg = load_config_or_exit(config)
     manager = MaintenanceManager(cfg)
 
-    with console.status("Running maintenance cycle (backup → restart)..."):
+    with spinner(console, "Running maintenance cycle (backup → restart)..."):
         results = manager.run_cycle()
 
     console.print()
@@ -49,8 +50,7 @@ def schedule_start(
     ] = None,
 ) -> None:
     """Start the nightly maintenance daemon."""
-    config_path = find_config_path(config)
-    cfg = load_config_or_exit(config)
+    config_path, cfg = load_config_or_exit_with_path(config)
     manager = MaintenanceManager(cfg)
 
     if manager.is_daemon_running():
@@ -90,8 +90,8 @@ def schedule_status(
     cfg = load_config_or_exit(config)
     manager = MaintenanceManager(cfg)
 
-    if manager.is_daemon_running():
-        pid = int(manager.paths.maintenance_pid_file.read_text().strip())
+    pid = manager.read_daemon_pid()
+    if pid is not None:
         restart_time = cfg.clawctl.maintenance.restart_time
         console.print(
             f"[green]Maintenance daemon is running[/green] (PID {pid}, "
@@ -6,13 +6,10 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from clawlib.core.shared_collections_manager import SharedCollectionsManager
-from clawlib.core.config import find_config_path, load_config_or_exit
-
-console = Console()
+from clawlib.core.config import load_config_or_exit, load_config_or_exit_with_path
+from clawctl.utils.console import get_console, spinner
 
 
 def sync(
@@ -26,6 +23,7 @@ def sync(
     ] = None,
 ) -> None:
     """Sync shared document collections from S3 or local source to all user containers."""
+    console = get_console()
     cfg = load_config_or_exit(config)
 
     if not cfg.clawctl.shared_collections:
@@ -37,7 +35,7 @@ def sync(
 
     if collection_name:
         # Sync single collection
-        with console.status(f"Syncing collection '{collection_name}'..."):
+        with spinner(console, f"Syncing collection '{collection_name}'..."):
             success = manager.sync_collection(collection_name)
         if success:
             console.print(f"[green]Successfully synced collection '{collection_name}'[/green]")
@@ -46,7 +44,7 @@ def sync(
             raise typer.Exit(1)
     else:
         # Sync all collections
-        with console.status("Syncing all collections..."):
+        with spinner(console, "Syncing all collections..."):
             results = manager.sync_all()
 
         if not results:
@@ -67,6 +65,7 @@ def list_collections(
     ] = None,
 ) -> None:
     """List configured shared collections and their status."""
+    console = get_console()
     cfg = load_config_or_exit(config)
 
     if not cfg.clawctl.shared_collections:
@@ -83,6 +82,8 @@ def list_collections(
     for d in shared_config.drives:
         drive_users[d.name] = d.users
 
+    from rich.table import Table
+
     table = Table(title="Shared Drives")
     table.add_column("Drive", style="cyan")
     table.add_column("Access", style="dim")
@@ -117,8 +118,8 @@ def schedule_start(
     ] = None,
 ) -> None:
     """Start the periodic sync daemon."""
-    config_path = find_config_path(config)
-    cfg = load_config_or_exit(config)
+    console = get_console()
+    config_path, cfg = load_config_or_exit_with_path(config)
 
     if not cfg.clawctl.shared_collections:
         console.print("[red]Shared collections not configured.[/red]")
@@ -144,6 +145,7 @@ def schedule_stop(
     ] = None,
 ) -> None:
     """Stop the periodic sync daemon."""
+    console = get_console()
     cfg = load_config_or_exit(config)
 
     if not cfg.clawctl.shared_collections:
@@ -165,6 +167,7 @@ def schedule_status(
     ] = None,
 ) -> None:
     """Check if the sync daemon is running."""
+    console = get_console()
     cfg = load_config_or_exit(config)
 
     if not cfg.clawctl.shared_collections:
@@ -173,9 +176,8 @@ def schedule_status(
 
     manager = SharedCollectionsManager(cfg)
 
-    if manager.is_daemon_running():
-        pid_file = manager.paths.build_root / ".shared-collections-sync.pid"
-        pid = int(pid_file.read_text().strip())
+    pid = manager.read_daemon_pid()
+    if pid is not None:
         console.print(f"[green]Sync daemon is running[/green] (PID {pid})")
     else:
         console.print("[dim]Sync daemon is not running.[/dim]")
@@ -2,58 +2,22 @@
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from docker.errors import DockerException
 
 from clawlib.core.config import load_config_or_exit
 from clawlib.core.docker_manager import DockerManager
-from clawlib.core.paths import Paths
+from clawlib.core.openclaw_config import get_tailscale_hostname, get_tailscale_ip
+from clawlib.core.paths import Paths, get_paths
 from clawlib.core.secrets import SecretsManager
 from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME
 import json
 
-console = Console()
-
-
-def _get_tailscale_ip() -> str | None:
-    """Get Tailscale IPv4 address if available."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "ip", "-4"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=2,
-        )
-        ip = result.stdout.strip()
-        return ip if ip else None
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return None
-
-
-def _get_tailscale_hostname() -> str | None:
-    """Get Tailscale MagicDNS hostname if available."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=2,
-        )
-        status_data = json.loads(result.stdout)
-        self_info = status_data.get("Self", {})
-        dns_name = self_info.get("DNSName", "")
-        return dns_name.rstrip(".") if dns_name else None
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
-        return None
+from clawctl.utils.console import get_console, styled_status
 
 
 def _is_tailscale_serve_enabled(username: str, paths: Paths) -> bool:
@@ -77,6 +41,7 @@ def status(
     ] = None,
 ) -> None:
     """Show the status of all user containers."""
+    console = get_console()
     cfg = load_config_or_exit(config)
     try:
         docker = DockerManager(cfg)
@@ -91,35 +56,36 @@ def status(
             )
         console.print("\nOr check the server remotely with: [bold]clawctl status[/bold]")
         raise typer.Exit(1)
-    secrets_mgr = SecretsManager(Paths(cfg.clawctl.data_root, cfg.clawctl.build_root))
+    paths = get_paths(cfg)
     statuses = docker.get_all_statuses()
-    tailscale_ip = _get_tailscale_ip()
+
+    # Tokens and Tailscale addresses only feed the URLs of running containers
+    running = [name for name, info in statuses.items() if info["status"] == "running"]
+    tokens: dict[str, str] = {}
+    tailscale_ip = None
+    if running:
+        tokens = SecretsManager(paths).read_secrets_bulk(
+            running, GATEWAY_TOKEN_SECRET_NAME, "gateway_token"
+        )
+        tailscale_ip = get_tailscale_ip()
 
     # Collect URLs for full display
     full_urls = {}
 
-    # Create compact table
-    table = Table(title="Container Status")
-    table.add_column("User", style="bold")
-    table.add_column("Status")
-    table.add_column("Port")
-
+    rows = []
     for user in cfg.users:
         info = statuses.get(user.name, {"status": "unknown", "port": "-"})
         st = info["status"]
-        style = "green" if st == "running" else "red" if st == "exited" else "dim"
-        port = info["port"] if info["port"] != "-" else "-"
+        port = info["port"]
+        rows.append((user.name, styled_status(st), str(port)))
 
         # Collect full URLs for printing below
         if st == "running" and port != "-":
-            token = secrets_mgr.read_secret(user.name, GATEWAY_TOKEN_SECRET_NAME)
-            if not token:
-                token = secrets_mgr.read_secret(user.name, "gateway_token")
-            
+            token = tokens.get(user.name)
+
             # Check if Tailscale Serve is enabled
-            paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
             tailscale_serve_enabled = _is_tailscale_serve_enabled(user.name, paths)
-            tailscale_hostname = _get_tailscale_hostname() if tailscale_serve_enabled else None
+            tailscale_hostname = get_tailscale_hostname() if tailscale_serve_enabled else None
             
             urls = []
             if token:
@@ -144,11 +110,15 @@ def status(
                 urls.append(f"http://localhost:{port}")
             full_urls[user.name] = urls
 
-        table.add_row(
-            user.name,
-            f"[{style}]{st}[/{style}]",
-            str(port),
-        )
+    # Create compact table
+    from rich.table import Table
+
+    table = Table(title="Container Status")
+    table.add_column("User", style="bold")
+    table.add_column("Status")
+    table.add_column("Port")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     
@@ -6,12 +6,8 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from clawlib.core.config import load_config_or_exit
-from clawlib.core.docker_manager import DockerManager
-
-console = Console()
+from clawctl.utils.console import get_console, spinner
 
 
 def update(
@@ -19,14 +15,20 @@ def update(
         Optional[Path],
         typer.Option("--config", "-c", help="Path to clawctl.toml"),
     ] = None,
+    parallel: Annotated[
+        bool,
+        typer.Option("--parallel/--serial", help="Recreate containers concurrently or one at a time (rolling)"),
+    ] = False,
 ) -> None:
     """Rebuild the Docker image and recreate all containers.
 
     Uses the openclaw_version from the config file. Update the version
     in clawctl.toml before running this command.
     """
+    from clawlib.core.config import load_config_or_exit
+
+    console = get_console()
     cfg = load_config_or_exit(config)
-    docker = DockerManager(cfg)
 
     console.print(
         f"Updating to OpenClaw [bold]{cfg.clawctl.openclaw_version}[/bold]..."
@@ -35,8 +37,12 @@ def update(
     if not typer.confirm("This will rebuild the image and restart all containers. Continue?"):
         raise typer.Abort()
 
-    with console.status("Rebuilding image and restarting containers..."):
-        updated = docker.rebuild_all()
+    from clawlib.core.docker_manager import DockerManager
+
+    docker = DockerManager(cfg)
+
+    with spinner(console, "Rebuilding image and restarting containers..."):
+        updated = docker.rebuild_all(parallel=parallel)
 
     if updated:
         console.print(
@@ -6,17 +6,47 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from clawlib.core.config import load_config_or_exit
-from clawlib.core.docker_manager import DockerManager
-from clawlib.core.secrets import SecretsManager
-from clawlib.core.paths import Paths
-from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME, UserManager
-from clawctl.commands.gog import _get_docker_client, run_gog_auth
+from clawctl.utils.console import get_console, spinner, styled_status
 
-console = Console()
+
+def _prompt_secrets(required: list[tuple[str, str]], existing: set[str]) -> dict[str, str]:
+    """Show all required secrets up front, then read the values to write.
+
+    Secrets in *existing* are only replaced after confirmation.  Values are
+    read with :func:`getpass.getpass`; empty input skips the secret.
+    """
+    import getpass
+
+    from rich.table import Table
+
+    console = get_console()
+    table = Table(title="Required secrets")
+    table.add_column("Secret", style="bold")
+    table.add_column("Description")
+    table.add_column("Status")
+    for secret_name, description in required:
+        status = "[green]set[/green]" if secret_name in existing else "[yellow]missing[/yellow]"
+        table.add_row(secret_name, description, status)
+    console.print(table)
+
+    values: dict[str, str] = {}
+    for secret_name, description in required:
+        try:
+            if secret_name in existing and not typer.confirm(
+                f"  Overwrite existing '{secret_name}'?", default=False
+            ):
+                continue
+            value = getpass.getpass(f"  Enter {description} ({secret_name}): ")
+        except (KeyboardInterrupt, EOFError):
+            console.print("\n[yellow]Aborted by user[/yellow]")
+            raise typer.Abort()
+
+        if not value.strip():
+            console.print(f"  [yellow]Empty value provided, skipping '{secret_name}'[/yellow]")
+            continue
+        values[secret_name] = value.strip()
+    return values
 
 
 def user_add(
@@ -31,6 +61,12 @@ def user_add(
     ] = False,
 ) -> None:
     """Provision a new user: create directories, write secrets, start container."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+    from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME, UserManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     user = cfg.get_user(name)
 
@@ -42,7 +78,7 @@ def user_add(
         raise typer.Exit(1)
 
     manager = UserManager(cfg)
-    secrets_mgr = SecretsManager(Paths(cfg.clawctl.data_root, cfg.clawctl.build_root))
+    secrets_mgr = SecretsManager(get_paths(cfg))
 
     # Collect required secrets
     required = secrets_mgr.get_required_secrets(user, cfg.clawctl.defaults)
@@ -51,64 +87,28 @@ def user_add(
     console.print(f"Provisioning user [bold]{name}[/bold]...")
     console.print()
 
+    # One directory scan answers "already set?" for every required secret
+    existing = set(secrets_mgr.list_secrets(name))
+
     if non_interactive:
         # Non-interactive: skip all prompts, use only existing secrets
         console.print("  [dim]Non-interactive mode: using existing secrets, skipping prompts.[/dim]")
         for secret_name, description in required:
-            if secrets_mgr.secret_exists(name, secret_name):
+            if secret_name in existing:
                 console.print(f"  [dim]Using existing secret '{secret_name}'[/dim]")
             else:
                 console.print(f"  [yellow]Secret '{secret_name}' not found — skipping (set it later with set-* scripts)[/yellow]")
-    else:
-        for secret_name, description in required:
-            # Check if secret already exists
-            if secrets_mgr.secret_exists(name, secret_name):
-                console.print(
-                    f"  [yellow]Secret '{secret_name}' ({description}) already exists.[/yellow]"
-                )
-                try:
-                    overwrite = typer.confirm(
-                        "  Do you want to overwrite it?",
-                        default=False,
-                    )
-                except (KeyboardInterrupt, EOFError):
-                    console.print("\n[yellow]Aborted by user[/yellow]")
-                    raise typer.Abort()
-                except Exception as e:
-                    # Handle any unexpected input errors
-                    console.print(f"  [red]Error reading input: {e}[/red]")
-                    console.print("  [dim]Skipping this secret. Run the command again to retry.[/dim]")
-                    continue
-                
-                if not overwrite:
-                    console.print(f"  [dim]Skipping '{secret_name}'[/dim]")
-                    continue
-
-            try:
-                value = typer.prompt(
-                    f"  Enter {description} ({secret_name})",
-                    hide_input=True,
-                )
-            except (KeyboardInterrupt, EOFError):
-                console.print("\n[yellow]Aborted by user[/yellow]")
-                raise typer.Abort()
-            except Exception as e:
-                console.print(f"  [red]Error reading input: {e}[/red]")
-                console.print(f"  [dim]Skipping '{secret_name}'[/dim]")
-                continue
-                
-            if not value or not value.strip():
-                console.print(f"  [yellow]Empty value provided, skipping '{secret_name}'[/yellow]")
-                continue
-            secret_values[secret_name] = value.strip()
+    elif required:
+        secret_values = _prompt_secrets(required, existing)
 
     console.print()
 
-    with console.status("Building image and starting container..."):
+    with spinner(console, "Building image and starting container..."):
         manager.provision_user(user, secret_values)
 
-    docker = DockerManager(cfg)
-    port = docker.get_container_port(name)
+    # Reuse the manager's DockerManager (and its client) for the dashboard
+    # port and the gog pre-check below
+    port = manager.docker.get_container_port(name)
     token = secrets_mgr.read_secret(name, GATEWAY_TOKEN_SECRET_NAME)
     console.print(f"[green]User '{name}' provisioned successfully.[/green]")
     if port:
@@ -122,9 +122,7 @@ def user_add(
         console.print()
         
         # Check container status before attempting gog auth
-        docker_mgr = DockerManager(cfg)
-        container_status = docker_mgr.get_container_status(name)
-        
+        container_status = manager.docker.get_container_status(name)
         if container_status != "running":
             console.print(
                 f"  [yellow]Container is not running (status: {container_status}).[/yellow]"
@@ -136,6 +134,8 @@ def user_add(
             f"  Run gog Gmail authorization for {user.skills.gog.email} now?",
             default=True,
         ):
+            from clawctl.commands.gog import _get_docker_client, run_gog_auth
+
             gog_client = _get_docker_client(cfg)
             try:
                 run_gog_auth(name, user.skills.gog.email, gog_client, secrets_mgr=secrets_mgr)
@@ -161,9 +161,7 @@ def user_remove(
     ] = None,
 ) -> None:
     """Remove a user's container and network."""
-    cfg = load_config_or_exit(config)
-    manager = UserManager(cfg)
-
+    console = get_console()
     if not keep_data:
         if not typer.confirm(
             f"This will permanently delete all data for '{name}'. Continue?",
@@ -171,7 +169,13 @@ def user_remove(
         ):
             raise typer.Abort()
 
-    with console.status(f"Removing user '{name}'..."):
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.user_manager import UserManager
+
+    cfg = load_config_or_exit(config)
+    manager = UserManager(cfg)
+
+    with spinner(console, f"Removing user '{name}'..."):
         manager.remove_user(name, keep_data=keep_data)
 
     action = "removed (data kept)" if keep_data else "removed with all data"
@@ -185,41 +189,47 @@ def user_list(
     ] = None,
 ) -> None:
     """List all configured users and their container status."""
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+    from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     docker = DockerManager(cfg)
-    secrets_mgr = SecretsManager(Paths(cfg.clawctl.data_root, cfg.clawctl.build_root))
     statuses = docker.get_all_statuses()
 
-    table = Table(title="Users")
-    table.add_column("Name", style="bold")
-    table.add_column("Status")
-    table.add_column("Channels")
-    table.add_column("URL")
+    # Only running containers get a URL, so only their tokens are needed
+    running = [name for name, info in statuses.items() if info["status"] == "running"]
+    tokens: dict[str, str] = {}
+    if running:
+        secrets_mgr = SecretsManager(get_paths(cfg))
+        tokens = secrets_mgr.read_secrets_bulk(running, GATEWAY_TOKEN_SECRET_NAME)
 
+    rows = []
     for user in cfg.users:
         info = statuses.get(user.name, {"status": "unknown", "port": "-"})
         st = info["status"]
-        style = "green" if st == "running" else "red" if st == "exited" else "dim"
-
-        channels = []
-        if user.channels.slack.enabled:
-            channels.append("slack")
-        if user.channels.discord.enabled:
-            channels.append("discord")
 
         url = "-"
         if st == "running" and info["port"] != "-":
-            token = secrets_mgr.read_secret(user.name, GATEWAY_TOKEN_SECRET_NAME)
+            token = tokens.get(user.name)
             url = f"http://localhost:{info['port']}"
             if token:
                 url += f"?token={token}"
 
-        table.add_row(
-            user.name,
-            f"[{style}]{st}[/{style}]",
-            ", ".join(channels) or "-",
-            url,
-        )
+        rows.append((user.name, styled_status(st), ", ".join(user.channels.enabled_names()) or "-", url))
+
+    from rich.table import Table
+
+    table = Table(title="Users")
+    table.add_column("Name", style="bold")
+    table.add_column("Status")
+    table.add_column("Channels")
+    table.add_column("URL")
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -244,6 +254,12 @@ def user_set_slack(
     Prompts for tokens interactively if not provided via options.
     After setting tokens, regenerates openclaw.json and restarts the container.
     """
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     user = cfg.get_user(name)
     
@@ -279,7 +295,7 @@ def user_set_slack(
         raise typer.Exit(1)
     
     # Write secrets
-    paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
+    paths = get_paths(cfg)
     secrets_mgr = SecretsManager(paths)
     
     bot_token_secret_name = user.channels.slack.bot_token_secret or "slack_bot_token"
@@ -335,6 +351,12 @@ def user_set_discord(
     Prompts for token interactively if not provided via option.
     After setting token, regenerates openclaw.json and restarts the container.
     """
+    from clawlib.core.config import load_config_or_exit
+    from clawlib.core.docker_manager import DockerManager
+    from clawlib.core.paths import get_paths
+    from clawlib.core.secrets import SecretsManager
+
+    console = get_console()
     cfg = load_config_or_exit(config)
     user = cfg.get_user(name)
     
@@ -364,7 +386,7 @@ def user_set_discord(
         raise typer.Exit(1)
     
     # Write secret
-    paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
+    paths = get_paths(cfg)
     secrets_mgr = SecretsManager(paths)
     
     token_secret_name = user.channels.discord.token_secret or "discord_token"
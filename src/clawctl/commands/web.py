@@ -15,7 +15,7 @@ import typer
 from rich.console import Console
 
 from clawlib.core.config import find_config_path, load_config_or_exit
-from clawlib.core.paths import Paths
+from clawlib.core.paths import get_paths
 
 console = Console()
 
@@ -101,7 +101,7 @@ def web_set_password(
 ) -> None:
     """Set or change the web admin password (stored as bcrypt hash in data/secrets/)."""
     cfg = load_config_or_exit(config)
-    paths = Paths(cfg.clawctl.data_root, cfg.clawctl.build_root)
+    paths = get_paths(cfg)
     
     # Get password
     if password:
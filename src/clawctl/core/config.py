@@ -45,53 +45,20 @@ def load_config(path: Path) -> Config:
         raise FileNotFoundError(msg)
 
     config_dir = path.resolve().parent
-    text = path.read_text()
 
     try:
-        raw = tomllib.loads(text)
+        with path.open("rb") as f:
+            raw = tomllib.load(f)
     except tomllib.TOMLDecodeError as e:
         msg = f"Invalid TOML in {path}: {e}"
         raise ValueError(msg) from e
 
     try:
-        config = Config.model_validate(raw)
+        config = Config.model_validate(raw, context={"config_dir": config_dir})
     except ValidationError as e:
         msg = f"Config validation failed:\n{e}"
         raise ValueError(msg) from e
 
-    # Resolve data_root and build_root relative to the config file's directory
-    for attr in ("data_root", "build_root"):
-        value = getattr(config.clawctl, attr)
-        if not value.is_absolute():
-            setattr(config.clawctl, attr, (config_dir / value).resolve())
-        else:
-            setattr(config.clawctl, attr, value.expanduser().resolve())
-
-    # Resolve knowledge_dir relative to data_root if not absolute
-    if config.clawctl.knowledge_dir is not None:
-        kd = config.clawctl.knowledge_dir
-        if not kd.is_absolute():
-            # Resolve relative to data_root
-            config.clawctl.knowledge_dir = config.clawctl.data_root / kd
-        else:
-            config.clawctl.knowledge_dir = kd.expanduser().resolve()
-
-    # Resolve workspace_template paths (global default and per-user)
-    if config.clawctl.defaults.workspace_template is not None:
-        wt = config.clawctl.defaults.workspace_template
-        if not wt.is_absolute():
-            config.clawctl.defaults.workspace_template = (config_dir / wt).resolve()
-        else:
-            config.clawctl.defaults.workspace_template = wt.expanduser().resolve()
-
-    for user in config.users:
-        if user.workspace_template is not None:
-            wt = user.workspace_template
-            if not wt.is_absolute():
-                user.workspace_template = (config_dir / wt).resolve()
-            else:
-                user.workspace_template = wt.expanduser().resolve()
-
     return config
 
 
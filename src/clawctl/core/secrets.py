@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import stat
+import tempfile
 from pathlib import Path
 
 from clawlib.core.paths import Paths
@@ -33,12 +34,50 @@ class SecretsManager:
         """
         secret_dir = self.paths.user_secrets_dir(username)
         secret_dir.mkdir(parents=True, exist_ok=True)
+        return self._write_secret_file(secret_dir / name, value)
 
-        secret_file = secret_dir / name
+    def write_secrets(self, username: str, values: dict[str, str]) -> list[Path]:
+        """Write several secrets for one user, creating the directory only once.
+
+        Returns the paths of the written secret files, in the order of *values*.
+        """
+        if not values:
+            return []
+        secret_dir = self.paths.user_secrets_dir(username)
+        secret_dir.mkdir(parents=True, exist_ok=True)
+        return [self._write_secret_file(secret_dir / name, value) for name, value in values.items()]
+
+    @staticmethod
+    def _write_secret_file(secret_file: Path, value: str) -> Path:
         secret_file.write_text(value)
         os.chmod(secret_file, stat.S_IRUSR | stat.S_IWUSR)  # 0600
         return secret_file
 
+    def write_secret_if_absent(self, username: str, name: str, value: str) -> bool:
+        """Publish a secret only if no file exists yet, atomically.
+
+        The value is written to a temporary file in the secrets directory and
+        then hard-linked into place, so the secret never appears empty or half
+        written and an existing file is never replaced.
+
+        Returns True if *value* was published, False if the secret already existed.
+        """
+        secret_dir = self.paths.user_secrets_dir(username)
+        secret_dir.mkdir(parents=True, exist_ok=True)
+
+        # mkstemp creates the file with mode 0600
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{name}.", dir=secret_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(value)
+            try:
+                os.link(tmp_name, secret_dir / name)
+            except FileExistsError:
+                return False
+            return True
+        finally:
+            os.unlink(tmp_name)
+
     def read_secret(self, username: str, name: str) -> str | None:
         """Read a secret value. Returns None if the file doesn't exist."""
         secret_file = self.paths.user_secrets_dir(username) / name
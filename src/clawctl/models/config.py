@@ -110,6 +110,10 @@ class UserGitConfig(BaseModel):
     repos: list[GitRepoConfig] = Field(default_factory=list)
 
 
+# Usernames become container, network and directory names
+_USERNAME_RE = re.compile(r"[a-z0-9][a-z0-9-]{0,31}")
+
+
 class UserConfig(BaseModel):
     name: str
     channels: ChannelsConfig = ChannelsConfig()
@@ -122,7 +126,7 @@ class UserConfig(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not re.match(r"^[a-z0-9][a-z0-9-]{0,31}$", v):
+        if _USERNAME_RE.fullmatch(v) is None:
             msg = "Username must be 1-32 lowercase alphanumeric characters or hyphens, starting with alphanumeric"
             raise ValueError(msg)
         return v
@@ -1,6 +1,114 @@
-"""Shared Rich console for consistent output."""
+"""Shared Rich console for consistent output.
 
-from rich.console import Console
+The consoles are created on first use: constructing a Rich ``Console``
+imports a large part of Rich and probes the terminal, which commands
+that never print should not pay for.
 
-console = Console()
-err_console = Console(stderr=True)
+When the stream is not a terminal (pipes, cron, systemd, CI) styling is
+discarded anyway, so a :class:`PlainConsole` that strips markup and
+writes with ``print`` is used instead.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from contextlib import nullcontext
+from functools import cache
+from typing import TYPE_CHECKING, Any, ContextManager
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Same tag syntax Rich's markup parser recognises, with optional escaping backslashes
+_MARKUP_TAG = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
+
+
+def strip_markup(text: str) -> str:
+    """Remove Rich markup tags from *text*, honouring ``\\[`` escapes."""
+
+    def replace(match: re.Match[str]) -> str:
+        backslashes, tag = match.groups()
+        if len(backslashes) % 2:
+            return f"{backslashes[:-1]}[{tag}]"
+        return backslashes
+
+    return _MARKUP_TAG.sub(replace, text)
+
+
+class PlainConsole:
+    """Minimal stand-in for ``rich.console.Console`` for non-terminal output.
+
+    Strings are printed without markup; anything else (tables, panels)
+    is handed to a real Rich console, which renders it without ANSI codes.
+    """
+
+    is_terminal = False
+
+    def __init__(self, *, stderr: bool = False) -> None:
+        self.stderr = stderr
+        self._rich_console: Console | None = None
+
+    @property
+    def file(self):
+        return sys.stderr if self.stderr else sys.stdout
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", **kwargs: Any) -> None:
+        if all(isinstance(obj, str) for obj in objects):
+            print(sep.join(strip_markup(obj) for obj in objects), end=end, file=self.file)
+        else:
+            self._rich().print(*objects, sep=sep, end=end, **kwargs)
+
+    def status(self, *args: Any, **kwargs: Any) -> ContextManager[None]:
+        """No spinner when nobody is watching."""
+        return nullcontext()
+
+    def _rich(self) -> Console:
+        if self._rich_console is None:
+            from rich.console import Console
+
+            self._rich_console = Console(stderr=self.stderr)
+        return self._rich_console
+
+
+# Markup style for each container state; anything else is dimmed
+_STATUS_STYLES = {"running": "green", "exited": "red"}
+
+
+def styled_status(status: str) -> str:
+    """Return a container *status* wrapped in its Rich markup style."""
+    style = _STATUS_STYLES.get(status, "dim")
+    return f"[{style}]{status}[/{style}]"
+
+
+def spinner(console: Console | PlainConsole, message: str) -> ContextManager[Any]:
+    """``console.status(message)`` on a terminal, otherwise a no-op context.
+
+    Rich's status spinner runs a background render thread; when output goes
+    to a log file or pipe it only writes control sequences nobody sees.
+    """
+    if not console.is_terminal:
+        return nullcontext()
+    return console.status(message)
+
+
+@cache
+def get_console() -> Console | PlainConsole:
+    """Return the shared stdout console."""
+    if not sys.stdout.isatty():
+        return PlainConsole()
+
+    from rich.console import Console
+
+    return Console()
+
+
+@cache
+def get_err_console() -> Console | PlainConsole:
+    """Return the shared stderr console."""
+    if not sys.stderr.isatty():
+        return PlainConsole(stderr=True)
+
+    from rich.console import Console
+
+    return Console(stderr=True)
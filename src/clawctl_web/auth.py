@@ -2,34 +2,54 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import bcrypt
 from fastapi import HTTPException, Security, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
-from clawlib.core.config import find_config_path, load_config
-from clawlib.core.paths import Paths
+from clawlib.core.config import find_config_path, load_config_cached
+from clawlib.core.paths import get_paths
+
+if TYPE_CHECKING:
+    from clawlib.models.config import Config
 
 logger = logging.getLogger(__name__)
 security = HTTPBasic()
 
+# Basic Auth resends the password with every request and bcrypt is slow by
+# design, so successful checks are remembered for a short while, keyed on a
+# hash of the password keyed with the stored bcrypt hash
+_VERIFIED_TTL = 30.0
+_verified: dict[bytes, float] = {}  # key -> monotonic expiry
+# Sync endpoints authenticate on FastAPI's threadpool
+_verified_lock = threading.Lock()
+
+# password file path -> ((mtime_ns, size, inode), stored hash)
+_stored_hashes: dict[Path, tuple[tuple[int, int, int], bytes]] = {}
+
+
+def _password_file_for(config: Config) -> Path:
+    """Get the path to the password file for a loaded config."""
+    return get_paths(config).data_root / "secrets" / "web_admin" / "password"
+
 
 def _get_password_file_path() -> Path:
     """Get the path to the password file."""
     config_path_resolved = find_config_path()
     if not config_path_resolved:
         raise ValueError("Configuration file not found")
-    config = load_config(config_path_resolved)
-    paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
-    return paths.data_root / "secrets" / "web_admin" / "password"
+    return _password_file_for(load_config_cached(config_path_resolved))
 
 
-def _ensure_password_file(password: str) -> None:
+def _ensure_password_file(password: str, password_file: Path) -> None:
     """Ensure password file exists, creating it if needed."""
-    password_file = _get_password_file_path()
     password_file.parent.mkdir(parents=True, exist_ok=True)
 
     if not password_file.exists():
@@ -39,14 +59,48 @@ def _ensure_password_file(password: str) -> None:
         password_file.chmod(0o600)
 
 
-def verify_password(credentials: HTTPBasicCredentials) -> bool:
-    """Verify HTTP Basic Auth credentials against stored password."""
-    try:
-        password_file = _get_password_file_path()
-        logger.debug(f"Password file path: {password_file}")
-    except ValueError as e:
-        logger.error(f"Failed to get password file path: {e}")
-        return False
+def _read_stored_hash(password_file: Path) -> bytes:
+    """Read the bcrypt hash from *password_file*, rereading only when it changes."""
+    st = password_file.stat()
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _stored_hashes.get(password_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    stored_hash = password_file.read_bytes()
+    _stored_hashes[password_file] = (stamp, stored_hash)
+    return stored_hash
+
+
+def _verified_key(password: bytes, stored_hash: bytes) -> bytes:
+    # blake2b keys are limited to 64 bytes; bcrypt hashes are 60
+    return hashlib.blake2b(password, key=stored_hash[:64], digest_size=16).digest()
+
+
+def _is_verified(key: bytes) -> bool:
+    with _verified_lock:
+        return _verified.get(key, 0.0) > time.monotonic()
+
+
+def _remember_verified(key: bytes) -> None:
+    now = time.monotonic()
+    with _verified_lock:
+        for stale in [k for k, expiry in _verified.items() if expiry <= now]:
+            del _verified[stale]
+        _verified[key] = now + _VERIFIED_TTL
+
+
+def verify_password(credentials: HTTPBasicCredentials, password_file: Path | None = None) -> bool:
+    """Verify HTTP Basic Auth credentials against stored password.
+
+    *password_file* is looked up from the config when not given.
+    """
+    if password_file is None:
+        try:
+            password_file = _get_password_file_path()
+        except ValueError as e:
+            logger.error(f"Failed to get password file path: {e}")
+            return False
+    logger.debug(f"Password file path: {password_file}")
 
     if not password_file.exists():
         logger.warning(f"Password file does not exist: {password_file}")
@@ -54,7 +108,7 @@ def verify_password(credentials: HTTPBasicCredentials) -> bool:
         env_password = os.environ.get("WEB_ADMIN_PASSWORD")
         if env_password:
             logger.info("Creating password file from WEB_ADMIN_PASSWORD environment variable")
-            _ensure_password_file(env_password)
+            _ensure_password_file(env_password, password_file)
         else:
             logger.error("Password file not found and WEB_ADMIN_PASSWORD not set")
             raise HTTPException(
@@ -63,7 +117,7 @@ def verify_password(credentials: HTTPBasicCredentials) -> bool:
             )
 
     try:
-        stored_hash = password_file.read_bytes()
+        stored_hash = _read_stored_hash(password_file)
         logger.debug(f"Read password hash, length: {len(stored_hash)} bytes")
         
         # Verify it's a valid bcrypt hash format (starts with $2a$, $2b$, or $2y$)
@@ -71,10 +125,15 @@ def verify_password(credentials: HTTPBasicCredentials) -> bool:
             logger.error(f"Invalid bcrypt hash format. First 20 bytes: {stored_hash[:20]}")
             return False
         
-        # Check password
+        # Check password; only successes are cached, so guesses always pay for bcrypt
         password_bytes = credentials.password.encode("utf-8")
+        key = _verified_key(password_bytes, stored_hash)
+        if _is_verified(key):
+            return True
         result = bcrypt.checkpw(password_bytes, stored_hash)
         logger.debug(f"Password verification result: {result}")
+        if result:
+            _remember_verified(key)
         return result
     except ValueError as e:
         logger.error(f"bcrypt ValueError: {e}")
@@ -95,7 +154,7 @@ def get_current_user(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     from clawlib.models.config import WebConfig
     
     web_config = getattr(config, 'web', None) or WebConfig()
@@ -111,7 +170,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Basic"},
         )
 
-    if not verify_password(credentials):
+    if not verify_password(credentials, _password_file_for(config)):
         logger.warning(f"Password verification failed for user: {credentials.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
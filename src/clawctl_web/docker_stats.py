@@ -13,29 +13,32 @@ def get_container_stats(docker_mgr: DockerManager, username: str) -> dict[str, A
     """Get current stats for a container."""
     try:
         container_name = f"openclaw-{username}"
-        container = docker_mgr.client.containers.get(container_name)
-        stats = container.stats(stream=False)
+        # Ask the low-level API directly: containers.get() would first inspect
+        # the container, an extra round trip just to build a Container object
+        stats = docker_mgr.client.api.stats(container_name, stream=False)
+
+        cpu = stats["cpu_stats"]
+        precpu = stats["precpu_stats"]
+        cpu_usage = cpu["cpu_usage"]
 
         # Calculate CPU percentage
         # Use online_cpus if available; fall back to percpu_usage length (absent on some Docker versions)
-        cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - stats["precpu_stats"]["cpu_usage"]["total_usage"]
-        system_delta = stats["cpu_stats"].get("system_cpu_usage", 0) - stats["precpu_stats"].get("system_cpu_usage", 0)
-        num_cpus = (
-            stats["cpu_stats"].get("online_cpus")
-            or len(stats["cpu_stats"]["cpu_usage"].get("percpu_usage") or [])
-            or 1
-        )
+        cpu_delta = cpu_usage["total_usage"] - precpu["cpu_usage"]["total_usage"]
+        system_delta = cpu.get("system_cpu_usage", 0) - precpu.get("system_cpu_usage", 0)
+        num_cpus = cpu.get("online_cpus") or len(cpu_usage.get("percpu_usage") or []) or 1
         cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0 if system_delta > 0 else 0.0
 
         # Memory stats
-        memory_usage = stats["memory_stats"].get("usage", 0)
-        memory_limit = stats["memory_stats"].get("limit", 0)
+        memory = stats["memory_stats"]
+        memory_usage = memory.get("usage", 0)
+        memory_limit = memory.get("limit", 0)
         memory_percent = (memory_usage / memory_limit * 100.0) if memory_limit > 0 else 0.0
 
-        # Network stats
-        networks = stats.get("networks", {})
-        network_rx = sum(net.get("rx_bytes", 0) for net in networks.values())
-        network_tx = sum(net.get("tx_bytes", 0) for net in networks.values())
+        # Network stats, summed over interfaces in one pass
+        network_rx = network_tx = 0
+        for net in stats.get("networks", {}).values():
+            network_rx += net.get("rx_bytes", 0)
+            network_tx += net.get("tx_bytes", 0)
 
         return {
             "cpu_percent": round(cpu_percent, 2),
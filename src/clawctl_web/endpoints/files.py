@@ -7,9 +7,9 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.file_manager import FileManager
-from clawlib.core.paths import Paths
+from clawlib.core.paths import get_paths
 
 router = APIRouter()
 
@@ -21,8 +21,8 @@ def _get_file_manager(config_path: Path | None = None) -> FileManager:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
-    paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+    config = load_config_cached(config_path_resolved)
+    paths = get_paths(config)
     return FileManager(paths)
 
 
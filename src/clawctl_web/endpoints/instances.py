@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.docker_manager import DockerManager
-from clawlib.core.paths import Paths
+from clawlib.core.openclaw_config import get_tailscale_hostname, get_tailscale_ip
+from clawlib.core.paths import Paths, get_paths
 from clawlib.core.secrets import SecretsManager
 from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME, UserManager
 import json
@@ -18,43 +18,6 @@ import json
 router = APIRouter()
 
 
-def _get_tailscale_ip() -> str | None:
-    """Get Tailscale IPv4 address if available."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "ip", "-4"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=2,
-        )
-        ip = result.stdout.strip()
-        return ip if ip else None
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return None
-
-
-def _get_tailscale_hostname() -> str | None:
-    """Get Tailscale MagicDNS hostname if available."""
-    try:
-        result = subprocess.run(
-            ["tailscale", "status", "--json"],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=2,
-        )
-        status_data = json.loads(result.stdout)
-        self_info = status_data.get("Self", {})
-        dns_name = self_info.get("DNSName", "")
-        # Remove trailing dot if present (DNS FQDN format, but breaks URLs)
-        if dns_name:
-            dns_name = dns_name.rstrip(".")
-        return dns_name if dns_name else None
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
-        return None
-
-
 def _is_tailscale_serve_enabled(username: str, paths: Paths) -> bool:
     """Check if Tailscale Serve is enabled for a user by reading their openclaw.json."""
     try:
@@ -77,21 +40,21 @@ def _get_docker_manager(config_path: Path | None = None) -> DockerManager:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     return DockerManager(config)
 
 
 @router.get("/")
-async def list_instances(
+def list_instances(
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
 ):
     """Get status of all instances."""
     docker_mgr = _get_docker_manager(config_path)
-    config = load_config(find_config_path(config_path))
-    paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+    config = load_config_cached(find_config_path(config_path))
+    paths = get_paths(config)
     secrets_mgr = SecretsManager(paths)
-    tailscale_ip = _get_tailscale_ip()
+    tailscale_ip = get_tailscale_ip()
     statuses = docker_mgr.get_all_statuses()
 
     # Get all configured users
@@ -125,6 +88,12 @@ async def list_instances(
         # If we can't list containers, just use configured users
         pass
 
+    # Only instances with a published port get management URLs, so only
+    # their tokens are needed; read them all in one pass over the secrets
+    with_port = [name for name, info in statuses.items() if info["port"] != "-"]
+    with_port += [name for name, info in orphaned_containers.items() if info["port"]]
+    tokens = secrets_mgr.read_secrets_bulk(with_port, GATEWAY_TOKEN_SECRET_NAME, "gateway_token")
+
     result = []
     # Add configured users
     for username, user in configured_users.items():
@@ -134,15 +103,7 @@ async def list_instances(
         # Get management URLs
         management_urls = []
         if port:
-            try:
-                gateway_token = secrets_mgr.read_secret(username, GATEWAY_TOKEN_SECRET_NAME)
-            except PermissionError:
-                gateway_token = None
-            if not gateway_token:
-                try:
-                    gateway_token = secrets_mgr.read_secret(username, "gateway_token")
-                except PermissionError:
-                    gateway_token = None
+            gateway_token = tokens.get(username)
             
             # basePath is always set for reverse-proxy setups (/gateway/{username})
             base_path = f"/gateway/{username}"
@@ -156,7 +117,7 @@ async def list_instances(
                     qs = urlencode({"token": gateway_token, "gatewayUrl": ws_url})
                     management_urls.append(f"https://{tailscale_ip}{base_path}/?{qs}")
                 # Also offer the .ts.net hostname for MagicDNS clients
-                tailscale_hostname = _get_tailscale_hostname()
+                tailscale_hostname = get_tailscale_hostname()
                 if tailscale_hostname:
                     ws_url = f"wss://{tailscale_hostname}{base_path}"
                     qs = urlencode({"token": gateway_token, "gatewayUrl": ws_url})
@@ -165,7 +126,7 @@ async def list_instances(
             else:
                 if tailscale_ip:
                     management_urls.append(f"https://{tailscale_ip}{base_path}/")
-                tailscale_hostname = _get_tailscale_hostname()
+                tailscale_hostname = get_tailscale_hostname()
                 if tailscale_hostname:
                     management_urls.append(f"https://{tailscale_hostname}{base_path}/")
                 management_urls.append(f"http://localhost:{port}{base_path}/")
@@ -204,15 +165,7 @@ async def list_instances(
         port = info["port"]
         management_urls = []
         if port:
-            try:
-                gateway_token = secrets_mgr.read_secret(username, GATEWAY_TOKEN_SECRET_NAME)
-            except PermissionError:
-                gateway_token = None
-            if not gateway_token:
-                try:
-                    gateway_token = secrets_mgr.read_secret(username, "gateway_token")
-                except PermissionError:
-                    gateway_token = None
+            gateway_token = tokens.get(username)
             
             if gateway_token:
                 token_param = f"?token={gateway_token}"
@@ -243,19 +196,18 @@ async def list_instances(
 
 
 @router.get("/{username}/status")
-async def get_instance_status(
+def get_instance_status(
     username: str,
     _user: str = Depends(get_current_user),
 ):
     """Get status of a specific instance."""
     docker_mgr = _get_docker_manager()
-    config = load_config(find_config_path())
-    paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+    config = load_config_cached(find_config_path())
+    paths = get_paths(config)
     secrets_mgr = SecretsManager(paths)
-    tailscale_ip = _get_tailscale_ip()
+    tailscale_ip = get_tailscale_ip()
     
-    status_val = docker_mgr.get_container_status(username)
-    port = docker_mgr.get_container_port(username) if status_val == "running" else None
+    status_val, port = docker_mgr.get_container_info(username)
     
     # Get management URLs
     management_urls = []
@@ -297,13 +249,13 @@ async def get_instance_status(
 
 
 @router.post("/{username}/start")
-async def start_instance(
+def start_instance(
     username: str,
     _user: str = Depends(get_current_user),
 ):
     """Start an instance."""
     docker_mgr = _get_docker_manager()
-    config = load_config(find_config_path())
+    config = load_config_cached(find_config_path())
 
     if not config.get_user(username):
         raise HTTPException(
@@ -338,7 +290,7 @@ async def start_instance(
 
 
 @router.post("/{username}/stop")
-async def stop_instance(
+def stop_instance(
     username: str,
     _user: str = Depends(get_current_user),
 ):
@@ -362,7 +314,7 @@ async def stop_instance(
 
 
 @router.get("/{username}/discord/pairing")
-async def list_discord_pairing(
+def list_discord_pairing(
     username: str,
     _user: str = Depends(get_current_user),
 ):
@@ -378,7 +330,7 @@ async def list_discord_pairing(
 
 
 @router.post("/{username}/discord/pairing/{code}/approve")
-async def approve_discord_pairing(
+def approve_discord_pairing(
     username: str,
     code: str,
     _user: str = Depends(get_current_user),
@@ -400,7 +352,7 @@ async def approve_discord_pairing(
 
 
 @router.post("/{username}/restart")
-async def restart_instance(
+def restart_instance(
     username: str,
     _user: str = Depends(get_current_user),
 ):
@@ -409,7 +361,7 @@ async def restart_instance(
     Regenerates openclaw.json with gateway token authentication before restarting
     to ensure full authentication is set up for gateway URLs and Discord integration.
     """
-    config = load_config(find_config_path())
+    config = load_config_cached(find_config_path())
     user_mgr = UserManager(config)
 
     if not user_mgr.docker.container_exists(username):
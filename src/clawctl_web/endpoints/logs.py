@@ -7,7 +7,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.docker_manager import DockerManager
 
 router = APIRouter()
@@ -21,7 +21,7 @@ def _get_docker_manager(config_path: Path | None = None) -> DockerManager:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     return DockerManager(config)
 
 
@@ -66,7 +66,7 @@ async def stream_logs(
             await websocket.close()
             return
 
-        config = load_config(config_path_resolved)
+        config = load_config_cached(config_path_resolved)
         docker_mgr = DockerManager(config)
 
         if not docker_mgr.container_exists(username):
@@ -9,7 +9,7 @@ from pathlib import Path
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.maintenance_manager import MaintenanceManager
 
 router = APIRouter()
@@ -24,7 +24,7 @@ def _run_cycle_background(config_path: Path) -> None:
     """Run maintenance cycle in background thread."""
     global _cycle_running
     try:
-        config = load_config(config_path)
+        config = load_config_cached(config_path)
         manager = MaintenanceManager(config)
         manager.run_cycle()
     except Exception:
@@ -35,7 +35,7 @@ def _run_cycle_background(config_path: Path) -> None:
 
 
 @router.get("/status")
-async def get_maintenance_status(
+def get_maintenance_status(
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
 ):
@@ -46,7 +46,7 @@ async def get_maintenance_status(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     manager = MaintenanceManager(config)
 
     running = manager.is_daemon_running()
@@ -69,7 +69,7 @@ async def get_maintenance_status(
 
 
 @router.post("/run")
-async def run_maintenance_now(
+def run_maintenance_now(
     background_tasks: BackgroundTasks,
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
@@ -97,7 +97,7 @@ async def run_maintenance_now(
 
 
 @router.post("/schedule/start")
-async def start_maintenance_schedule(
+def start_maintenance_schedule(
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
 ):
@@ -108,7 +108,7 @@ async def start_maintenance_schedule(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     manager = MaintenanceManager(config)
 
     if manager.is_daemon_running():
@@ -132,7 +132,7 @@ async def start_maintenance_schedule(
 
 
 @router.post("/schedule/stop")
-async def stop_maintenance_schedule(
+def stop_maintenance_schedule(
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
 ):
@@ -143,7 +143,7 @@ async def stop_maintenance_schedule(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     manager = MaintenanceManager(config)
 
     stopped = manager.stop_daemon()
@@ -8,7 +8,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 
 router = APIRouter()
 
@@ -229,7 +229,7 @@ async def get_openrouter_models(
     try:
         config_path_resolved = find_config_path()
         if config_path_resolved:
-            config = load_config(config_path_resolved)
+            config = load_config_cached(config_path_resolved)
             web_config = getattr(config, 'web', None)
             if web_config and web_config.model_price_limits:
                 price_limits = web_config.model_price_limits
@@ -277,7 +277,7 @@ async def get_openrouter_models(
         try:
             config_path_resolved = find_config_path()
             if config_path_resolved:
-                config = load_config(config_path_resolved)
+                config = load_config_cached(config_path_resolved)
                 web_config = getattr(config, 'web', None)
                 if web_config and web_config.model_price_limits:
                     formatted_models = _filter_models_by_price(
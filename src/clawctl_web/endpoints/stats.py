@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from clawctl_web.auth import get_current_user
 from clawctl_web.docker_stats import get_container_stats
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.docker_manager import DockerManager
 
 router = APIRouter()
@@ -22,12 +22,12 @@ def _get_docker_manager(config_path: Path | None = None) -> DockerManager:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     return DockerManager(config)
 
 
 @router.get("/{username}")
-async def get_instance_stats(
+def get_instance_stats(
     username: str,
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
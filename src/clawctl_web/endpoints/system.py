@@ -8,14 +8,14 @@ from fastapi import APIRouter, Body, Depends, HTTPException, status
 from pydantic import BaseModel
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.docker_manager import DockerManager
 
 router = APIRouter()
 
 
 @router.get("/config")
-async def get_config(
+def get_config(
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
 ):
@@ -26,7 +26,7 @@ async def get_config(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
 
     # Return sanitized config (no secrets)
     from clawlib.models.config import WebConfig
@@ -64,7 +64,7 @@ async def get_config(
 
 
 @router.post("/update")
-async def trigger_update(
+def trigger_update(
     _user: str = Depends(get_current_user),
 ):
     """Trigger OpenClaw version update (rebuilds image and restarts containers)."""
@@ -74,7 +74,7 @@ async def trigger_update(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     docker_mgr = DockerManager(config)
 
     try:
@@ -83,6 +83,14 @@ async def trigger_update(
             "message": f"Updated {len(updated)} containers",
             "updated": updated,
         }
+    except ExceptionGroup as e:
+        failures = "; ".join(
+            " ".join([str(err), *getattr(err, "__notes__", ())]) for err in e.exceptions
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update: {failures}",
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -97,7 +105,7 @@ class PriceLimitsRequest(BaseModel):
 
 
 @router.put("/price-limits")
-async def update_price_limits(
+def update_price_limits(
     limits: PriceLimitsRequest,
     _user: str = Depends(get_current_user),
 ):
@@ -8,12 +8,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
 from clawctl_web.auth import get_current_user
-from clawlib.core.config import find_config_path, load_config
+from clawlib.core.config import find_config_path, load_config_cached
 from clawlib.core.docker_manager import DockerManager
+from clawlib.core.paths import get_paths
 from clawlib.core.secrets import SecretsManager
 from clawlib.core.openclaw_config import write_openclaw_config, generate_openclaw_config
 import json
-from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME, Paths
+from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME
 
 router = APIRouter()
 
@@ -64,7 +65,7 @@ def _configure_agent_auth(
 
 
 @router.get("/")
-async def list_users(
+def list_users(
     _user: str = Depends(get_current_user),
     config_path: Path | None = None,
 ):
@@ -75,7 +76,7 @@ async def list_users(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Configuration file not found",
         )
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
 
     users_list = []
     for user in config.users:
@@ -105,7 +106,7 @@ class ModelUpdateRequest(BaseModel):
 
 
 @router.patch("/{username}/model")
-async def update_user_model(
+def update_user_model(
     username: str,
     request: ModelUpdateRequest,
     _user: str = Depends(get_current_user),
@@ -119,7 +120,7 @@ async def update_user_model(
             detail="Configuration file not found",
         )
     
-    config = load_config(config_path_resolved)
+    config = load_config_cached(config_path_resolved)
     user = config.get_user(username)
     
     if user is None:
@@ -129,7 +130,7 @@ async def update_user_model(
         )
     
     # Initialize secrets manager for validation
-    paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+    paths = get_paths(config)
     secrets_mgr = SecretsManager(paths)
     
     # Check if model requires OpenRouter and verify API key is configured
@@ -191,7 +192,7 @@ async def update_user_model(
         update_user_model(config_path_resolved, username, request.model)
         
         # Reload config to get updated user
-        config = load_config(config_path_resolved)
+        config = load_config_cached(config_path_resolved)
         user = config.get_user(username)
         if user is None:
             raise HTTPException(
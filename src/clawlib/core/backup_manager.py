@@ -17,6 +17,7 @@ import schedule
 
 from clawctl.core.paths import Paths
 from clawctl.models.config import BackupConfig, Config
+from clawlib.core.daemon import running_pid
 
 logger = logging.getLogger(__name__)
 
@@ -215,22 +216,16 @@ class BackupManager:
         pid_file.unlink(missing_ok=True)
         return True
 
-    def is_daemon_running(self) -> bool:
-        """Check if the backup daemon is currently running."""
-        pid_file = self.paths.backup_pid_file
-
-        if not pid_file.is_file():
-            return False
+    def read_daemon_pid(self) -> int | None:
+        """Return the backup daemon's PID if it is running, else None.
 
-        pid = int(pid_file.read_text().strip())
+        Reads the PID file once; a stale PID file is removed.
+        """
+        return running_pid(self.paths.backup_pid_file)
 
-        try:
-            os.kill(pid, 0)  # signal 0 = check existence
-            return True
-        except (ProcessLookupError, PermissionError):
-            # Stale PID file
-            pid_file.unlink(missing_ok=True)
-            return False
+    def is_daemon_running(self) -> bool:
+        """Check if the backup daemon is currently running."""
+        return self.read_daemon_pid() is not None
 
 
 def _run_daemon_main() -> None:
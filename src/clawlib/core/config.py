@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import pickle
+import stat
 import sys
 import tomllib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pydantic import ValidationError
+from clawlib.core.paths import Paths
 
-from clawlib.models.config import Config
+if TYPE_CHECKING:
+    from clawlib.models.config import Config
 
 # Config is searched relative to the current directory (project root).
 DEFAULT_CONFIG_PATHS = [
@@ -17,15 +22,33 @@ DEFAULT_CONFIG_PATHS = [
 ]
 
 
+# Config files already found by this process, keyed on
+# (cwd, explicit path, $CLAWCTL_CONFIG); misses are not remembered so a
+# config created later (e.g. by ``clawctl init``) is still picked up, and
+# a hit is re-checked so a moved or deleted config is searched for again.
+_FOUND: dict[tuple[str, str | None, str | None], Path] = {}
+
+
 def find_config_path(explicit_path: Path | None = None) -> Path | None:
     """Find the config file, checking explicit path, environment variable, then defaults."""
+    env_config = os.environ.get("CLAWCTL_CONFIG")
+    key = (os.getcwd(), None if explicit_path is None else os.fspath(explicit_path), env_config)
+    found = _FOUND.get(key)
+    if found is None or not found.is_file():
+        _FOUND.pop(key, None)
+        found = _search_config_path(explicit_path, env_config)
+        if found is not None:
+            _FOUND[key] = found
+    return found
+
+
+def _search_config_path(explicit_path: Path | None, env_config: str | None) -> Path | None:
     if explicit_path is not None:
         if explicit_path.is_file():
             return explicit_path.resolve()
         return None
 
     # Check environment variable
-    env_config = os.environ.get("CLAWCTL_CONFIG")
     if env_config:
         env_path = Path(env_config)
         if env_path.is_file():
@@ -38,6 +61,46 @@ def find_config_path(explicit_path: Path | None = None) -> Path | None:
     return None
 
 
+def _read_toml(path: Path) -> dict:
+    """Read and parse a TOML config file."""
+    if not path.is_file():
+        msg = f"Config file not found: {path}"
+        raise FileNotFoundError(msg)
+
+    try:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        msg = f"Invalid TOML in {path}: {e}"
+        raise ValueError(msg) from e
+
+
+def resolve_config_path(value: Path, config_dir: Path) -> Path:
+    """Resolve a configured path relative to the config file's directory."""
+    if not value.is_absolute():
+        return (config_dir / value).resolve()
+    return value.expanduser().resolve()
+
+
+def load_paths(path: Path) -> Paths:
+    """Resolve only the data and build roots of a config file.
+
+    Skips model validation entirely, for commands that only need to find a
+    PID file or log directory.  Roots are resolved the same way as in
+    :func:`load_config`; the defaults mirror ``ClawctlSettings``.
+
+    Raises:
+        FileNotFoundError: If the config file doesn't exist.
+        ValueError: If the TOML is invalid.
+    """
+    settings = _read_toml(path).get("clawctl", {})
+    config_dir = path.resolve().parent
+    return Paths(
+        resolve_config_path(Path(settings.get("data_root", "data")), config_dir),
+        resolve_config_path(Path(settings.get("build_root", "build")), config_dir),
+    )
+
+
 def load_config(path: Path) -> Config:
     """Load and validate config from a TOML file.
 
@@ -48,63 +111,127 @@ def load_config(path: Path) -> Config:
         FileNotFoundError: If the config file doesn't exist.
         ValueError: If the TOML is invalid or fails validation.
     """
-    if not path.is_file():
-        msg = f"Config file not found: {path}"
-        raise FileNotFoundError(msg)
+    from pydantic import ValidationError
 
-    config_dir = path.resolve().parent
-    text = path.read_text()
+    from clawlib.models.config import Config
 
-    try:
-        raw = tomllib.loads(text)
-    except tomllib.TOMLDecodeError as e:
-        msg = f"Invalid TOML in {path}: {e}"
-        raise ValueError(msg) from e
+    config_dir = path.resolve().parent
+    raw = _read_toml(path)
 
     try:
-        config = Config.model_validate(raw)
+        config = Config.model_validate(raw, context={"config_dir": config_dir})
     except ValidationError as e:
         msg = f"Config validation failed:\n{e}"
         raise ValueError(msg) from e
 
-    # Resolve data_root and build_root relative to the config file's directory
-    for attr in ("data_root", "build_root"):
-        value = getattr(config.clawctl, attr)
-        if not value.is_absolute():
-            setattr(config.clawctl, attr, (config_dir / value).resolve())
-        else:
-            setattr(config.clawctl, attr, value.expanduser().resolve())
-
-    # Resolve knowledge_dir relative to data_root if not absolute
-    if config.clawctl.knowledge_dir is not None:
-        kd = config.clawctl.knowledge_dir
-        if not kd.is_absolute():
-            # Resolve relative to data_root
-            config.clawctl.knowledge_dir = config.clawctl.data_root / kd
-        else:
-            config.clawctl.knowledge_dir = kd.expanduser().resolve()
-
-    # Resolve workspace_template paths (global default and per-user)
-    if config.clawctl.defaults.workspace_template is not None:
-        wt = config.clawctl.defaults.workspace_template
-        if not wt.is_absolute():
-            config.clawctl.defaults.workspace_template = (config_dir / wt).resolve()
-        else:
-            config.clawctl.defaults.workspace_template = wt.expanduser().resolve()
-
-    for user in config.users:
-        if user.workspace_template is not None:
-            wt = user.workspace_template
-            if not wt.is_absolute():
-                user.workspace_template = (config_dir / wt).resolve()
-            else:
-                user.workspace_template = wt.expanduser().resolve()
+    return config
+
+
+# Resolved config path -> (cache key, config) for the latest load of that file;
+# a changed stat replaces the entry, so edits do not accumulate configs
+_LOADED: dict[Path, tuple[bytes, Config]] = {}
+
+
+def _config_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "clawctl"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Whether *st* belongs to the effective user and nobody else can write it."""
+    return st.st_uid == os.geteuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _read_private(cache_file: Path) -> bytes | None:
+    """Read *cache_file* only if it and its directory are private to this user.
+
+    Unpickling runs arbitrary code, so a cache another user could have
+    written (e.g. under an inherited HOME when running as root) is ignored.
+    """
+    try:
+        dir_st = os.lstat(cache_file.parent)
+        if not stat.S_ISDIR(dir_st.st_mode) or not _is_private(dir_st):
+            return None
+        fd = os.open(cache_file, os.O_RDONLY | os.O_NOFOLLOW | os.O_CLOEXEC)
+    except OSError:
+        return None
+    with os.fdopen(fd, "rb") as f:
+        if not _is_private(os.fstat(fd)):
+            return None
+        return f.read()
+
+
+def load_config_cached(path: Path) -> Config:
+    """Load config via :func:`load_config`, reusing a pickled copy when possible.
+
+    The validated config is pickled under ``~/.cache/clawctl/``, keyed on the
+    config file's resolved path, mtime and size, the models module's mtime
+    and size, and the clawctl and pydantic versions, so editing the config or
+    the schema, or upgrading either package, invalidates it.  The pickle is
+    only loaded when it and its directory are owned by the effective user
+    and not group- or world-writable.  Any problem reading or
+    writing the cache falls back to a normal load.  Set
+    ``CLAWCTL_NO_CONFIG_CACHE=1`` to bypass the cache.
+
+    Within a process, loading an unchanged file again returns the same
+    object, so callers must treat the config as read-only.
+    """
+    if os.environ.get("CLAWCTL_NO_CONFIG_CACHE"):
+        return load_config(path)
+
+    import pydantic
+
+    import clawlib.models.config as models
+    from clawctl import __version__
+
+    try:
+        resolved = path.resolve()
+        st = resolved.stat()
+        schema = os.stat(models.__file__)
+    except OSError:
+        return load_config(path)
+
+    key = (
+        f"{resolved}\0{st.st_mtime_ns}\0{st.st_size}"
+        f"\0{schema.st_mtime_ns}\0{schema.st_size}"
+        f"\0{__version__}\0{pydantic.VERSION}\n"
+    ).encode()
+    loaded = _LOADED.get(resolved)
+    if loaded is not None and loaded[0] == key:
+        return loaded[1]
+
+    digest = hashlib.blake2b(str(resolved).encode(), digest_size=8).hexdigest()
+    cache_file = _config_cache_dir() / f"config-{digest}.pkl"
+
+    try:
+        data = _read_private(cache_file)
+        if data is not None and data.startswith(key):
+            config = pickle.loads(data[len(key):])
+            _LOADED[resolved] = (key, config)
+            return config
+    except Exception:
+        pass
+
+    config = load_config(path)
+    _LOADED[resolved] = (key, config)
+
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private(os.lstat(cache_file.parent)):
+            return config
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW | os.O_CLOEXEC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key + pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
 
     return config
 
 
-def load_config_or_exit(path: Path | None = None) -> Config:
-    """Load config, printing errors and exiting on failure."""
+def load_config_or_exit_with_path(path: Path | None = None) -> tuple[Path, Config]:
+    """Like :func:`load_config_or_exit`, but also return the resolved config path."""
     from rich.console import Console
 
     console = Console(stderr=True)
@@ -117,7 +244,12 @@ def load_config_or_exit(path: Path | None = None) -> Config:
         sys.exit(1)
 
     try:
-        return load_config(resolved)
+        return resolved, load_config_cached(resolved)
     except ValueError as e:
         console.print(f"[red]Config error:[/red] {e}")
         sys.exit(1)
+
+
+def load_config_or_exit(path: Path | None = None) -> Config:
+    """Load config, printing errors and exiting on failure."""
+    return load_config_or_exit_with_path(path)[1]
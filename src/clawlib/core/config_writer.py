@@ -37,9 +37,9 @@ def update_web_config_price_limits(
     
     # Read existing config
     import tomllib
-    text = config_path.read_text()
     try:
-        data = tomllib.loads(text)
+        with config_path.open("rb") as f:
+            data = tomllib.load(f)
     except Exception as e:
         raise ValueError(f"Invalid TOML: {e}") from e
     
@@ -103,9 +103,9 @@ def update_user_model(
     
     # Read existing config
     import tomllib
-    text = config_path.read_text()
     try:
-        data = tomllib.loads(text)
+        with config_path.open("rb") as f:
+            data = tomllib.load(f)
     except Exception as e:
         raise ValueError(f"Invalid TOML: {e}") from e
     
@@ -0,0 +1,24 @@
+"""PID-file helpers shared by the background daemons."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def running_pid(pid_file: Path) -> int | None:
+    """Return the PID recorded in *pid_file* if that process is still alive.
+
+    A stale PID file (process no longer exists) is removed.
+    """
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+    try:
+        os.kill(pid, 0)  # signal 0 = check existence
+    except (ProcessLookupError, PermissionError):
+        pid_file.unlink(missing_ok=True)
+        return None
+    return pid
@@ -2,32 +2,67 @@
 
 from __future__ import annotations
 
+import codecs
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
 import docker
 import docker.errors
 
-from clawlib.core.paths import Paths
+from clawlib.core.paths import get_paths
 from clawlib.models.config import Config, UserConfig
 
 CONTAINER_PREFIX = "openclaw"
 NETWORK_PREFIX = "openclaw-net"
 
+# Upper bound on concurrent per-user Docker operations in the *_all helpers
+_MAX_PARALLEL = 8
+
+# Container settings shared by every user, passed straight to the low-level API
+_RESTART_POLICY = {"Name": "unless-stopped"}
+_HEALTHCHECK = {
+    "Test": ["CMD-SHELL", "curl -so /dev/null http://127.0.0.1:18789/ || exit 1"],
+    "Interval": 30_000_000_000,
+    "Timeout": 10_000_000_000,
+    "StartPeriod": 15_000_000_000,
+    "Retries": 3,
+}
+
 # Resolve the docker/ directory from the project root
 _PROJECT_ROOT = Path(__file__).resolve().parents[3]
 _DOCKER_DIR = _PROJECT_ROOT / "docker"
 
-# Well-known Docker socket paths (checked in order)
+# The SDK's default socket; when present no DOCKER_HOST override is needed
+_DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Well-known alternative Docker socket paths (checked in order)
 _DOCKER_SOCKET_CANDIDATES = [
-    Path.home() / ".colima" / "default" / "docker.sock",
-    Path.home() / ".docker" / "run" / "docker.sock",
-    Path("/var/run/docker.sock"),
+    os.path.expanduser("~/.colima/default/docker.sock"),
+    os.path.expanduser("~/.docker/run/docker.sock"),
 ]
 
 
+@cache
+def _probe_docker_socket() -> str | None:
+    """Return a ``unix://`` URI for the first alternative socket found.
+
+    Probed once per process; sockets don't come and go during a command.
+    """
+    # If the standard socket exists, no override needed
+    if os.path.exists(_DEFAULT_DOCKER_SOCKET):
+        return None
+
+    for candidate in _DOCKER_SOCKET_CANDIDATES:
+        if os.path.exists(candidate):
+            return f"unix://{candidate}"
+
+    return None
+
+
 def _discover_docker_host() -> str | None:
     """Return a DOCKER_HOST URI if the default socket isn't available.
 
@@ -35,24 +70,37 @@ def _discover_docker_host() -> str | None:
     Returns None if the standard /var/run/docker.sock exists (let the SDK
     use its default).
     """
-    if os.environ.get("DOCKER_HOST"):
-        return os.environ["DOCKER_HOST"]
+    return os.environ.get("DOCKER_HOST") or _probe_docker_socket()
 
-    # If the standard socket exists, no override needed
-    if Path("/var/run/docker.sock").exists():
-        return None
 
-    for candidate in _DOCKER_SOCKET_CANDIDATES:
-        if candidate.exists():
-            return f"unix://{candidate}"
+@cache
+def _shared_client(docker_host: str | None) -> docker.DockerClient:
+    """Return the process-wide Docker client for *docker_host*.
+
+    Creating a client negotiates the API version with the daemon; every
+    DockerManager (and the gog helpers) in a process reuse this one and
+    its connection pool instead.
+    """
+    if docker_host:
+        return docker.DockerClient(base_url=docker_host)
+    return docker.from_env()
+
 
+def _gateway_host_port(attrs: dict) -> str | None:
+    """Return the host port bound to the gateway port in inspect *attrs*."""
+    ports = attrs.get("NetworkSettings", {}).get("Ports") or {}
+    bindings = ports.get("18789/tcp")
+    if bindings:
+        return bindings[0].get("HostPort")
     return None
 
 
+@lru_cache(maxsize=1024)
 def _container_name(username: str) -> str:
     return f"{CONTAINER_PREFIX}-{username}"
 
 
+@lru_cache(maxsize=1024)
 def _network_name(username: str) -> str:
     return f"{NETWORK_PREFIX}-{username}"
 
@@ -62,12 +110,19 @@ class DockerManager:
 
     def __init__(self, config: Config) -> None:
         self.config = config
-        self.paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+        self.paths = get_paths(config)
         self._docker_host = _discover_docker_host()
-        if self._docker_host:
-            self.client = docker.DockerClient(base_url=self._docker_host)
-        else:
-            self.client = docker.from_env()
+        # image tag -> whether it exists; build_image() records its own result
+        self._image_cache: dict[str, bool] = {}
+
+    @cached_property
+    def client(self) -> docker.DockerClient:
+        """The shared Docker client, connected on first use.
+
+        Connecting pings the daemon for its API version, which managers
+        that only touch config or secrets never need.
+        """
+        return _shared_client(self._docker_host)
 
     @property
     def image_tag(self) -> str:
@@ -78,7 +133,9 @@ class DockerManager:
     def build_image(self) -> None:
         """Build the OpenClaw Docker image at the configured version.
 
-        Uses subprocess for reliable streaming build output.
+        Uses subprocess for reliable streaming build output, and because the
+        docker CLI builds with BuildKit (whose layer cache makes rebuilds
+        fast) while the SDK's build API only drives the legacy builder.
         """
         cmd = [
             "docker",
@@ -89,18 +146,27 @@ class DockerManager:
             f"OPENCLAW_VERSION={self.config.clawctl.openclaw_version}",
             str(_DOCKER_DIR),
         ]
-        env = None
+        # Engines before 23.0 still default to the legacy builder
+        env = {"DOCKER_BUILDKIT": "1", **os.environ}
         if self._docker_host:
-            env = {**os.environ, "DOCKER_HOST": self._docker_host}
+            env["DOCKER_HOST"] = self._docker_host
         subprocess.run(cmd, check=True, env=env)
+        self._image_cache[self.image_tag] = True
 
     def image_exists(self) -> bool:
-        """Check if the configured image is already built."""
-        try:
-            self.client.images.get(self.image_tag)
-            return True
-        except docker.errors.ImageNotFound:
-            return False
+        """Check if the configured image is already built.
+
+        The answer is remembered for this manager, so repeated checks
+        during one command cost a single API call.
+        """
+        tag = self.image_tag
+        if tag not in self._image_cache:
+            try:
+                self.client.images.get(tag)
+                self._image_cache[tag] = True
+            except docker.errors.ImageNotFound:
+                self._image_cache[tag] = False
+        return self._image_cache[tag]
 
     # --- Network ---
 
@@ -235,22 +301,28 @@ class DockerManager:
                 except (PermissionError, FileNotFoundError):
                     pass
 
-        self.client.containers.create(
+        # The low-level API takes the host config as-is and, unlike
+        # containers.create(), does not inspect the new container afterwards
+        api = self.client.api
+        network = _network_name(user.name)
+        host_config = api.create_host_config(
+            binds=volumes,
+            port_bindings={"18789/tcp": ("127.0.0.1", user.port) if user.port else None},
+            network_mode=network,
+            restart_policy=_RESTART_POLICY,
+        )
+        api.create_container(
             image=self.image_tag,
             name=name,
             user="1000:1000",
-            network=_network_name(user.name),
-            volumes=volumes,
-            ports={"18789/tcp": ("127.0.0.1", user.port) if user.port else None},
+            ports=[(18789, "tcp")],
+            volumes=[v["bind"] for v in volumes.values()],
             environment=env_vars if env_vars else None,
-            restart_policy={"Name": "unless-stopped"},
-            healthcheck={
-                "Test": ["CMD-SHELL", "curl -so /dev/null http://127.0.0.1:18789/ || exit 1"],
-                "Interval": 30_000_000_000,
-                "Timeout": 10_000_000_000,
-                "StartPeriod": 15_000_000_000,
-                "Retries": 3,
-            },
+            healthcheck=_HEALTHCHECK,
+            host_config=host_config,
+            networking_config=api.create_networking_config(
+                {network: api.create_endpoint_config()}
+            ),
             detach=True,
         )
 
@@ -414,84 +486,186 @@ class DockerManager:
         self.create_container(user)
         self.start_container(user.name)
 
-    def container_exists(self, username: str) -> bool:
-        """Check if a user's container exists."""
+    def _inspect(self, username: str) -> dict | None:
+        """Return the raw inspect data for a user's container, or None if missing.
+
+        Goes through the low-level API so no ``Container`` model is built.
+        """
         try:
-            self.client.containers.get(_container_name(username))
-            return True
+            return self.client.api.inspect_container(_container_name(username))
         except docker.errors.NotFound:
-            return False
+            return None
+
+    def container_exists(self, username: str) -> bool:
+        """Check if a user's container exists."""
+        return self._inspect(username) is not None
+
+    def _list_containers(self) -> dict[str, dict]:
+        """Map container name -> summary attrs for all OpenClaw containers.
+
+        One ``docker ps -a`` style API call; ``sparse=True`` skips the
+        per-container inspect that ``containers.list`` does by default.
+        """
+        containers = self.client.containers.list(
+            all=True, sparse=True, filters={"name": CONTAINER_PREFIX}
+        )
+        return {
+            name.lstrip("/"): c.attrs
+            for c in containers
+            for name in c.attrs.get("Names") or []
+        }
+
+    def existing_containers(self) -> set[str]:
+        """Return the configured usernames whose container exists."""
+        names = self._list_containers()
+        return {u.name for u in self.config.users if _container_name(u.name) in names}
+
+    def existing_networks(self) -> set[str]:
+        """Return the configured usernames whose network exists."""
+        wanted = {_network_name(u.name): u.name for u in self.config.users}
+        if not wanted:
+            return set()
+        # The name filter is a substring match, so intersect with the exact names
+        found = {n.name for n in self.client.networks.list(names=list(wanted))}
+        return {username for name, username in wanted.items() if name in found}
 
     def get_container_status(self, username: str) -> str:
         """Get the status of a user's container (running, exited, etc.)."""
-        try:
-            container = self.client.containers.get(_container_name(username))
-            return container.status
-        except docker.errors.NotFound:
-            return "not found"
+        return self.get_container_info(username)[0]
 
     def get_container_port(self, username: str) -> str | None:
         """Get the host port mapped to the container's gateway port."""
-        try:
-            container = self.client.containers.get(_container_name(username))
-            ports = container.attrs.get("NetworkSettings", {}).get("Ports", {})
-            bindings = ports.get("18789/tcp")
-            if bindings:
-                return bindings[0].get("HostPort")
-        except docker.errors.NotFound:
-            pass
-        return None
+        attrs = self._inspect(username)
+        return _gateway_host_port(attrs) if attrs is not None else None
+
+    def get_container_info(self, username: str) -> tuple[str, str | None]:
+        """Get a user's container status and gateway host port from one inspect.
+
+        The port is only reported for running containers.
+        """
+        attrs = self._inspect(username)
+        if attrs is None:
+            return "not found", None
+        status = attrs["State"]["Status"]
+        if status != "running":
+            return status, None
+        return status, _gateway_host_port(attrs)
 
     def get_all_statuses(self) -> dict[str, dict[str, str]]:
         """Get status info for all configured users.
 
         Returns dict of {username: {"status": ..., "port": ...}}
+
+        Answered from a single container list call, so prefer this over
+        calling get_container_status/get_container_port per user.
         """
+        containers = self._list_containers()
         result = {}
         for user in self.config.users:
-            status = self.get_container_status(user.name)
-            port = self.get_container_port(user.name) if status == "running" else None
+            attrs = containers.get(_container_name(user.name))
+            status = attrs.get("State", "unknown") if attrs is not None else "not found"
+            port = None
+            if status == "running":
+                port = next(
+                    (
+                        str(p["PublicPort"])
+                        for p in attrs.get("Ports") or []
+                        if p.get("PrivatePort") == 18789 and p.get("PublicPort")
+                    ),
+                    None,
+                )
             result[user.name] = {"status": status, "port": port or "-"}
         return result
 
     def stream_logs(
         self, username: str, *, follow: bool = False, tail: int = 100
     ) -> Iterator[str]:
-        """Stream container logs."""
-        container = self.client.containers.get(_container_name(username))
-        for chunk in container.logs(stream=True, follow=follow, tail=tail):
-            yield chunk.decode("utf-8", errors="replace")
+        """Stream container logs.
+
+        Chunks are decoded incrementally, so a multi-byte character split
+        across two chunks is not mangled.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for chunk in self.stream_logs_raw(username, follow=follow, tail=tail):
+            if text := decoder.decode(chunk):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+
+    def stream_logs_raw(
+        self, username: str, *, follow: bool = False, tail: int = 100
+    ) -> Iterator[bytes]:
+        """Stream container logs as the undecoded byte chunks the daemon sends.
+
+        Goes straight to the logs endpoint by container name, skipping the
+        inspect call that fetching a Container model would make.
+        """
+        return self.client.api.logs(
+            _container_name(username), stream=True, follow=follow, tail=tail
+        )
 
     # --- Lifecycle helpers ---
 
-    def start_all(self) -> list[str]:
+    def _for_each(
+        self,
+        users: list[UserConfig],
+        action: Callable[[UserConfig], None],
+        *,
+        parallel: bool,
+    ) -> list[str]:
+        """Apply *action* to each user and return their names in config order.
+
+        With *parallel*, up to ``_MAX_PARALLEL`` users are handled at once;
+        the daemon does the work, so threads mostly wait on its socket.
+        Every user is attempted; failures are raised together afterwards.
+        """
+        if not parallel or len(users) < 2:
+            for user in users:
+                action(user)
+            return [u.name for u in users]
+
+        errors: list[Exception] = []
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL, len(users))) as pool:
+            futures = {pool.submit(action, user): user.name for user in users}
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    error.add_note(f"while handling user '{futures[future]}'")
+                    errors.append(error)
+        if errors:
+            raise ExceptionGroup(f"{len(errors)} of {len(users)} containers failed", errors)
+        return [u.name for u in users]
+
+    def start_all(self, *, parallel: bool = True) -> list[str]:
         """Start all configured user containers. Returns list of started usernames."""
-        started = []
-        for user in self.config.users:
-            if self.container_exists(user.name):
-                self.start_container(user.name)
-                started.append(user.name)
-        return started
+        existing = self.existing_containers()
+        users = [u for u in self.config.users if u.name in existing]
+        return self._for_each(users, lambda u: self.start_container(u.name), parallel=parallel)
 
-    def stop_all(self) -> list[str]:
+    def stop_all(self, *, parallel: bool = True) -> list[str]:
         """Stop all configured user containers. Returns list of stopped usernames."""
-        stopped = []
-        for user in self.config.users:
-            if self.container_exists(user.name):
-                self.stop_container(user.name)
-                stopped.append(user.name)
-        return stopped
+        existing = self.existing_containers()
+        users = [u for u in self.config.users if u.name in existing]
+        return self._for_each(users, lambda u: self.stop_container(u.name), parallel=parallel)
+
+    def rebuild_all(self, *, parallel: bool = False) -> list[str]:
+        """Rebuild image and recreate all containers.
 
-    def rebuild_all(self) -> list[str]:
-        """Rebuild image and recreate all containers (rolling update)."""
+        Serial by default, so containers are replaced one at a time (rolling
+        update); *parallel* recreates them concurrently.
+        """
         self.build_image()
-        updated = []
-        for user in self.config.users:
-            if self.container_exists(user.name):
-                was_running = self.get_container_status(user.name) == "running"
-                self.remove_container(user.name)
-                self.create_container(user)
-                if was_running:
-                    self.start_container(user.name)
-                updated.append(user.name)
-        return updated
+        containers = self._list_containers()
+        users = [u for u in self.config.users if _container_name(u.name) in containers]
+        running = {
+            u.name for u in users
+            if containers[_container_name(u.name)].get("State") == "running"
+        }
+
+        def recreate(user: UserConfig) -> None:
+            self.remove_container(user.name)
+            self.create_container(user)
+            if user.name in running:
+                self.start_container(user.name)
+
+        return self._for_each(users, recreate, parallel=parallel)
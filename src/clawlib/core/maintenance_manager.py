@@ -12,7 +12,8 @@ from pathlib import Path
 
 import schedule
 
-from clawlib.core.paths import Paths
+from clawlib.core.daemon import running_pid
+from clawlib.core.paths import get_paths
 from clawlib.models.config import Config
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ class MaintenanceManager:
 
     def __init__(self, config: Config) -> None:
         self.config = config
-        self.paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+        self.paths = get_paths(config)
         self.maintenance_config = config.clawctl.maintenance
 
     def run_cycle(self) -> dict:
@@ -186,22 +187,16 @@ class MaintenanceManager:
         pid_file.unlink(missing_ok=True)
         return True
 
-    def is_daemon_running(self) -> bool:
-        """Check if the maintenance daemon is currently running."""
-        pid_file = self.paths.maintenance_pid_file
-
-        if not pid_file.is_file():
-            return False
+    def read_daemon_pid(self) -> int | None:
+        """Return the maintenance daemon's PID if it is running, else None.
 
-        pid = int(pid_file.read_text().strip())
+        Reads the PID file once; a stale PID file is removed.
+        """
+        return running_pid(self.paths.maintenance_pid_file)
 
-        try:
-            os.kill(pid, 0)  # signal 0 = check existence
-            return True
-        except (ProcessLookupError, PermissionError):
-            # Stale PID file
-            pid_file.unlink(missing_ok=True)
-            return False
+    def is_daemon_running(self) -> bool:
+        """Check if the maintenance daemon is currently running."""
+        return self.read_daemon_pid() is not None
 
 
 def _run_daemon_main() -> None:
@@ -218,7 +213,7 @@ def _run_daemon_main() -> None:
         sys.exit(1)
 
     config = load_config(config_path)
-    paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+    paths = get_paths(config)
     paths.logs_dir.mkdir(parents=True, exist_ok=True)
 
     logging.basicConfig(
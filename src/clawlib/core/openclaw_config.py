@@ -5,14 +5,39 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
 from clawlib.models.config import DefaultsConfig, UserConfig
 
 
-def _get_tailscale_hostname() -> str | None:
-    """Get the MagicDNS hostname of this machine from Tailscale."""
+# Seconds a Tailscale lookup is reused after it was fetched; restart_all
+# regenerates every user's config, the status page asks on every refresh,
+# and each lookup spawns the tailscale CLI
+_TAILSCALE_TTL = 30.0
+
+# lookup name -> (time.monotonic() when fetched, result)
+_tailscale_cache: dict[str, tuple[float, str | None]] = {}
+
+
+def _tailscale_cached(name: str, fetch: Callable[[], str | None]) -> str | None:
+    now = time.monotonic()
+    hit = _tailscale_cache.get(name)
+    if hit is not None and now - hit[0] < _TAILSCALE_TTL:
+        return hit[1]
+    value = fetch()
+    _tailscale_cache[name] = (now, value)
+    return value
+
+
+def get_tailscale_hostname() -> str | None:
+    """Get the MagicDNS hostname of this machine from Tailscale (cached for ``_TAILSCALE_TTL``)."""
+    return _tailscale_cached("hostname", _tailscale_hostname)
+
+
+def _tailscale_hostname() -> str | None:
     try:
         result = subprocess.run(
             ["tailscale", "status", "--self", "--json"],
@@ -20,12 +45,30 @@ def _get_tailscale_hostname() -> str | None:
         )
         if result.returncode == 0:
             data = json.loads(result.stdout)
-            return data.get("Self", {}).get("DNSName", "").rstrip(".")
+            # Drop the trailing dot of the FQDN, which breaks URLs
+            return data.get("Self", {}).get("DNSName", "").rstrip(".") or None
     except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
         pass
     return None
 
 
+def get_tailscale_ip() -> str | None:
+    """Get this machine's Tailscale IPv4 address (cached for ``_TAILSCALE_TTL``)."""
+    return _tailscale_cached("ip", _tailscale_ip)
+
+
+def _tailscale_ip() -> str | None:
+    try:
+        result = subprocess.run(
+            ["tailscale", "ip", "-4"], capture_output=True, text=True, timeout=5
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
 def _is_tailscale_available() -> bool:
     """Check if Tailscale is available for use.
     
@@ -56,6 +99,28 @@ def _is_tailscale_available() -> bool:
     # return False
 
 
+# Trusted by the gateway so WebSocket connections through Docker NAT are accepted.
+# Docker default bridge: 172.17.0.0/16, custom networks often use 172.18-30.0.0/16
+_DOCKER_TRUSTED_PROXIES = (
+    "127.0.0.1",
+    "::1",
+    "172.17.0.0/16",  # Docker default bridge network
+    "172.18.0.0/16",  # Docker custom networks
+    "172.19.0.0/16",
+    "172.20.0.0/16",
+    "172.21.0.0/16",
+    "172.22.0.0/16",
+    "172.23.0.0/16",
+    "172.24.0.0/16",
+    "172.25.0.0/16",
+    "172.26.0.0/16",
+    "172.27.0.0/16",
+    "172.28.0.0/16",
+    "172.29.0.0/16",
+    "172.30.0.0/16",
+)
+
+
 def generate_openclaw_config(
     user: UserConfig, 
     defaults: DefaultsConfig, 
@@ -106,24 +171,7 @@ def generate_openclaw_config(
         gateway["bind"] = "lan"  # 0.0.0.0 inside container for Docker networking
         # Trust Docker network ranges to allow WebSocket connections through NAT
         # Docker default bridge: 172.17.0.0/16, custom networks often use 172.18-30.0.0/16
-        gateway["trustedProxies"] = [
-            "127.0.0.1",
-            "::1",
-            "172.17.0.0/16",  # Docker default bridge network
-            "172.18.0.0/16",  # Docker custom networks
-            "172.19.0.0/16",
-            "172.20.0.0/16",
-            "172.21.0.0/16",
-            "172.22.0.0/16",
-            "172.23.0.0/16",
-            "172.24.0.0/16",
-            "172.25.0.0/16",
-            "172.26.0.0/16",
-            "172.27.0.0/16",
-            "172.28.0.0/16",
-            "172.29.0.0/16",
-            "172.30.0.0/16",
-        ]
+        gateway["trustedProxies"] = list(_DOCKER_TRUSTED_PROXIES)
 
     if gateway_token:
         if use_tailscale_serve:
@@ -138,19 +186,13 @@ def generate_openclaw_config(
                 "trustedProxy": {"userHeader": "X-Forwarded-User"},
             }
         allowed_origins: list[str] = ["*"]
-        ts_hostname = _get_tailscale_hostname()
+        ts_hostname = get_tailscale_hostname()
         if ts_hostname:
             allowed_origins.append(f"https://{ts_hostname}")
-        try:
-            ts_ip_result = subprocess.run(
-                ["tailscale", "ip", "-4"], capture_output=True, text=True, timeout=5
-            )
-            ts_ip = ts_ip_result.stdout.strip()
-            if ts_ip:
-                allowed_origins.append(f"https://{ts_ip}")
-                allowed_origins.append(f"http://{ts_ip}")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        ts_ip = get_tailscale_ip()
+        if ts_ip:
+            allowed_origins.append(f"https://{ts_ip}")
+            allowed_origins.append(f"http://{ts_ip}")
         control_ui_config: dict = {
             "enabled": True,
             "allowInsecureAuth": True,
@@ -194,7 +236,8 @@ def generate_openclaw_config(
         "channels": {},
     }
 
-    if user.channels.slack.enabled:
+    channels = user.channels
+    if channels.slack.enabled:
         config["channels"]["slack"] = {
             "enabled": True,
             "mode": "socket",
@@ -202,7 +245,7 @@ def generate_openclaw_config(
         }
     # Don't include Slack in config if disabled - OpenClaw doctor will auto-enable it if present
 
-    if user.channels.discord.enabled:
+    if channels.discord.enabled:
         discord_cfg: dict = {
             "enabled": True,
             "groupPolicy": "open",  # Allow all channels/DMs by default
@@ -211,8 +254,9 @@ def generate_openclaw_config(
             discord_cfg["token"] = discord_token
         config["channels"]["discord"] = discord_cfg
 
-    if user.skills.gog.enabled and user.skills.gog.email:
-        config.setdefault("hooks", {})["gmail"] = {"account": user.skills.gog.email}
+    gog = user.skills.gog
+    if gog.enabled and gog.email:
+        config.setdefault("hooks", {})["gmail"] = {"account": gog.email}
 
     # Add meta field to prevent gateway from treating this as an external write
     # The gateway checks for meta before overwriting config
@@ -2,7 +2,39 @@
 
 from __future__ import annotations
 
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from clawlib.models.config import Config
+
+
+class _UserPaths(NamedTuple):
+    """The per-user directories, joined once per username."""
+
+    dir: Path
+    openclaw: Path
+    workspace: Path
+    backup: Path
+    config: Path
+    files: Path
+    secrets: Path
+
+
+@lru_cache(maxsize=256)
+def _join_user_paths(users_root: Path, secrets_root: Path, username: str) -> _UserPaths:
+    user_dir = users_root / username
+    openclaw = user_dir / "openclaw"
+    return _UserPaths(
+        dir=user_dir,
+        openclaw=openclaw,
+        workspace=openclaw / "workspace",
+        backup=user_dir / "backup",
+        config=user_dir / "config",
+        files=user_dir / "files",
+        secrets=secrets_root / username,
+    )
 
 
 class Paths:
@@ -25,6 +57,8 @@ class Paths:
     def __init__(self, data_root: Path, build_root: Path | None = None) -> None:
         self.data_root = Path(data_root).resolve()
         self.build_root = Path(build_root).resolve() if build_root else self.data_root
+        self._secrets_root = self.data_root / "secrets"
+        self._users_root = self.data_root / "users"
 
     # --- Build root (infrastructure, disposable) ---
 
@@ -40,6 +74,10 @@ class Paths:
     def maintenance_pid_file(self) -> Path:
         return self.build_root / ".maintenance.pid"
 
+    @property
+    def shared_collections_pid_file(self) -> Path:
+        return self.build_root / ".shared-collections-sync.pid"
+
     @property
     def maintenance_last_run_file(self) -> Path:
         return self.build_root / ".maintenance-last-run"
@@ -48,11 +86,11 @@ class Paths:
 
     @property
     def secrets_root(self) -> Path:
-        return self.data_root / "secrets"
+        return self._secrets_root
 
     @property
     def users_root(self) -> Path:
-        return self.data_root / "users"
+        return self._users_root
 
     @property
     def shared_collections_root(self) -> Path:
@@ -76,21 +114,24 @@ class Paths:
 
     # --- Per-user ---
 
+    def _user_paths(self, username: str) -> _UserPaths:
+        return _join_user_paths(self._users_root, self._secrets_root, username)
+
     def user_dir(self, username: str) -> Path:
-        return self.users_root / username
+        return self._user_paths(username).dir
 
     def user_openclaw_dir(self, username: str) -> Path:
         """The directory bind-mounted as /home/node/.openclaw in the container."""
-        return self.user_dir(username) / "openclaw"
+        return self._user_paths(username).openclaw
 
     def user_openclaw_config(self, username: str) -> Path:
-        return self.user_openclaw_dir(username) / "openclaw.json"
+        return self._user_paths(username).openclaw / "openclaw.json"
 
     def user_workspace_dir(self, username: str) -> Path:
-        return self.user_openclaw_dir(username) / "workspace"
+        return self._user_paths(username).workspace
 
     def user_backup_dir(self, username: str) -> Path:
-        return self.user_dir(username) / "backup"
+        return self._user_paths(username).backup
 
     def user_config_dir(self, username: str) -> Path:
         """The directory bind-mounted as /home/node/.config in the container.
@@ -98,31 +139,57 @@ class Paths:
         Persists tool configuration that lives outside /home/node/.openclaw,
         such as gog's OAuth credentials and keyring files (~/.config/gogcli/).
         """
-        return self.user_dir(username) / "config"
+        return self._user_paths(username).config
 
     def user_files_dir(self, username: str) -> Path:
         """Directory for admin-pushed files, bind-mounted as /mnt/files (ro)."""
-        return self.user_dir(username) / "files"
+        return self._user_paths(username).files
 
     def user_secrets_dir(self, username: str) -> Path:
-        return self.secrets_root / username
+        return self._user_paths(username).secrets
 
     # --- Directory creation ---
 
     def ensure_user_dirs(self, username: str) -> None:
         """Create all directories for a user."""
-        self.user_openclaw_dir(username).mkdir(parents=True, exist_ok=True)
-        self.user_workspace_dir(username).mkdir(parents=True, exist_ok=True)
-        self.user_backup_dir(username).mkdir(parents=True, exist_ok=True)
-        self.user_config_dir(username).mkdir(parents=True, exist_ok=True)
-        self.user_files_dir(username).mkdir(parents=True, exist_ok=True)
-        self.user_secrets_dir(username).mkdir(parents=True, exist_ok=True)
+        # The workspace lives inside the openclaw dir, which it creates too
+        _make_dirs(
+            self.user_workspace_dir(username),
+            self.user_backup_dir(username),
+            self.user_config_dir(username),
+            self.user_files_dir(username),
+            self.user_secrets_dir(username),
+        )
 
     def ensure_base_dirs(self) -> None:
         """Create base directory structure."""
-        self.build_root.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.data_root.mkdir(parents=True, exist_ok=True)
-        self.secrets_root.mkdir(parents=True, exist_ok=True)
-        self.users_root.mkdir(parents=True, exist_ok=True)
-        self.shared_collections_root.mkdir(parents=True, exist_ok=True)
+        # Each root is created as a parent of its subdirectories
+        _make_dirs(
+            self.logs_dir,
+            self.secrets_root,
+            self.users_root,
+            self.shared_collections_root,
+        )
+
+
+def _make_dirs(*dirs: Path) -> None:
+    """Create each of *dirs* and any missing parents.
+
+    Raises ``FileExistsError`` if one of them exists but is not a directory.
+    """
+    for path in dirs:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+@cache
+def _paths_for_roots(data_root: Path, build_root: Path | None) -> Paths:
+    return Paths(data_root, build_root)
+
+
+def get_paths(config: Config) -> Paths:
+    """Return the :class:`Paths` for *config*'s roots.
+
+    Resolving the roots touches the filesystem, so one instance per pair of
+    roots is shared for the life of the process.
+    """
+    return _paths_for_roots(config.clawctl.data_root, config.clawctl.build_root)
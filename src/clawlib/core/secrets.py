@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 import stat
+from functools import cache
 from pathlib import Path
+from typing import Iterable
 
 from clawctl.core.paths import Paths
 
@@ -31,58 +33,110 @@ class SecretsManager:
         Returns:
             Path to the written secret file.
         """
+        secret_dir = self._prepare_secret_dir(username)
+        return self._write_secret_file(secret_dir / name, value)
+
+    def _prepare_secret_dir(self, username: str) -> Path:
         secret_dir = self.paths.user_secrets_dir(username)
         secret_dir.mkdir(parents=True, exist_ok=True)
         
         # Ensure the directory is writable by the current user
         # If the directory exists but isn't writable, try to fix permissions
-        if secret_dir.exists() and not os.access(secret_dir, os.W_OK):
+        if not os.access(secret_dir, os.W_OK):
             try:
                 os.chmod(secret_dir, stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)  # 0755
             except (PermissionError, OSError):
                 pass
+        return secret_dir
 
-        secret_file = secret_dir / name
-        
+    @staticmethod
+    def _write_secret_file(secret_file: Path, value: str) -> Path:
         # If file exists and we can't write to it, try to remove it first
         # (might be owned by a different user)
-        if secret_file.exists() and not os.access(secret_file, os.W_OK):
+        if not os.access(secret_file, os.W_OK) and os.access(secret_file, os.F_OK):
             try:
-                secret_file.unlink()
+                os.unlink(secret_file)
             except (PermissionError, OSError):
                 # If we can't remove it, try to overwrite anyway
                 # This will raise PermissionError if it fails
                 pass
         
-        secret_file.write_text(value)
         # Use 0644 so the container user (UID 1000) can read it
         # The directory is mounted read-only, so we need readable permissions
-        os.chmod(secret_file, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)  # 0644
-        
-        # Try to chown to 1000:1000 (container user) if we have permissions
-        # This ensures the container can read the secret file
-        try:
-            import subprocess
-            subprocess.run(
-                ["chown", "1000:1000", str(secret_file)],
-                check=False,
-                capture_output=True,
-            )
-        except (FileNotFoundError, PermissionError):
-            # chown not available or no permission - that's okay,
-            # the deployment script should handle permissions
-            pass
-        
+        fd = os.open(secret_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        SecretsManager._fill_secret_fd(fd, value)
         return secret_file
 
+    @staticmethod
+    def _fill_secret_fd(fd: int, value: str) -> None:
+        """Write *value* to the open secret file *fd*, fix its mode and owner, and close it."""
+        try:
+            data = value.encode()
+            # os.write may write only part of the buffer
+            while data:
+                data = data[os.write(fd, data):]
+            # open() applies the umask and leaves an existing file's mode alone
+            os.fchmod(fd, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)  # 0644
+
+            # Hand the file to the container user (1000:1000) if we have permissions.
+            # Otherwise that's okay, the deployment script should handle permissions
+            try:
+                os.fchown(fd, 1000, 1000)
+            except PermissionError:
+                pass
+        finally:
+            os.close(fd)
+
     def read_secret(self, username: str, name: str) -> str | None:
-        """Read a secret value. Returns None if the file doesn't exist."""
-        secret_file = self.paths.user_secrets_dir(username) / name
-        if secret_file.is_file():
-            content = secret_file.read_text()
-            # Strip whitespace (including newlines) from secret values
-            return content.strip() if content else None
-        return None
+        """Read a secret value. Returns None if the file is missing, unreadable or empty."""
+        return _read_secret_file(self.paths.user_secrets_dir(username) / name)
+
+    def read_secrets(self, username: str, names: Iterable[str]) -> dict[str, str]:
+        """Read several secrets with a single directory scan.
+
+        Returns ``{name: stripped value}``; secrets that are missing,
+        unreadable or empty are left out, as :meth:`read_secret` would
+        return None for them.
+        """
+        secret_dir = self.paths.user_secrets_dir(username)
+        try:
+            with os.scandir(secret_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return {}
+        values: dict[str, str] = {}
+        for name in names:
+            if name in present:
+                value = _read_secret_file(secret_dir / name)
+                if value:
+                    values[name] = value
+        return values
+
+    def read_secrets_bulk(self, usernames: Iterable[str], *names: str) -> dict[str, str]:
+        """Read one secret for many users with a single scan of the secrets root.
+
+        For each user the first of *names* that exists and is non-empty wins,
+        so a legacy fallback name can be passed after the current one.
+        Users without a secret directory or without any readable secret are
+        left out.
+        """
+        try:
+            with os.scandir(self.paths.secrets_root) as entries:
+                present = {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return {}
+
+        values: dict[str, str] = {}
+        for username in usernames:
+            if username not in present:
+                continue
+            secret_dir = self.paths.user_secrets_dir(username)
+            for name in names:
+                value = _read_secret_file(secret_dir / name)
+                if value:
+                    values[username] = value
+                    break
+        return values
 
     def secret_exists(self, username: str, name: str) -> bool:
         """Check if a secret file exists."""
@@ -90,10 +144,11 @@ class SecretsManager:
 
     def list_secrets(self, username: str) -> list[str]:
         """List secret filenames for a user."""
-        secret_dir = self.paths.user_secrets_dir(username)
-        if not secret_dir.is_dir():
+        try:
+            with os.scandir(self.paths.user_secrets_dir(username)) as entries:
+                return sorted(entry.name for entry in entries if entry.is_file())
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        return sorted(f.name for f in secret_dir.iterdir() if f.is_file())
 
     def remove_user_secrets(self, username: str) -> None:
         """Remove all secrets for a user."""
@@ -114,92 +169,87 @@ class SecretsManager:
             user_config: The user's configuration.
             defaults: Optional DefaultsConfig for skill inheritance.
         """
-        from clawlib.models.config import SKILL_REQUIRED_SECRETS
-
-        required: list[tuple[str, str]] = []
-        seen: set[str] = set()  # Track to avoid duplicates
-
-        # Skill-specific secret descriptions for better UX
-        SKILL_SECRET_DESCRIPTIONS = {
-            "gog_client_id": "Google OAuth Client ID",
-            "gog_client_secret": "Google OAuth Client Secret",
-            "gog_keyring_password": "Gog keyring encryption password",
-            "gh_token": "GitHub classic PAT (ghp_...) for git push access",
-        }
+        # secret name -> description; insertion order is the prompt order
+        required: dict[str, str] = {}
 
         # Collect all explicitly declared secrets from the [users.secrets] block.
         # Pydantic's extra="allow" stores them in model_extra.
         extras = user_config.secrets.model_extra or {}
         for logical_name, secret_filename in extras.items():
-            if secret_filename not in seen:
+            if secret_filename not in required:
                 # Use specific description if available, otherwise generate from name
-                description = SKILL_SECRET_DESCRIPTIONS.get(
-                    secret_filename,
-                    logical_name.replace("_", " ").title()
+                required[secret_filename] = _SKILL_SECRET_DESCRIPTIONS.get(
+                    secret_filename, logical_name.replace("_", " ").title()
                 )
-                required.append((secret_filename, description))
-                seen.add(secret_filename)
-        
-        # Collect skill-required secrets
+
+        # Collect skill-required secrets; a user setting takes precedence and
+        # falls back to the default when unset
         skills = user_config.skills
-        if defaults:
-            # Merge defaults with user-specific overrides
-            for skill_name in ["gog", "gemini", "coding_agent", "github"]:
-                user_val = getattr(skills, skill_name, None)
-                default_val = getattr(defaults.skills, skill_name, False)
-                # A skill value may be a bool or an object with an .enabled attribute
-                user_enabled = user_val.enabled if hasattr(user_val, "enabled") else user_val
-                default_enabled = default_val.enabled if hasattr(default_val, "enabled") else default_val
-                # User setting takes precedence; if not set, use default
-                is_enabled = user_enabled if user_enabled is not None else default_enabled
-                if is_enabled and skill_name in SKILL_REQUIRED_SECRETS:
-                    for secret_name in SKILL_REQUIRED_SECRETS[skill_name]:
-                        if secret_name not in seen:
-                            # Use specific description if available, otherwise fallback to generic
-                            description = SKILL_SECRET_DESCRIPTIONS.get(
-                                secret_name,
-                                f"{skill_name.replace('_', ' ').title()} API key"
-                            )
-                            required.append((secret_name, description))
-                            seen.add(secret_name)
-        else:
-            # No defaults, just use user skills
-            for skill_name in ["gog", "gemini", "coding_agent", "github"]:
-                val = getattr(skills, skill_name, False)
-                is_enabled = val.enabled if hasattr(val, "enabled") else bool(val)
-                if is_enabled and skill_name in SKILL_REQUIRED_SECRETS:
-                    for secret_name in SKILL_REQUIRED_SECRETS[skill_name]:
-                        if secret_name not in seen:
-                            # Use specific description if available, otherwise fallback to generic
-                            description = SKILL_SECRET_DESCRIPTIONS.get(
-                                secret_name,
-                                f"{skill_name.replace('_', ' ').title()} API key"
-                            )
-                            required.append((secret_name, description))
-                            seen.add(secret_name)
+        for skill_name, skill_secrets in _skill_secret_specs():
+            is_enabled = _skill_enabled(getattr(skills, skill_name, None))
+            if is_enabled is None and defaults:
+                is_enabled = _skill_enabled(getattr(defaults.skills, skill_name, False))
+            if is_enabled:
+                for secret_name, description in skill_secrets:
+                    required.setdefault(secret_name, description)
 
         # Slack secrets
-        if user_config.channels.slack.enabled:
-            if user_config.channels.slack.bot_token_secret:
-                if user_config.channels.slack.bot_token_secret not in seen:
-                    required.append(
-                        (user_config.channels.slack.bot_token_secret, "Slack bot token")
-                    )
-                    seen.add(user_config.channels.slack.bot_token_secret)
-            if user_config.channels.slack.app_token_secret:
-                if user_config.channels.slack.app_token_secret not in seen:
-                    required.append(
-                        (user_config.channels.slack.app_token_secret, "Slack app token")
-                    )
-                    seen.add(user_config.channels.slack.app_token_secret)
+        slack = user_config.channels.slack
+        if slack.enabled:
+            if slack.bot_token_secret:
+                required.setdefault(slack.bot_token_secret, "Slack bot token")
+            if slack.app_token_secret:
+                required.setdefault(slack.app_token_secret, "Slack app token")
 
         # Discord secrets
-        if user_config.channels.discord.enabled:
-            if user_config.channels.discord.token_secret:
-                if user_config.channels.discord.token_secret not in seen:
-                    required.append(
-                        (user_config.channels.discord.token_secret, "Discord bot token")
-                    )
-                    seen.add(user_config.channels.discord.token_secret)
-
-        return required
+        discord = user_config.channels.discord
+        if discord.enabled and discord.token_secret:
+            required.setdefault(discord.token_secret, "Discord bot token")
+
+        return list(required.items())
+
+
+def _read_secret_file(secret_file: Path) -> str | None:
+    """Return the stripped contents of *secret_file*, or None if it is missing, unreadable or empty."""
+    # Let open() report a missing file instead of stat-ing first
+    try:
+        with open(secret_file, "rb") as f:
+            content = f.read().decode()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError):
+        return None
+    # Strip whitespace (including newlines) from secret values
+    return content.strip() or None
+
+
+# Skill-specific secret descriptions for better UX
+_SKILL_SECRET_DESCRIPTIONS = {
+    "gog_client_id": "Google OAuth Client ID",
+    "gog_client_secret": "Google OAuth Client Secret",
+    "gog_keyring_password": "Gog keyring encryption password",
+    "gh_token": "GitHub classic PAT (ghp_...) for git push access",
+}
+
+_SKILL_NAMES = ("gog", "gemini", "coding_agent", "github")
+
+
+@cache
+def _skill_secret_specs() -> tuple[tuple[str, tuple[tuple[str, str], ...]], ...]:
+    """``(skill, ((secret_name, description), ...))`` for skills that need secrets."""
+    from clawlib.models.config import SKILL_REQUIRED_SECRETS
+
+    specs = []
+    for skill_name in _SKILL_NAMES:
+        secret_names = SKILL_REQUIRED_SECRETS.get(skill_name)
+        if not secret_names:
+            continue
+        generic = f"{skill_name.replace('_', ' ').title()} API key"
+        specs.append((
+            skill_name,
+            tuple((name, _SKILL_SECRET_DESCRIPTIONS.get(name, generic)) for name in secret_names),
+        ))
+    return tuple(specs)
+
+
+def _skill_enabled(value):
+    """A skill setting may be a bool (or None) or an object with an .enabled attribute."""
+    return value.enabled if hasattr(value, "enabled") else value
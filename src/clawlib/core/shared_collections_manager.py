@@ -13,7 +13,8 @@ from pathlib import Path
 
 import schedule
 
-from clawlib.core.paths import Paths
+from clawlib.core.daemon import running_pid
+from clawlib.core.paths import get_paths
 from clawlib.models.config import Config, SharedCollectionsConfig
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ class SharedCollectionsManager:
 
     def __init__(self, config: Config) -> None:
         self.config = config
-        self.paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
+        self.paths = get_paths(config)
         self.shared_config = config.clawctl.shared_collections
 
     def sync_collection(self, name: str) -> bool:
@@ -261,7 +262,7 @@ class SharedCollectionsManager:
         """
         import subprocess
 
-        pid_file = self.paths.build_root / ".shared-collections-sync.pid"
+        pid_file = self.paths.shared_collections_pid_file
 
         if self.is_daemon_running():
             msg = "Shared collections sync daemon is already running"
@@ -285,7 +286,7 @@ class SharedCollectionsManager:
 
     def stop_daemon(self) -> bool:
         """Stop the sync daemon. Returns True if it was running."""
-        pid_file = self.paths.build_root / ".shared-collections-sync.pid"
+        pid_file = self.paths.shared_collections_pid_file
 
         if not pid_file.is_file():
             return False
@@ -300,22 +301,16 @@ class SharedCollectionsManager:
         pid_file.unlink(missing_ok=True)
         return True
 
-    def is_daemon_running(self) -> bool:
-        """Check if the sync daemon is currently running."""
-        pid_file = self.paths.build_root / ".shared-collections-sync.pid"
-
-        if not pid_file.is_file():
-            return False
+    def read_daemon_pid(self) -> int | None:
+        """Return the sync daemon's PID if it is running, else None.
 
-        pid = int(pid_file.read_text().strip())
+        Reads the PID file once; a stale PID file is removed.
+        """
+        return running_pid(self.paths.shared_collections_pid_file)
 
-        try:
-            os.kill(pid, 0)  # signal 0 = check existence
-            return True
-        except (ProcessLookupError, PermissionError):
-            # Stale PID file
-            pid_file.unlink(missing_ok=True)
-            return False
+    def is_daemon_running(self) -> bool:
+        """Check if the sync daemon is currently running."""
+        return self.read_daemon_pid() is not None
 
 
 def _run_daemon_main() -> None:
@@ -342,7 +337,7 @@ def _run_daemon_main() -> None:
         format="%(asctime)s [%(levelname)s] %(message)s",
         handlers=[
             logging.FileHandler(
-                Paths(config.clawctl.data_root, config.clawctl.build_root).logs_dir
+                get_paths(config).logs_dir
                 / "shared-collections-sync.log"
             ),
             logging.StreamHandler(),
@@ -7,10 +7,12 @@ import os
 import secrets
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
 
 from clawctl.core.docker_manager import DockerManager
+from clawlib.core.docker_manager import _MAX_PARALLEL
 from clawctl.core.openclaw_config import write_openclaw_config
 from clawctl.core.paths import Paths
 from clawctl.core.secrets import SecretsManager
@@ -20,6 +22,10 @@ logger = logging.getLogger(__name__)
 
 GATEWAY_TOKEN_SECRET_NAME = "openclaw_gateway_token"
 
+# Templates with fewer files than this are copied inline; a thread pool
+# is not worth starting for a handful of small files
+_PARALLEL_COPY_MIN = 16
+
 
 def _resolve_template_dir(
     user: UserConfig, defaults: DefaultsConfig
@@ -49,17 +55,35 @@ def copy_template(template_dir: Path, dest_dir: Path) -> list[Path]:
         msg = f"Template path is not a directory: {template_dir}"
         raise NotADirectoryError(msg)
 
+    # os.walk gets file/dir types from scandir, and each destination
+    # directory is created at most once rather than once per file.
+    # shutil.copy2 already copies contents in-kernel (sendfile) on Linux.
     copied: list[Path] = []
-    for src_path in template_dir.rglob("*"):
-        if src_path.is_dir():
-            continue
-        rel = src_path.relative_to(template_dir)
-        dst_path = dest_dir / rel
-        if dst_path.exists():
-            continue
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dst_path)
-        copied.append(rel)
+    sources: list[str] = []
+    targets: list[Path] = []
+    for root, _dirs, files in os.walk(template_dir):
+        rel_root = Path(root).relative_to(template_dir)
+        dst_root = dest_dir / rel_root
+        dst_root_ready = False
+        for name in files:
+            dst_path = dst_root / name
+            if dst_path.exists():
+                continue
+            if not dst_root_ready:
+                dst_root.mkdir(parents=True, exist_ok=True)
+                dst_root_ready = True
+            sources.append(os.path.join(root, name))
+            targets.append(dst_path)
+            copied.append(rel_root / name)
+
+    if len(sources) < _PARALLEL_COPY_MIN:
+        for src, dst in zip(sources, targets):
+            shutil.copy2(src, dst)
+    else:
+        # Copies are syscall-bound and release the GIL; list() re-raises
+        # the first failure
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL) as pool:
+            list(pool.map(shutil.copy2, sources, targets))
     return copied
 
 
@@ -71,6 +95,9 @@ class UserManager:
         self.paths = Paths(config.clawctl.data_root, config.clawctl.build_root)
         self.secrets = SecretsManager(self.paths)
         self.docker = DockerManager(config)
+        # Set once the image is known to exist, so provisioning several users
+        # in one run probes (or builds) it only once
+        self._image_ready = False
 
     def provision_user(
         self, user: UserConfig, secret_values: dict[str, str]
@@ -111,15 +138,10 @@ class UserManager:
             copy_template(template_dir, self.paths.user_openclaw_dir(user.name))
 
         # 3. Write secret files
-        for name, value in secret_values.items():
-            self.secrets.write_secret(user.name, name, value)
+        self.secrets.write_secrets(user.name, secret_values)
 
         # 4. Auto-generate a gateway token if not already present
-        if not self.secrets.secret_exists(user.name, GATEWAY_TOKEN_SECRET_NAME):
-            token = secrets.token_urlsafe(32)
-            self.secrets.write_secret(user.name, GATEWAY_TOKEN_SECRET_NAME, token)
-
-        gateway_token = self.secrets.read_secret(user.name, GATEWAY_TOKEN_SECRET_NAME)
+        gateway_token = self._ensure_gateway_token(user.name)
 
         # 5. Generate openclaw.json (includes gateway token for Docker NAT auth)
         # Determine base_path for reverse proxy setups
@@ -140,8 +162,10 @@ class UserManager:
             self._write_discord_allow_from(user.name, [user.channels.discord.owner_id])
 
         # 7. Create and start container
-        if not self.docker.image_exists():
-            self.docker.build_image()
+        if not self._image_ready:
+            if not self.docker.image_exists():
+                self.docker.build_image()
+            self._image_ready = True
         self.docker.create_container(user)
         self.docker.start_container(user.name)
         
@@ -156,6 +180,25 @@ class UserManager:
                 "Check container logs for details."
             )
 
+    def _ensure_gateway_token(self, username: str) -> str:
+        """Return the user's gateway token, generating and storing one if missing."""
+        token = self.secrets.read_secret(username, GATEWAY_TOKEN_SECRET_NAME)
+        if token:
+            return token
+        token = secrets.token_urlsafe(32)
+        # Linked into place only if absent: if a concurrent provision/restart
+        # won the race, keep its token
+        if self.secrets.write_secret_if_absent(username, GATEWAY_TOKEN_SECRET_NAME, token):
+            return token
+        existing = self.secrets.read_secret(username, GATEWAY_TOKEN_SECRET_NAME)
+        if existing:
+            return existing
+        # Never overwrite a token file someone else created, even an empty one
+        raise ValueError(
+            f"Gateway token file for '{username}' exists but is empty; "
+            "remove it to generate a new token"
+        )
+
     def _write_discord_allow_from(self, username: str, discord_ids: list[str]) -> None:
         """Write discord-allowFrom.json to pre-approve Discord users for DM access."""
         import json
@@ -191,34 +234,36 @@ class UserManager:
         if user is None:
             raise ValueError(f"User '{username}' not found in config")
 
-        # Ensure gateway token exists (generate if missing)
-        if not self.secrets.secret_exists(username, GATEWAY_TOKEN_SECRET_NAME):
-            token = secrets.token_urlsafe(32)
-            self.secrets.write_secret(username, GATEWAY_TOKEN_SECRET_NAME, token)
+        self._restart(user)
+
+    def _restart(self, user: UserConfig) -> bool:
+        """Regenerate a user's openclaw.json, restart the container and run doctor.
 
-        # Read gateway token
-        gateway_token = self.secrets.read_secret(username, GATEWAY_TOKEN_SECRET_NAME)
+        Returns whether ``openclaw doctor --fix`` succeeded.
+        """
+        # Ensure gateway token exists (generate if missing)
+        gateway_token = self._ensure_gateway_token(user.name)
 
         # Regenerate openclaw.json with gateway token (ensures auth is configured)
         # Determine base_path for reverse proxy setups
         from clawlib.core.openclaw_config import _is_tailscale_available
         use_tailscale_serve = _is_tailscale_available()
-        base_path = None if use_tailscale_serve else f"/gateway/{username}"
+        base_path = None if use_tailscale_serve else f"/gateway/{user.name}"
         
         write_openclaw_config(
             user,
             self.config.clawctl.defaults,
-            self.paths.user_openclaw_config(username),
+            self.paths.user_openclaw_config(user.name),
             gateway_token=gateway_token,
             base_path=base_path,
         )
 
         # Restart container
-        self.docker.restart_container(username)
+        self.docker.restart_container(user.name)
         
         # Run openclaw doctor --fix to ensure full authentication
         # This ensures gateway URL is properly authenticated and Discord/plugins are enabled
-        self.docker.run_doctor_fix(username)
+        return self.docker.run_doctor_fix(user.name)
 
     def restart_all(self) -> list[str]:
         """Restart all user containers.
@@ -230,47 +275,19 @@ class UserManager:
         """
         restarted = []
         for user in self.config.users:
-            if self.docker.container_exists(user.name):
-                try:
-                    # Ensure gateway token exists (generate if missing)
-                    if not self.secrets.secret_exists(user.name, GATEWAY_TOKEN_SECRET_NAME):
-                        token = secrets.token_urlsafe(32)
-                        self.secrets.write_secret(user.name, GATEWAY_TOKEN_SECRET_NAME, token)
-
-                    # Read gateway token
-                    gateway_token = self.secrets.read_secret(user.name, GATEWAY_TOKEN_SECRET_NAME)
-
-                    # Regenerate openclaw.json with gateway token (ensures auth is configured)
-                    # Determine base_path for reverse proxy setups
-                    from clawlib.core.openclaw_config import _is_tailscale_available
-                    use_tailscale_serve = _is_tailscale_available()
-                    base_path = None if use_tailscale_serve else f"/gateway/{user.name}"
-                    
-                    write_openclaw_config(
-                        user,
-                        self.config.clawctl.defaults,
-                        self.paths.user_openclaw_config(user.name),
-                        gateway_token=gateway_token,
-                        base_path=base_path,
+            if not self.docker.container_exists(user.name):
+                continue
+            try:
+                logger.info(f"Restarting {user.name} and running openclaw doctor --fix")
+                if not self._restart(user):
+                    logger.warning(
+                        f"openclaw doctor --fix failed for {user.name}. "
+                        "Gateway authentication may not be fully configured. "
+                        "Check container logs for details."
                     )
-
-                    # Restart container
-                    self.docker.restart_container(user.name)
-                    
-                    # Run openclaw doctor --fix to ensure full authentication
-                    # This ensures gateway URL is properly authenticated and Discord/plugins are enabled
-                    logger.info(f"Running openclaw doctor --fix for restarted user {user.name}")
-                    doctor_success = self.docker.run_doctor_fix(user.name)
-                    if not doctor_success:
-                        logger.warning(
-                            f"openclaw doctor --fix failed for {user.name}. "
-                            "Gateway authentication may not be fully configured. "
-                            "Check container logs for details."
-                        )
-                    
-                    restarted.append(user.name)
-                except Exception:
-                    pass
+            except Exception:
+                continue
+            restarted.append(user.name)
         return restarted
 
     def remove_user(self, username: str, *, keep_data: bool = True) -> None:
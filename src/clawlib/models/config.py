@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Literal
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator, model_validator
+
+from clawlib.core.config import resolve_config_path
 
 
 class ChannelSlackConfig(BaseModel):
@@ -25,6 +27,13 @@ class ChannelsConfig(BaseModel):
     slack: ChannelSlackConfig = ChannelSlackConfig()
     discord: ChannelDiscordConfig = ChannelDiscordConfig()
 
+    # Channel sections, in display order
+    NAMES: ClassVar[tuple[str, ...]] = ("slack", "discord")
+
+    def enabled_names(self) -> list[str]:
+        """Names of the enabled channels, in display order."""
+        return [name for name in self.NAMES if getattr(self, name).enabled]
+
 
 class UserAgentConfig(BaseModel):
     model: str = "openrouter/z-ai/glm-4.5-air:free"
@@ -110,6 +119,10 @@ class UserGitConfig(BaseModel):
     repos: list[GitRepoConfig] = Field(default_factory=list)
 
 
+# Usernames become container, network and directory names
+_USERNAME_RE = re.compile(r"[a-z0-9][a-z0-9-]{0,31}")
+
+
 class UserConfig(BaseModel):
     name: str
     port: int | None = Field(default=None, ge=1024, le=65535, description="Fixed host port for the gateway (optional; random if unset)")
@@ -123,7 +136,7 @@ class UserConfig(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not re.match(r"^[a-z0-9][a-z0-9-]{0,31}$", v):
+        if _USERNAME_RE.fullmatch(v) is None:
             msg = "Username must be 1-32 lowercase alphanumeric characters or hyphens, starting with alphanumeric"
             raise ValueError(msg)
         return v
@@ -328,13 +341,66 @@ class Config(BaseModel):
 
     model_config = {"extra": "allow"}
 
-    def get_user(self, name: str) -> UserConfig | None:
-        """Get a user config by name."""
+    # (users list, its length, {name: user}, usernames) built on first lookup
+    _users_index: (
+        tuple[list[UserConfig], int, dict[str, UserConfig], tuple[str, ...]] | None
+    ) = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def resolve_paths(self, info: ValidationInfo) -> "Config":
+        """Resolve relative paths against ``context["config_dir"]``, if given.
+
+        data_root, build_root and workspace templates are relative to the
+        config file's directory; knowledge_dir is relative to data_root.
+        """
+        config_dir = (info.context or {}).get("config_dir")
+        if config_dir is None:
+            return self
+
+        settings = self.clawctl
+        settings.data_root = resolve_config_path(settings.data_root, config_dir)
+        settings.build_root = resolve_config_path(settings.build_root, config_dir)
+
+        kd = settings.knowledge_dir
+        if kd is not None:
+            settings.knowledge_dir = (
+                resolve_config_path(kd, Path("/")) if kd.is_absolute() else settings.data_root / kd
+            )
+
+        if settings.defaults.workspace_template is not None:
+            settings.defaults.workspace_template = resolve_config_path(
+                settings.defaults.workspace_template, config_dir
+            )
         for user in self.users:
-            if user.name == name:
-                return user
-        return None
+            if user.workspace_template is not None:
+                user.workspace_template = resolve_config_path(user.workspace_template, config_dir)
+        return self
+
+    def get_user(self, name: str) -> UserConfig | None:
+        """Get a user config by name.
+
+        The name index is rebuilt whenever ``users`` is replaced or changes
+        length; call :meth:`rebuild_index` after replacing entries in place.
+        """
+        return self._index()[2].get(name)
 
     def get_usernames(self) -> list[str]:
         """Get all configured usernames."""
-        return [u.name for u in self.users]
+        return list(self._index()[3])
+
+    def rebuild_index(self) -> None:
+        """Drop the cached name index so the next lookup rebuilds it."""
+        self._users_index = None
+
+    def _index(self) -> tuple[list[UserConfig], int, dict[str, UserConfig], tuple[str, ...]]:
+        users = self.users
+        index = self._users_index
+        if index is None or index[0] is not users or index[1] != len(users):
+            # reversed() so the first user with a given name wins, as in a linear scan
+            index = self._users_index = (
+                users,
+                len(users),
+                {u.name: u for u in reversed(users)},
+                tuple(u.name for u in users),
+            )
+        return index
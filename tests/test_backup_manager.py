@@ -85,3 +85,47 @@ class TestBackupManager:
         manager.paths.backup_pid_file.write_text("99999999")
         assert manager.is_daemon_running() is False
         assert not manager.paths.backup_pid_file.exists()
+
+
+class TestRunningPid:
+    def test_missing_pid_file(self, tmp_path: Path):
+        from clawlib.core.daemon import running_pid
+
+        assert running_pid(tmp_path / ".backup.pid") is None
+
+    def test_live_process(self, tmp_path: Path):
+        import os
+
+        from clawlib.core.daemon import running_pid
+
+        pid_file = tmp_path / ".backup.pid"
+        pid_file.write_text(f"{os.getpid()}\n")
+        assert running_pid(pid_file) == os.getpid()
+
+    def test_stale_pid_file_removed(self, tmp_path: Path):
+        from clawlib.core.daemon import running_pid
+
+        pid_file = tmp_path / ".backup.pid"
+        pid_file.write_text("99999999")
+        assert running_pid(pid_file) is None
+        assert not pid_file.exists()
+
+
+class TestReadDaemonPid:
+    @pytest.fixture
+    def manager(self, sample_config: Config):
+        from clawlib.core.backup_manager import BackupManager as LibBackupManager
+
+        sample_config.clawctl.build_root.mkdir(parents=True, exist_ok=True)
+        return LibBackupManager(sample_config)
+
+    def test_not_running(self, manager):
+        assert manager.read_daemon_pid() is None
+        assert manager.is_daemon_running() is False
+
+    def test_running(self, manager):
+        import os
+
+        manager.paths.backup_pid_file.write_text(str(os.getpid()))
+        assert manager.read_daemon_pid() == os.getpid()
+        assert manager.is_daemon_running() is True
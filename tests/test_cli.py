@@ -0,0 +1,100 @@
+"""Tests for CLI command registration."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from clawctl.cli import app, LazyTyperGroup
+
+
+def _modules_after(code: str) -> set[str]:
+    """Return the clawctl/clawlib modules loaded by running *code* in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {m for m in result.stdout.split() if m.startswith(("clawctl", "clawlib"))}
+
+
+class TestLazyCommands:
+    def test_import_does_not_load_commands(self):
+        loaded = _modules_after("import clawctl.cli")
+        assert not any(m.startswith("clawctl.commands") for m in loaded)
+        assert not any(m.startswith("clawlib") for m in loaded)
+
+    @pytest.mark.parametrize("module", ["backup", "clean", "config_cmd", "gog", "init", "lifecycle", "logs", "update", "user"])
+    def test_command_module_import_is_light(self, module: str):
+        loaded = _modules_after(f"import clawctl.commands.{module}")
+        assert not any(m.startswith("clawlib") for m in loaded)
+
+    def test_version(self):
+        result = CliRunner().invoke(app, ["--version"])
+        assert result.exit_code == 0
+        assert "clawctl" in result.output
+
+    def test_help_does_not_load_commands(self):
+        loaded = _modules_after(
+            "import sys\nsys.argv = ['clawctl', '--help']\nfrom clawctl.cli import app\n"
+            "try:\n    app()\nexcept SystemExit:\n    pass"
+        )
+        assert not any(m.startswith("clawctl.commands") for m in loaded)
+        assert not any(m.startswith("clawlib") for m in loaded)
+
+    def test_help_lists_short_help(self):
+        result = CliRunner().invoke(app, ["instance", "--help"])
+        assert result.exit_code == 0
+        assert "Rebuild the Docker image" in result.output
+
+    def test_short_help_matches_docstrings(self):
+        import importlib
+        import inspect
+
+        from clawctl.cli import _COMMANDS
+
+        for _target, name, ref, short_help in _COMMANDS:
+            module_name, _, attr = ref.partition(":")
+            doc = inspect.getdoc(getattr(importlib.import_module(module_name), attr)) or ""
+            assert " ".join(doc.split("\n\n")[0].split()) == short_help, name
+
+    def test_subcommand_help_resolves_lazily(self):
+        result = CliRunner().invoke(app, ["backup", "schedule", "--help"])
+        assert result.exit_code == 0
+        for name in ("start", "stop", "status"):
+            assert name in result.output
+
+    def test_all_references_resolve(self):
+        import importlib
+
+        def walk(group_cls):
+            for ref in group_cls.lazy_commands.values():
+                module_name, _, attr = ref.partition(":")
+                assert callable(getattr(importlib.import_module(module_name), attr)), ref
+
+        groups = [app, *(info.typer_instance for info in app.registered_groups)]
+        while groups:
+            typer_app = groups.pop()
+            assert issubclass(typer_app.info.cls, LazyTyperGroup)
+            walk(typer_app.info.cls)
+            groups.extend(info.typer_instance for info in typer_app.registered_groups)
+
+
+class TestEntryPoint:
+    def test_version_skips_typer(self):
+        loaded = _modules_after(
+            "import sys\nsys.argv = ['clawctl', '--version']\nfrom clawctl.__main__ import main\nmain()"
+        )
+        assert "clawctl.cli" not in loaded
+
+    def test_version_output(self, capsys, monkeypatch):
+        from clawctl import __version__
+        from clawctl.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["clawctl", "-v"])
+        main()
+        assert capsys.readouterr().out.strip() == f"clawctl {__version__}"
@@ -53,6 +53,13 @@ class TestConfigModels:
                 secrets={"openrouter_api_key": "key"},
             )
 
+    def test_clawlib_username_rejects_trailing_newline(self):
+        from clawlib.models.config import UserConfig as LibUserConfig
+
+        assert LibUserConfig(name="a" * 32, secrets={}).name == "a" * 32
+        with pytest.raises(ValueError, match="lowercase"):
+            LibUserConfig(name="alice\n", secrets={})
+
     def test_config_get_user(self, sample_config: Config):
         user = sample_config.get_user("testuser")
         assert user is not None
@@ -61,9 +68,39 @@ class TestConfigModels:
     def test_config_get_user_not_found(self, sample_config: Config):
         assert sample_config.get_user("nobody") is None
 
+    def test_config_get_user_tracks_users(self, sample_config: Config, sample_user):
+        sample_config.users.append(sample_user.model_copy(update={"name": "other"}))
+        assert sample_config.get_user("other") is sample_config.users[-1]
+        sample_config.users = []
+        assert sample_config.get_user("testuser") is None
+
+    def test_clawlib_config_user_index(self, sample_user):
+        from clawlib.models.config import Config as LibConfig, UserConfig as LibUserConfig
+
+        user = LibUserConfig.model_validate(sample_user.model_dump())
+        cfg = LibConfig(clawctl={}, users=[user, user.model_copy(update={"name": "testuser"})])
+        assert cfg.get_user("testuser") is user
+        assert cfg.get_usernames() == ["testuser", "testuser"]
+
+        cfg.users.append(user.model_copy(update={"name": "other"}))
+        assert cfg.get_user("other") is cfg.users[-1]
+        cfg.users[-1] = user.model_copy(update={"name": "renamed"})
+        cfg.rebuild_index()
+        assert cfg.get_user("other") is None
+        assert cfg.get_usernames()[-1] == "renamed"
+        cfg.users = []
+        assert cfg.get_user("testuser") is None
+
     def test_config_get_usernames(self, sample_config: Config):
         assert sample_config.get_usernames() == ["testuser"]
 
+    def test_enabled_channel_names(self):
+        from clawlib.models.config import ChannelsConfig
+
+        assert ChannelsConfig().enabled_names() == []
+        channels = ChannelsConfig(slack={"enabled": True}, discord={"enabled": True})
+        assert channels.enabled_names() == ["slack", "discord"]
+
 
 class TestConfigLoading:
     def test_load_valid_toml(self, tmp_path: Path, sample_config_toml: str):
@@ -119,6 +156,22 @@ openrouter_api_key = "openrouter_api_key"
         assert cfg.clawctl.build_root == tmp_path / "build"
         assert cfg.clawctl.build_root.is_absolute()
 
+    def test_paths_resolved_only_with_context(self, tmp_path: Path):
+        """The model resolves paths during validation when given a config_dir."""
+        from clawlib.models.config import Config as LibConfig
+
+        raw = {
+            "clawctl": {"data_root": "data", "knowledge_dir": "kb"},
+            "users": [{"name": "testuser", "workspace_template": "tpl", "secrets": {}}],
+        }
+        cfg = LibConfig.model_validate(raw, context={"config_dir": tmp_path})
+        assert cfg.clawctl.data_root == tmp_path / "data"
+        assert cfg.clawctl.knowledge_dir == tmp_path / "data" / "kb"
+        assert cfg.users[0].workspace_template == tmp_path / "tpl"
+
+        cfg = LibConfig.model_validate(raw)
+        assert cfg.clawctl.data_root == Path("data")
+
     def test_absolute_roots_preserved(self, tmp_path: Path):
         """Absolute data_root and build_root stay as-is."""
         abs_data = tmp_path / "my-data"
@@ -283,3 +336,186 @@ openrouter_api_key = "openrouter_api_key"
 """)
         cfg = load_config(config_file)
         assert cfg.users[0].skills.gog.email is None
+
+
+class TestLoadPaths:
+    """clawlib.core.config.load_paths resolves roots without validating the config."""
+
+    def test_matches_load_config(self, tmp_path: Path, sample_config_toml: str):
+        from clawlib.core.config import load_config as lib_load_config, load_paths
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        cfg = lib_load_config(config_file)
+        paths = load_paths(config_file)
+        assert paths.data_root == cfg.clawctl.data_root
+        assert paths.build_root == cfg.clawctl.build_root
+
+    def test_defaults_match_settings(self, tmp_path: Path):
+        from clawlib.core.config import load_paths
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text("[clawctl]\n")
+        paths = load_paths(config_file)
+        settings = ClawctlSettings()
+        assert paths.data_root == (tmp_path / settings.data_root).resolve()
+        assert paths.build_root == (tmp_path / settings.build_root).resolve()
+
+    def test_invalid_toml(self, tmp_path: Path):
+        from clawlib.core.config import load_paths
+
+        config_file = tmp_path / "bad.toml"
+        config_file.write_text("this is not [valid toml")
+        with pytest.raises(ValueError, match="Invalid TOML"):
+            load_paths(config_file)
+
+
+class TestLoadConfigCached:
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        cache = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+        monkeypatch.delenv("CLAWCTL_NO_CONFIG_CACHE", raising=False)
+        monkeypatch.setattr("clawlib.core.config._LOADED", {})
+        return cache
+
+    def test_second_load_uses_cache(
+        self, tmp_path: Path, sample_config_toml: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        from clawlib.core import config as lib_config
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        first = lib_config.load_config_cached(config_file)
+
+        def fail(path):
+            raise AssertionError("load_config should not be called on a cache hit")
+
+        monkeypatch.setattr(lib_config, "load_config", fail)
+        lib_config._LOADED.clear()  # force the on-disk cache
+        second = lib_config.load_config_cached(config_file)
+        assert second == first
+        assert second is not first
+
+    def test_same_process_reuses_object(self, tmp_path: Path, sample_config_toml: str):
+        from clawlib.core.config import load_config_cached
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        assert load_config_cached(config_file) is load_config_cached(config_file)
+
+    def test_edit_invalidates_cache(self, tmp_path: Path, sample_config_toml: str):
+        import os
+
+        from clawlib.core.config import load_config_cached
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        assert load_config_cached(config_file).clawctl.openclaw_version == "latest"
+
+        config_file.write_text(sample_config_toml.replace('"latest"', '"1.2.3"'))
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config_cached(config_file).clawctl.openclaw_version == "1.2.3"
+
+        from clawlib.core.config import _LOADED
+
+        assert list(_LOADED) == [config_file.resolve()]
+
+    @pytest.mark.parametrize("target", ["clawctl.__version__", "pydantic.VERSION"])
+    def test_upgrade_invalidates_cache(
+        self, tmp_path: Path, sample_config_toml: str, monkeypatch: pytest.MonkeyPatch, target: str
+    ):
+        from clawlib.core import config as lib_config
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        first = lib_config.load_config_cached(config_file)
+
+        monkeypatch.setattr(target, "999.0")
+        lib_config._LOADED.clear()
+        calls = []
+        monkeypatch.setattr(lib_config, "load_config", lambda path: calls.append(path) or first)
+        lib_config.load_config_cached(config_file)
+        assert calls == [config_file]
+
+    def test_init_primes_cache(
+        self, tmp_path: Path, cache_home: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        from typer.testing import CliRunner
+
+        from clawctl.cli import app
+
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(app, ["init"])
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "clawctl.toml").is_file()
+        assert list((cache_home / "clawctl").glob("config-*.pkl"))
+
+    def test_corrupt_cache_falls_back(
+        self, tmp_path: Path, sample_config_toml: str, cache_home: Path
+    ):
+        from clawlib.core.config import load_config_cached
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        load_config_cached(config_file)
+        for cache_file in (cache_home / "clawctl").iterdir():
+            data = cache_file.read_bytes()
+            cache_file.write_bytes(data[: data.index(b"\n") + 1] + b"garbage")
+
+        assert load_config_cached(config_file).users[0].name == "testuser"
+
+    @pytest.mark.parametrize("target", ["file", "dir"])
+    def test_writable_by_others_cache_ignored(
+        self,
+        tmp_path: Path,
+        sample_config_toml: str,
+        cache_home: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        target: str,
+    ):
+        from clawlib.core import config as lib_config
+
+        config_file = tmp_path / "clawctl.toml"
+        config_file.write_text(sample_config_toml)
+        lib_config.load_config_cached(config_file)
+        cache_dir = cache_home / "clawctl"
+        (cache_file,) = cache_dir.glob("config-*.pkl")
+        (cache_file if target == "file" else cache_dir).chmod(0o777 if target == "dir" else 0o666)
+
+        calls = []
+        monkeypatch.setattr(lib_config, "load_config", lambda path: calls.append(path) or "fresh")
+        lib_config._LOADED.clear()
+        assert lib_config.load_config_cached(config_file) == "fresh"
+        assert calls == [config_file]
+
+
+class TestFindConfigPath:
+    def test_hits_are_remembered(self, tmp_path: Path, monkeypatch):
+        from clawlib.core import config as lib_config
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CLAWCTL_CONFIG", raising=False)
+        monkeypatch.setattr(lib_config, "_FOUND", {})
+
+        assert lib_config.find_config_path() is None
+        (tmp_path / "clawctl.toml").touch()
+        assert lib_config.find_config_path() == tmp_path / "clawctl.toml"
+
+        monkeypatch.setattr(lib_config, "_search_config_path", None)
+        assert lib_config.find_config_path() == tmp_path / "clawctl.toml"
+
+    def test_removed_config_is_searched_again(self, tmp_path: Path, monkeypatch):
+        from clawlib.core import config as lib_config
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(lib_config, "_FOUND", {})
+        config_file = tmp_path / "clawctl.toml"
+        config_file.touch()
+        monkeypatch.setenv("CLAWCTL_CONFIG", str(config_file))
+        assert lib_config.find_config_path() == config_file
+
+        config_file.rename(tmp_path / "moved.toml")
+        assert lib_config.find_config_path() is None
+        assert lib_config._FOUND == {}
@@ -0,0 +1,75 @@
+"""Tests for the shared console helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from clawctl.utils.console import PlainConsole, spinner, strip_markup, styled_status
+
+
+class TestStripMarkup:
+    def test_removes_tags(self):
+        assert strip_markup("[green]ok[/green] done") == "ok done"
+        assert strip_markup("[bold red]x[/]") == "x"
+
+    def test_keeps_non_tags(self):
+        assert strip_markup("list [1, 2] and [") == "list [1, 2] and ["
+
+    def test_escaped_tag(self):
+        assert strip_markup(r"\[bold] literal") == "[bold] literal"
+
+
+class TestPlainConsole:
+    def test_print_strips_markup(self, capsys):
+        PlainConsole().print("[green]Backup daemon is running[/green] (PID 1)")
+        assert capsys.readouterr().out == "Backup daemon is running (PID 1)\n"
+
+    def test_print_stderr(self, capsys):
+        PlainConsole(stderr=True).print("[red]Config error:[/red] bad")
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == "Config error: bad\n"
+
+    def test_renderables_fall_back_to_rich(self, capsys):
+        from rich.table import Table
+
+        table = Table("User")
+        table.add_row("alice")
+        PlainConsole().print(table)
+        out = capsys.readouterr().out
+        assert "alice" in out
+        assert "\x1b[" not in out
+
+    def test_status_is_noop(self):
+        with PlainConsole().status("Running backup..."):
+            pass
+
+
+class TestSpinner:
+    def test_noop_when_not_a_terminal(self):
+        from rich.console import Console
+
+        console = Console(force_terminal=False)
+        with spinner(console, "Working...") as status:
+            assert status is None
+
+    def test_status_on_terminal(self):
+        from rich.console import Console
+        from rich.status import Status
+
+        console = Console(force_terminal=True)
+        with spinner(console, "Working...") as status:
+            assert isinstance(status, Status)
+
+
+class TestStyledStatus:
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            ("running", "[green]running[/green]"),
+            ("exited", "[red]exited[/red]"),
+            ("not found", "[dim]not found[/dim]"),
+        ],
+    )
+    def test_styles(self, status: str, expected: str):
+        assert styled_status(status) == expected
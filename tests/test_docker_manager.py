@@ -23,6 +23,36 @@ class TestNaming:
         assert _network_name("alice") == "openclaw-net-alice"
 
 
+class TestDiscoverDockerHost:
+    @pytest.fixture
+    def dm(self, monkeypatch):
+        from clawlib.core import docker_manager
+
+        monkeypatch.delenv("DOCKER_HOST", raising=False)
+        docker_manager._probe_docker_socket.cache_clear()
+        yield docker_manager
+        docker_manager._probe_docker_socket.cache_clear()
+
+    def test_env_wins(self, dm, monkeypatch):
+        monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.1:2375")
+        assert dm._discover_docker_host() == "tcp://10.0.0.1:2375"
+
+    def test_default_socket(self, dm, monkeypatch, tmp_path):
+        default = tmp_path / "docker.sock"
+        default.touch()
+        monkeypatch.setattr(dm, "_DEFAULT_DOCKER_SOCKET", str(default))
+        assert dm._discover_docker_host() is None
+
+    def test_alternative_socket_probed_once(self, dm, monkeypatch, tmp_path):
+        colima = tmp_path / "colima.sock"
+        colima.touch()
+        monkeypatch.setattr(dm, "_DEFAULT_DOCKER_SOCKET", str(tmp_path / "missing.sock"))
+        monkeypatch.setattr(dm, "_DOCKER_SOCKET_CANDIDATES", [str(colima)])
+        assert dm._discover_docker_host() == f"unix://{colima}"
+        colima.unlink()
+        assert dm._discover_docker_host() == f"unix://{colima}"
+
+
 class TestDockerManager:
     @pytest.fixture
     def mock_client(self):
@@ -112,3 +142,179 @@ class TestDockerManager:
         assert "/home/node/.openclaw" in binds
         assert "/run/secrets" in binds
         assert binds["/run/secrets"]["mode"] == "ro"
+
+
+class TestBatchedLookups:
+    """clawlib DockerManager lookups that cover all users in one API call."""
+
+    @pytest.fixture
+    def mock_client(self):
+        from clawlib.core import docker_manager as lib_dm
+
+        with (
+            patch("clawlib.core.docker_manager._discover_docker_host", return_value=None),
+            patch("clawlib.core.docker_manager.docker.from_env") as mock_from_env,
+        ):
+            client = MagicMock()
+            mock_from_env.return_value = client
+            lib_dm._shared_client.cache_clear()
+            yield client
+            lib_dm._shared_client.cache_clear()
+
+    @pytest.fixture
+    def manager(self, sample_config: Config, mock_client):
+        from clawlib.core.docker_manager import DockerManager as LibDockerManager
+
+        return LibDockerManager(sample_config)
+
+    def test_managers_share_client(self, sample_config: Config, manager, mock_client):
+        from clawlib.core.docker_manager import DockerManager as LibDockerManager
+
+        assert LibDockerManager(sample_config).client is manager.client is mock_client
+
+    def test_client_connects_on_first_use(self, manager):
+        from clawlib.core.docker_manager import DockerManager as LibDockerManager
+
+        with patch("clawlib.core.docker_manager._shared_client") as shared:
+            lazy = LibDockerManager(manager.config)
+            shared.assert_not_called()
+            assert lazy.client is lazy.client
+            shared.assert_called_once()
+
+    def test_existing_containers(self, manager, mock_client):
+        mock_client.containers.list.return_value = [
+            MagicMock(attrs={"Names": ["/openclaw-testuser"]}),
+            MagicMock(attrs={"Names": ["/openclaw-testuser-old"]}),
+        ]
+        assert manager.existing_containers() == {"testuser"}
+        mock_client.containers.list.assert_called_once()
+        assert mock_client.containers.list.call_args.kwargs["sparse"] is True
+        mock_client.containers.get.assert_not_called()
+
+    def test_existing_containers_none(self, manager, mock_client):
+        mock_client.containers.list.return_value = []
+        assert manager.existing_containers() == set()
+
+    def test_existing_networks_exact_match(self, manager, mock_client):
+        net = MagicMock()
+        net.name = "openclaw-net-testuser2"
+        mock_client.networks.list.return_value = [net]
+        assert manager.existing_networks() == set()
+
+        net.name = "openclaw-net-testuser"
+        assert manager.existing_networks() == {"testuser"}
+
+    def test_get_all_statuses_single_call(self, manager, mock_client):
+        mock_client.containers.list.return_value = [
+            MagicMock(
+                attrs={
+                    "Names": ["/openclaw-testuser"],
+                    "State": "running",
+                    "Ports": [
+                        {"PrivatePort": 18789, "PublicPort": 18790, "Type": "tcp", "IP": "127.0.0.1"},
+                    ],
+                }
+            ),
+        ]
+        assert manager.get_all_statuses() == {"testuser": {"status": "running", "port": "18790"}}
+        mock_client.containers.get.assert_not_called()
+
+        mock_client.containers.list.return_value = [
+            MagicMock(attrs={"Names": ["/openclaw-testuser"], "State": "exited", "Ports": []}),
+        ]
+        assert manager.get_all_statuses() == {"testuser": {"status": "exited", "port": "-"}}
+
+        mock_client.containers.list.return_value = []
+        assert manager.get_all_statuses() == {"testuser": {"status": "not found", "port": "-"}}
+
+    def test_image_exists_cached(self, manager, mock_client):
+        mock_client.images.get.side_effect = docker.errors.ImageNotFound("missing")
+        assert manager.image_exists() is False
+        assert manager.image_exists() is False
+        mock_client.images.get.assert_called_once()
+
+        with patch("clawlib.core.docker_manager.subprocess.run"):
+            manager.build_image()
+        assert manager.image_exists() is True
+        mock_client.images.get.assert_called_once()
+
+    def test_build_image_uses_buildkit(self, manager, monkeypatch):
+        monkeypatch.delenv("DOCKER_BUILDKIT", raising=False)
+        with patch("clawlib.core.docker_manager.subprocess.run") as mock_run:
+            manager.build_image()
+        assert mock_run.call_args.kwargs["env"]["DOCKER_BUILDKIT"] == "1"
+
+        monkeypatch.setenv("DOCKER_BUILDKIT", "0")
+        with patch("clawlib.core.docker_manager.subprocess.run") as mock_run:
+            manager.build_image()
+        assert mock_run.call_args.kwargs["env"]["DOCKER_BUILDKIT"] == "0"
+
+    def test_stream_logs_decodes_split_characters(self, manager, mock_client):
+        data = "héllo ✓\n".encode()
+        mock_client.api.logs.return_value = iter([data[:2], data[2:-3], data[-3:]])
+        assert "".join(manager.stream_logs("testuser", tail=5)) == "héllo ✓\n"
+        mock_client.api.logs.assert_called_once_with(
+            "openclaw-testuser", stream=True, follow=False, tail=5
+        )
+        mock_client.containers.get.assert_not_called()
+
+    def test_get_container_info(self, manager, mock_client):
+        attrs = {
+            "State": {"Status": "running"},
+            "NetworkSettings": {"Ports": {"18789/tcp": [{"HostPort": "54321"}]}},
+        }
+        mock_client.api.inspect_container.return_value = attrs
+        assert manager.get_container_info("testuser") == ("running", "54321")
+        mock_client.api.inspect_container.assert_called_once_with("openclaw-testuser")
+        mock_client.containers.get.assert_not_called()
+
+        attrs["State"]["Status"] = "exited"
+        assert manager.get_container_info("testuser") == ("exited", None)
+        assert manager.get_container_status("testuser") == "exited"
+        assert manager.get_container_port("testuser") == "54321"
+
+        mock_client.api.inspect_container.side_effect = docker.errors.NotFound("gone")
+        assert manager.get_container_info("testuser") == ("not found", None)
+        assert manager.container_exists("testuser") is False
+
+    def test_create_container_uses_low_level_api(self, manager, mock_client, sample_user):
+        from clawlib.models.config import UserConfig as LibUserConfig
+
+        user = LibUserConfig.model_validate(sample_user.model_dump())
+        mock_client.api.create_host_config.side_effect = lambda **kw: kw
+        with patch("clawlib.core.docker_manager.subprocess.run"):
+            manager.create_container(user)
+
+        mock_client.containers.create.assert_not_called()
+        kwargs = mock_client.api.create_container.call_args.kwargs
+        host_config = kwargs["host_config"]
+        assert host_config["network_mode"] == "openclaw-net-testuser"
+        assert host_config["restart_policy"] == {"Name": "unless-stopped"}
+        binds = {v["bind"]: v["mode"] for v in host_config["binds"].values()}
+        assert binds["/home/node/.config"] == "rw"
+        assert binds["/run/secrets"] == "ro"
+        assert set(kwargs["volumes"]) == set(binds)
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_start_all(self, manager, mock_client, parallel):
+        mock_client.containers.list.return_value = [
+            MagicMock(attrs={"Names": ["/openclaw-testuser"], "State": "exited"}),
+        ]
+        assert manager.start_all(parallel=parallel) == ["testuser"]
+        mock_client.containers.get.return_value.start.assert_called_once()
+
+    def test_rebuild_all_is_serial_by_default(self, manager, mock_client):
+        mock_client.containers.list.return_value = []
+        with patch.object(manager, "build_image"), patch.object(manager, "_for_each") as for_each:
+            manager.rebuild_all()
+        assert for_each.call_args.kwargs["parallel"] is False
+
+    def test_parallel_failures_are_grouped(self, manager, sample_user):
+        users = [sample_user, sample_user.model_copy(update={"name": "other"})]
+
+        def action(user):
+            raise RuntimeError(user.name)
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            manager._for_each(users, action, parallel=True)
+        assert sorted(str(e) for e in excinfo.value.exceptions) == ["other", sample_user.name]
@@ -0,0 +1,218 @@
+"""Tests for gog command helpers (mocked Docker SDK)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import docker.errors
+import pytest
+
+from clawctl.commands import gog
+
+
+@pytest.fixture(autouse=True)
+def _clear_container_cache():
+    gog._CONTAINER_CACHE.clear()
+    yield
+    gog._CONTAINER_CACHE.clear()
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    container = client.containers.get.return_value
+    container.status = "running"
+    container.exec_run.return_value = MagicMock(exit_code=0, output=b"ok\n")
+    return client
+
+
+class TestContainerCache:
+    def test_one_lookup_for_repeated_execs(self, client):
+        for _ in range(3):
+            assert gog._exec_in_container(client, "openclaw-alice", ["true"]) == (0, "ok\n")
+        client.containers.get.assert_called_once_with("openclaw-alice")
+        client.containers.get.return_value.reload.assert_not_called()
+
+    def test_reloads_stale_state(self, client, monkeypatch):
+        gog._get_container(client, "openclaw-alice")
+        monkeypatch.setattr(gog, "CONTAINER_RELOAD_INTERVAL", -1.0)
+        gog._get_container(client, "openclaw-alice")
+        client.containers.get.return_value.reload.assert_called_once()
+
+    def test_not_found(self, client):
+        client.containers.get.side_effect = docker.errors.NotFound("gone")
+        code, output = gog._exec_in_container(client, "openclaw-alice", ["true"])
+        assert code == 1
+        assert "not found" in output
+        assert not gog._CONTAINER_CACHE
+
+    def test_api_error_invalidates(self, client):
+        client.containers.get.return_value.exec_run.side_effect = docker.errors.APIError(
+            "409 Conflict: container is restarting"
+        )
+        code, _ = gog._exec_in_container(client, "openclaw-alice", ["true"])
+        assert code == 1
+        assert not gog._CONTAINER_CACHE
+
+
+class TestExecBatch:
+    def test_splits_sections(self, client):
+        client.containers.get.return_value.exec_run.return_value = MagicMock(
+            exit_code=0,
+            output=b"===status===\nconfig_exists true\n\n===rc=0===\n===file===\n\n===rc=1===\n",
+        )
+        results = gog._exec_batch(client, "openclaw-alice", {"status": "gog auth status", "file": "test -f x"})
+        assert results == {"status": (0, "config_exists true\n"), "file": (1, "")}
+        cmd = client.containers.get.return_value.exec_run.call_args.args[0]
+        assert cmd[:2] == ["sh", "-c"]
+        assert "gog auth status" in cmd[2] and "test -f x" in cmd[2]
+
+    def test_passes_env(self, client):
+        gog._exec_batch(client, "openclaw-alice", {"list": "gog auth list"}, env={"GOG_KEYRING_PASSWORD": "pw"})
+        kwargs = client.containers.get.return_value.exec_run.call_args.kwargs
+        assert kwargs["environment"] == {"GOG_KEYRING_PASSWORD": "pw"}
+
+    def test_exec_failure_applies_to_every_probe(self, client):
+        client.containers.get.return_value.status = "exited"
+        results = gog._exec_batch(client, "openclaw-alice", {"a": "true", "b": "true"})
+        assert results["a"] == results["b"]
+        assert results["a"][0] == 1
+        assert "not running" in results["a"][1]
+
+
+class TestCredsReport:
+    REPORT = {
+        "path": "/home/node/.config/gogcli/credentials.json",
+        "exists": True,
+        "error": None,
+        "format": "installed wrapper",
+        "keys": ["installed"],
+        "flat_client_id": False,
+        "installed_client_id": True,
+        "flat_client_secret": False,
+        "installed_client_secret": True,
+        "client_id_prefix": "123-abc.apps.googleusercontent",
+        "client_id_length": 34,
+        "client_id_format_valid": True,
+        "client_secret_length": 24,
+        "has_auth_uri": True,
+        "has_token_uri": False,
+    }
+
+    def test_parse(self):
+        import json
+
+        assert gog._parse_creds_report(0, json.dumps(self.REPORT) + "\n") == self.REPORT
+        assert gog._parse_creds_report(1, "Cannot find module") is None
+        assert gog._parse_creds_report(0, "not json") is None
+
+    def test_valid(self):
+        assert gog._creds_problem(self.REPORT, "") is None
+        lines = gog._creds_details(self.REPORT)
+        assert "Format: installed wrapper" in lines
+        assert "Has token_uri: no" in lines
+
+    @pytest.mark.parametrize(
+        ("changes", "problem"),
+        [
+            ({"exists": False}, "file not found"),
+            ({"error": "Unexpected token"}, "invalid: Unexpected token"),
+            ({"client_id_length": 0}, "missing client_id"),
+            ({"client_secret_length": 0}, "missing client_secret"),
+        ],
+    )
+    def test_problems(self, changes, problem):
+        assert gog._creds_problem({**self.REPORT, **changes}, "") == problem
+
+    def test_validator_missing(self):
+        assert "Rebuild the image" in gog._creds_problem(None, "Cannot find module")
+
+
+class TestExecLines:
+    def test_reassembles_lines_and_stops_early(self, client):
+        closed = []
+
+        def frames():
+            try:
+                yield (b"starting\nauth_", None)
+                yield (None, b"warning\n")
+                yield (b"url\thttps://accounts.google.com/o?x=1\n", None)
+                yield (b"never read\n", None)
+            finally:
+                closed.append(True)
+
+        client.containers.get.return_value.exec_run.return_value = MagicMock(exit_code=None, output=frames())
+        lines = gog._exec_lines(client, "openclaw-alice", ["gog"])
+        assert next(lines) == "starting"
+        assert next(lines) == "warning"
+        assert next(lines) == "auth_url\thttps://accounts.google.com/o?x=1"
+        lines.close()
+        assert closed == [True]
+        kwargs = client.containers.get.return_value.exec_run.call_args.kwargs
+        assert kwargs["stream"] is True and kwargs["demux"] is True
+
+    def test_not_running(self, client):
+        client.containers.get.return_value.status = "exited"
+        assert "not running" in list(gog._exec_lines(client, "openclaw-alice", ["gog"]))[0]
+
+
+class TestDescribeScopes:
+    def test_lists_scopes(self):
+        url = (
+            "https://accounts.google.com/o/oauth2/auth?client_id=x"
+            "&scope=email+https%3A%2F%2Fwww.googleapis.com%2Fauth%2Fgmail.modify&state=y"
+        )
+        text = gog._describe_scopes(url)
+        assert "Requested scopes (2)" in text
+        assert "email (identity scope)" in text
+        assert "https://www.googleapis.com/auth/gmail.modify[/dim]" in text
+
+    def test_no_scope(self):
+        assert "No scope parameter" in gog._describe_scopes("https://example.com/?client_id=x")
+
+
+class TestStartAndWait:
+    def test_returns_on_start_event(self, client):
+        container = MagicMock(id="abc")
+        events = MagicMock()
+        events.__iter__.return_value = iter([{"Action": "create"}, {"Action": "start"}, {"Action": "die"}])
+        client.events.return_value = events
+
+        gog._start_and_wait(client, container)
+
+        container.start.assert_called_once()
+        container.reload.assert_called_once()
+        events.close.assert_called_once()
+        kwargs = client.events.call_args.kwargs
+        assert kwargs["filters"]["container"] == "abc"
+        assert kwargs["until"] > kwargs["since"]
+
+    def test_closes_stream_when_start_fails(self, client):
+        container = MagicMock(id="abc")
+        container.start.side_effect = docker.errors.APIError("boom")
+        events = client.events.return_value
+
+        with pytest.raises(docker.errors.APIError):
+            gog._start_and_wait(client, container)
+        events.close.assert_called_once()
+
+
+class TestListsAccount:
+    def test_case_insensitive(self):
+        output = "Alice@Example.com\tgmail\tfile\n"
+        assert gog._lists_account(output, "alice@example.com")
+
+    def test_email_is_literal(self):
+        assert not gog._lists_account("aliceXexample.com\n", "alice.example.com")
+        assert not gog._lists_account("bob@example.com\n", "alice@example.com")
+
+
+class TestAuthAddCmd:
+    def test_step1(self):
+        assert gog._auth_add_cmd("a@b.c", "gmail,calendar", 1, readonly=False) == [
+            "gog", "auth", "add", "a@b.c", "--services", "gmail,calendar", "--remote", "--step=1",
+        ]
+
+    def test_step2_readonly(self):
+        cmd = gog._auth_add_cmd("a@b.c", "gmail", 2, "--auth-url=http://localhost/?code=x", readonly=True)
+        assert cmd[-3:] == ["--step=2", "--auth-url=http://localhost/?code=x", "--readonly"]
@@ -0,0 +1,31 @@
+"""Tests for the instance lifecycle commands."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from clawctl.cli import app
+
+
+class TestStartStopAll:
+    def test_parallel_failures_reported_per_user(self):
+        errors = []
+        for name in ("alice", "bob"):
+            error = RuntimeError("boom")
+            error.add_note(f"while handling user '{name}'")
+            errors.append(error)
+
+        docker = MagicMock()
+        docker.stop_all.side_effect = ExceptionGroup("2 of 2 containers failed", errors)
+        with (
+            patch("clawlib.core.config.load_config_or_exit"),
+            patch("clawlib.core.docker_manager.DockerManager", return_value=docker),
+        ):
+            result = CliRunner().invoke(app, ["instance", "stop-all"])
+
+        assert result.exit_code == 1
+        assert "Error while handling user 'alice': boom" in result.output
+        assert "Error while handling user 'bob': boom" in result.output
+        assert "Traceback" not in result.output
@@ -0,0 +1,18 @@
+"""Tests for user command helpers."""
+
+from __future__ import annotations
+
+import getpass
+
+from clawctl.commands import user
+
+
+class TestPromptSecrets:
+    def test_existing_secrets_need_confirmation(self, monkeypatch):
+        prompts = []
+        monkeypatch.setattr(getpass, "getpass", lambda prompt: prompts.append(prompt) or " v ")
+        monkeypatch.setattr(user.typer, "confirm", lambda *a, **kw: False)
+
+        required = [("api_key", "API key"), ("slack_bot", "Slack bot token")]
+        assert user._prompt_secrets(required, {"slack_bot"}) == {"api_key": "v"}
+        assert len(prompts) == 1
@@ -38,6 +38,18 @@ class TestPaths:
         assert paths.build_root == tmp_data_root
         assert paths.logs_dir == tmp_data_root / "logs"
 
+    def test_get_paths_shared_per_roots(self, sample_config: Config, tmp_path: Path):
+        from clawlib.core.paths import get_paths
+
+        paths = get_paths(sample_config)
+        assert paths.data_root == sample_config.clawctl.data_root.resolve()
+        assert get_paths(sample_config.model_copy()) is paths
+
+        other = sample_config.model_copy(
+            update={"clawctl": sample_config.clawctl.model_copy(update={"data_root": tmp_path})}
+        )
+        assert get_paths(other) is not paths
+
     def test_ensure_base_dirs(self, tmp_data_root: Path, tmp_build_root: Path):
         paths = Paths(tmp_data_root, tmp_build_root)
         paths.ensure_base_dirs()
@@ -55,6 +67,36 @@ class TestPaths:
         assert paths.user_config_dir("alice").is_dir()
         assert paths.user_secrets_dir("alice").is_dir()
 
+    def test_clawlib_user_paths_reused(self, tmp_data_root: Path, tmp_build_root: Path):
+        from clawlib.core.paths import Paths as LibPaths
+
+        paths = LibPaths(tmp_data_root, tmp_build_root)
+        assert paths.user_workspace_dir("alice") is paths.user_workspace_dir("alice")
+        assert paths.user_workspace_dir("alice") == paths.users_root / "alice" / "openclaw" / "workspace"
+        assert paths.user_secrets_dir("alice") == paths.secrets_root / "alice"
+
+    def test_clawlib_ensure_dirs_from_scratch(self, tmp_path: Path):
+        from clawlib.core.paths import Paths as LibPaths
+
+        paths = LibPaths(tmp_path / "new" / "data", tmp_path / "new" / "build")
+        for _ in range(2):
+            paths.ensure_base_dirs()
+            paths.ensure_user_dirs("alice")
+        assert paths.logs_dir.is_dir()
+        assert paths.shared_collections_root.is_dir()
+        assert paths.user_workspace_dir("alice").is_dir()
+        assert paths.user_files_dir("alice").is_dir()
+        assert paths.user_secrets_dir("alice").is_dir()
+
+    def test_clawlib_ensure_dirs_rejects_file(self, tmp_data_root: Path, tmp_build_root: Path):
+        from clawlib.core.paths import Paths as LibPaths
+
+        paths = LibPaths(tmp_data_root, tmp_build_root)
+        paths.logs_dir.parent.mkdir(parents=True, exist_ok=True)
+        paths.logs_dir.write_text("not a directory")
+        with pytest.raises(FileExistsError):
+            paths.ensure_base_dirs()
+
 
 class TestSecretsManager:
     def test_write_and_read_secret(self, tmp_data_root: Path, tmp_build_root: Path):
@@ -85,6 +127,98 @@ class TestSecretsManager:
         mgr.write_secret("alice", "slack_token", "v2")
         assert mgr.list_secrets("alice") == ["api_key", "slack_token"]
 
+    def test_read_secrets(self, tmp_data_root: Path, monkeypatch):
+        import builtins
+
+        from clawlib.core import secrets as lib_secrets
+        from clawlib.core.secrets import SecretsManager as LibSecretsManager
+
+        mgr = LibSecretsManager(Paths(tmp_data_root))
+        assert mgr.read_secrets("alice", ["api_key"]) == {}
+        mgr.write_secret("alice", "api_key", "v1\n")
+        mgr.write_secret("alice", "blank", "  ")
+        mgr.write_secret("alice", "locked", "v2")
+
+        def fake_open(file, *args, **kwargs):
+            if Path(file).name == "locked":
+                raise PermissionError(file)
+            return builtins.open(file, *args, **kwargs)
+
+        monkeypatch.setattr(lib_secrets, "open", fake_open, raising=False)
+        names = ["api_key", "blank", "locked", "missing"]
+        # Empty and unreadable secrets are left out, matching read_secret
+        assert mgr.read_secrets("alice", names) == {"api_key": "v1"}
+        assert [mgr.read_secret("alice", n) for n in names] == ["v1", None, None, None]
+
+    def test_clawlib_write_secret_overwrites_with_0644(self, tmp_data_root: Path):
+        from clawlib.core.secrets import SecretsManager as LibSecretsManager
+
+        mgr = LibSecretsManager(Paths(tmp_data_root))
+        path = mgr.write_secret("alice", "api_key", "a-much-longer-first-value")
+        path.chmod(0o600)
+        assert mgr.write_secret("alice", "api_key", "v2") == path
+        assert path.read_text() == "v2"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_clawlib_write_secret_handles_short_writes(self, tmp_data_root: Path, monkeypatch):
+        from clawlib.core.secrets import SecretsManager as LibSecretsManager
+
+        real_write = os.write
+        monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:3]))
+        mgr = LibSecretsManager(Paths(tmp_data_root))
+        path = mgr.write_secret("alice", "api_key", "sk-test-12345")
+        assert path.read_text() == "sk-test-12345"
+
+    def test_write_secrets(self, tmp_data_root: Path):
+        mgr = SecretsManager(Paths(tmp_data_root))
+        assert mgr.write_secrets("alice", {}) == []
+        paths = mgr.write_secrets("alice", {"a": "1", "b": "2"})
+        assert [p.name for p in paths] == ["a", "b"]
+        assert [mgr.read_secret("alice", n) for n in ("a", "b")] == ["1", "2"]
+        assert all(stat.S_IMODE(p.stat().st_mode) == 0o600 for p in paths)
+
+    def test_write_secret_if_absent(self, tmp_data_root: Path):
+        mgr = SecretsManager(Paths(tmp_data_root))
+        assert mgr.write_secret_if_absent("alice", "token", "first") is True
+        assert mgr.write_secret_if_absent("alice", "token", "second") is False
+        secret_file = mgr.paths.user_secrets_dir("alice") / "token"
+        assert secret_file.read_text() == "first"
+        assert stat.S_IMODE(secret_file.stat().st_mode) == 0o600
+        # The temporary file is cleaned up either way
+        assert mgr.list_secrets("alice") == ["token"]
+
+    def test_write_secret_if_absent_keeps_empty_file(self, tmp_data_root: Path):
+        mgr = SecretsManager(Paths(tmp_data_root))
+        secret_file = mgr.paths.user_secrets_dir("alice") / "token"
+        secret_file.parent.mkdir(parents=True)
+        secret_file.touch()
+        assert mgr.write_secret_if_absent("alice", "token", "value") is False
+        assert secret_file.read_text() == ""
+
+    def test_clawlib_read_secret_missing(self, tmp_data_root: Path):
+        from clawlib.core.secrets import SecretsManager as LibSecretsManager
+
+        mgr = LibSecretsManager(Paths(tmp_data_root))
+        assert mgr.read_secret("alice", "token") is None
+        (mgr.paths.user_secrets_dir("alice") / "token").mkdir(parents=True)
+        assert mgr.read_secret("alice", "token") is None
+        mgr.write_secret("alice", "key", "v1\n")
+        assert mgr.read_secret("alice", "key") == "v1"
+
+    def test_read_secrets_bulk(self, tmp_data_root: Path):
+        from clawlib.core.secrets import SecretsManager as LibSecretsManager
+
+        mgr = LibSecretsManager(Paths(tmp_data_root))
+        assert mgr.read_secrets_bulk(["alice"], "token") == {}
+        mgr.write_secret("alice", "token", "a1\n")
+        mgr.write_secret("bob", "token", " ")
+        mgr.write_secret("bob", "legacy_token", "b1")
+        mgr.write_secret("carol", "other", "c1")
+        assert mgr.read_secrets_bulk(["alice", "bob", "carol", "dave"], "token", "legacy_token") == {
+            "alice": "a1",
+            "bob": "b1",
+        }
+
     def test_remove_user_secrets(self, tmp_data_root: Path):
         paths = Paths(tmp_data_root)
         mgr = SecretsManager(paths)
@@ -163,6 +297,34 @@ class TestSecretsManager:
 
 
 class TestWorkspaceTemplate:
+    def test_clawlib_copy_template_many_files(self, tmp_path: Path):
+        from clawlib.core.user_manager import copy_template as lib_copy_template
+
+        template_dir = tmp_path / "template"
+        (template_dir / "sub").mkdir(parents=True)
+        for i in range(40):
+            (template_dir / ("sub" if i % 2 else ".") / f"f{i}.md").write_text(str(i))
+        dest_dir = tmp_path / "dest"
+
+        copied = lib_copy_template(template_dir, dest_dir)
+        assert len(copied) == 40
+        assert all((dest_dir / rel).read_text() == (template_dir / rel).read_text() for rel in copied)
+
+    def test_clawlib_copy_template_nested(self, tmp_path: Path):
+        from clawlib.core.user_manager import copy_template as lib_copy_template
+
+        template_dir = tmp_path / "template"
+        (template_dir / "a" / "b").mkdir(parents=True)
+        (template_dir / "a" / "b" / "deep.md").write_text("deep")
+        (template_dir / "top.md").write_text("top")
+        dest_dir = tmp_path / "dest"
+        dest_dir.mkdir()
+        (dest_dir / "top.md").write_text("mine")
+
+        assert lib_copy_template(template_dir, dest_dir) == [Path("a/b/deep.md")]
+        assert (dest_dir / "a" / "b" / "deep.md").read_text() == "deep"
+        assert (dest_dir / "top.md").read_text() == "mine"
+
     def test_copy_template_basic(self, tmp_path: Path):
         template_dir = tmp_path / "template"
         template_dir.mkdir()
@@ -244,6 +406,35 @@ class TestWorkspaceTemplate:
 
 
 class TestOpenClawConfig:
+    def test_tailscale_lookups_reused(self, sample_user: UserConfig, monkeypatch):
+        import subprocess
+
+        from clawlib.core import openclaw_config as lib_oc
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="100.64.0.1\n")
+
+        now = [1000.0]
+        monkeypatch.setattr(lib_oc.subprocess, "run", fake_run)
+        monkeypatch.setattr(lib_oc.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(lib_oc, "_tailscale_cache", {})
+
+        for _ in range(3):
+            config = generate_openclaw_config(sample_user, DefaultsConfig(), gateway_token="t")
+        assert "https://100.64.0.1" in config["gateway"]["controlUi"]["allowedOrigins"]
+        assert len(calls) == 2
+
+        # Entries expire a full TTL after they were fetched
+        now[0] += lib_oc._TAILSCALE_TTL - 1
+        assert lib_oc.get_tailscale_ip() == "100.64.0.1"
+        assert len(calls) == 2
+        now[0] += 1
+        lib_oc.get_tailscale_ip()
+        assert len(calls) == 3
+
     def test_generate_basic_config(self, sample_user: UserConfig):
         config = generate_openclaw_config(sample_user, DefaultsConfig())
         assert config["gateway"]["port"] == 18789
@@ -368,3 +559,82 @@ class TestUserManagerRestart:
         if user.channels.discord.enabled:
             assert "discord" in regenerated_config["channels"]
             assert regenerated_config["channels"]["discord"]["enabled"] is True
+
+
+class TestRestartAll:
+    def test_restarts_existing_users_in_config_order(self, sample_config: Config):
+        from unittest.mock import MagicMock, patch
+
+        from clawlib.core.user_manager import UserManager as LibUserManager
+
+        user = sample_config.users[0]
+        names = ["a", "missing", "b", "broken"]
+        config = sample_config.model_copy(
+            update={"users": [user.model_copy(update={"name": n}) for n in names]}
+        )
+        with patch("clawlib.core.user_manager.DockerManager") as mock_docker:
+            mock_docker.return_value.container_exists.side_effect = lambda n: n != "missing"
+            manager = LibUserManager(config)
+
+        def restart(u):
+            if u.name == "broken":
+                raise RuntimeError("boom")
+            return True
+
+        with patch.object(manager, "_restart", side_effect=restart) as mock_restart:
+            assert manager.restart_all() == ["a", "b"]
+        assert mock_restart.call_count == 3
+
+
+class TestLibUserManager:
+    def test_gateway_token_generated_once(self, sample_config: Config):
+        from unittest.mock import patch
+
+        from clawlib.core.user_manager import UserManager as LibUserManager
+
+        with patch("clawlib.core.user_manager.DockerManager"):
+            manager = LibUserManager(sample_config)
+        token = manager._ensure_gateway_token("testuser")
+        assert token
+        assert manager._ensure_gateway_token("testuser") == token
+
+    @pytest.mark.parametrize("content", ["", " \n"])
+    def test_empty_gateway_token_is_not_used(self, sample_config: Config, content: str):
+        from unittest.mock import patch
+
+        from clawlib.core.user_manager import GATEWAY_TOKEN_SECRET_NAME, UserManager as LibUserManager
+
+        with patch("clawlib.core.user_manager.DockerManager"):
+            manager = LibUserManager(sample_config)
+        token_file = manager.paths.user_secrets_dir("testuser") / GATEWAY_TOKEN_SECRET_NAME
+        token_file.parent.mkdir(parents=True)
+        token_file.write_text(content)
+        with pytest.raises(ValueError, match="empty"):
+            manager._ensure_gateway_token("testuser")
+        assert token_file.read_text() == content
+
+    def test_uses_clawctl_collaborators(self):
+        """Provisioning keeps the clawctl.core managers; clawlib's mount and write differently."""
+        from clawctl.core import docker_manager, paths, secrets
+        from clawlib.core import user_manager as lib_user_manager
+
+        assert lib_user_manager.DockerManager is docker_manager.DockerManager
+        assert lib_user_manager.SecretsManager is secrets.SecretsManager
+        assert lib_user_manager.Paths is paths.Paths
+
+    def test_image_checked_once_per_manager(self, sample_config: Config):
+        from unittest.mock import patch
+
+        from clawlib.core.user_manager import UserManager as LibUserManager
+
+        user = sample_config.users[0]
+        with patch("clawlib.core.user_manager.DockerManager") as mock_docker:
+            docker = mock_docker.return_value
+            docker.image_exists.return_value = False
+            docker.run_doctor_fix.return_value = True
+            manager = LibUserManager(sample_config)
+            for name in ("a", "b"):
+                manager.provision_user(user.model_copy(update={"name": name}), {})
+        docker.image_exists.assert_called_once_with()
+        docker.build_image.assert_called_once_with()
+        assert docker.create_container.call_count == 2